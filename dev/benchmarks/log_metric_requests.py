@@ -0,0 +1,132 @@
+"""
+Benchmark of ``log_metric`` calls made against a local tracking server, comparing connections
+reused across requests with a new connection opened for every request.
+
+By default, the benchmark launches ``mlflow server`` with a temporary file store. Its gunicorn
+workers use threads, since gunicorn's default sync workers close the connection after every
+response. Pass ``--tracking-uri`` to run the benchmark against a server that is already running
+instead.
+
+Usage: python dev/benchmarks/log_metric_requests.py [--calls 10000] [--tracking-uri URI]
+"""
+
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from mlflow.tracking import MlflowClient
+from mlflow.utils import rest_utils
+from mlflow.utils.file_utils import path_to_local_file_uri
+
+LOCALHOST = "127.0.0.1"
+
+
+def get_free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind((LOCALHOST, 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def await_server(port, timeout=60):
+    start_time = time.time()
+    while time.time() - start_time < timeout:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.settimeout(2)
+        connected = sock.connect_ex((LOCALHOST, port)) == 0
+        sock.close()
+        if connected:
+            return
+        time.sleep(0.5)
+    raise Exception("Failed to connect on %s:%s after %s seconds" % (LOCALHOST, port, timeout))
+
+
+def launch_server(store_dir):
+    port = get_free_port()
+    store_uri = path_to_local_file_uri(store_dir)
+    cmd = [
+        sys.executable,
+        "-m",
+        "mlflow.cli",
+        "server",
+        "--backend-store-uri",
+        store_uri,
+        "--default-artifact-root",
+        store_uri,
+        "--host",
+        LOCALHOST,
+        "--port",
+        str(port),
+        "--gunicorn-opts",
+        "--worker-class gthread --threads 4",
+    ]
+    process = subprocess.Popen(cmd)
+    await_server(port)
+    return "http://%s:%d" % (LOCALHOST, port), process
+
+
+def time_log_metric_calls(client, num_calls, keep_alive):
+    os.environ[rest_utils.MLFLOW_HTTP_KEEP_ALIVE] = "true" if keep_alive else "false"
+    # Sessions read their configuration when they are created
+    rest_utils._reset_sessions()
+    run_id = client.create_run("0").info.run_id
+    latencies = []
+    start = time.perf_counter()
+    for step in range(num_calls):
+        call_start = time.perf_counter()
+        client.log_metric(run_id, "m", step * 0.5, step=step)
+        latencies.append(time.perf_counter() - call_start)
+    total_time = time.perf_counter() - start
+    client.set_terminated(run_id)
+    latencies.sort()
+    return total_time, latencies[len(latencies) // 2], latencies[int(len(latencies) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=10000, help="Number of log_metric calls")
+    parser.add_argument("--tracking-uri", help="URI of a running tracking server")
+    args = parser.parse_args()
+
+    store_dir = None
+    process = None
+    tracking_uri = args.tracking_uri
+    if tracking_uri is None:
+        store_dir = tempfile.mkdtemp()
+        tracking_uri, process = launch_server(store_dir)
+    try:
+        client = MlflowClient(tracking_uri)
+        # Warm up the server, so that the first mode measured is not penalized
+        time_log_metric_calls(client, min(args.calls, 100), keep_alive=True)
+        print(
+            "{:<28} {:>10} {:>10} {:>12} {:>12}".format(
+                "mode", "total s", "calls/s", "p50 ms", "p99 ms"
+            )
+        )
+        for mode, keep_alive in [
+            ("new connection per request", False),
+            ("pooled connections", True),
+        ]:
+            total_time, p50, p99 = time_log_metric_calls(client, args.calls, keep_alive)
+            print(
+                "{:<28} {:>10.2f} {:>10.0f} {:>12.2f} {:>12.2f}".format(
+                    mode, total_time, args.calls / total_time, p50 * 1000, p99 * 1000
+                )
+            )
+    finally:
+        os.environ.pop(rest_utils.MLFLOW_HTTP_KEEP_ALIVE, None)
+        if process is not None:
+            process.terminate()
+            process.wait()
+        if store_dir is not None:
+            shutil.rmtree(store_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark of the encoding and decoding of ``search_runs`` responses and ``log_batch`` requests of
+the tracking REST API, comparing JSON with the binary protobuf format.
+
+Usage: python dev/benchmarks/rest_payloads.py [--runs 1000] [--batch-size 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import timeit
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.protos.service_pb2 import LogBatch, SearchRuns
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
+
+
+def make_search_runs_response(num_runs, num_entries=20):
+    response = SearchRuns.Response(next_page_token="token")
+    for i in range(num_runs):
+        run_id = "%032x" % i
+        info = RunInfo(
+            run_uuid=run_id,
+            run_id=run_id,
+            experiment_id="0",
+            user_id="user",
+            status="FINISHED",
+            start_time=1600000000000,
+            end_time=1600000001000,
+            lifecycle_stage="active",
+            artifact_uri="/tmp/mlruns/0/%s/artifacts" % run_id,
+        )
+        data = RunData(
+            metrics=[Metric("m%d" % j, j * 0.5, 1600000000000, j) for j in range(num_entries)],
+            params=[Param("p%d" % j, "value-%d" % j) for j in range(num_entries)],
+            tags=[RunTag("t%d" % j, "value-%d" % j) for j in range(num_entries)],
+        )
+        response.runs.add().MergeFrom(Run(info, data).to_proto())
+    return response
+
+
+def make_log_batch_request(batch_size):
+    metrics = [
+        Metric("m%d" % (i % 10), i * 0.5, 1600000000000 + i, i).to_proto()
+        for i in range(batch_size)
+    ]
+    return LogBatch(run_id="%032x" % 0, metrics=metrics)
+
+
+def measure(message, repeat):
+    """
+    Return the best times of encoding and decoding ``message`` over ``repeat`` repetitions, and
+    its size, in JSON and in the binary protobuf format.
+    """
+    message_class = type(message)
+    json_data = message_to_json(message)
+    proto_data = message.SerializeToString()
+    parsed = message_class()
+    parse_dict(json.loads(json_data), parsed)
+    assert parsed == message
+    assert message_class.FromString(proto_data) == message
+    return [
+        (
+            "json",
+            min(timeit.repeat(lambda: message_to_json(message), number=1, repeat=repeat)),
+            min(
+                timeit.repeat(
+                    lambda: parse_dict(json.loads(json_data), message_class()),
+                    number=1,
+                    repeat=repeat,
+                )
+            ),
+            len(json_data.encode("utf-8")),
+        ),
+        (
+            "protobuf",
+            min(timeit.repeat(message.SerializeToString, number=1, repeat=repeat)),
+            min(
+                timeit.repeat(lambda: message_class.FromString(proto_data), number=1, repeat=repeat)
+            ),
+            len(proto_data),
+        ),
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=1000, help="Runs of the search_runs response")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Metrics of the log_batch request"
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Repetitions of each measurement")
+    args = parser.parse_args()
+
+    cases = [
+        ("search_runs response", make_search_runs_response(args.runs)),
+        ("log_batch request", make_log_batch_request(args.batch_size)),
+    ]
+    print(
+        "{:<22} {:<10} {:>12} {:>12} {:>12}".format(
+            "payload", "format", "encode ms", "decode ms", "size KiB"
+        )
+    )
+    for name, message in cases:
+        for format_name, encode_time, decode_time, size in measure(message, args.repeat):
+            print(
+                "{:<22} {:<10} {:>12.2f} {:>12.2f} {:>12.1f}".format(
+                    name, format_name, encode_time * 1000, decode_time * 1000, size / 1024
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
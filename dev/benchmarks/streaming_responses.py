@@ -0,0 +1,129 @@
+"""
+Benchmark of the memory and latency of the responses of the tracking server's endpoints that list
+many entities, comparing streamed responses with responses serialized into a single string.
+
+Usage: python dev/benchmarks/streaming_responses.py [--metrics 50000] [--runs 1000]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from flask import Flask
+
+from mlflow.entities import Metric, Param, Run, RunData, RunInfo, RunTag
+from mlflow.protos.service_pb2 import GetMetricHistory, SearchRuns
+from mlflow.server.handlers import _wrap_response, _wrap_streaming_response
+
+
+def make_metrics(num_metrics):
+    return [
+        Metric("loss", 1.0 / (step + 1), 1600000000000 + step, step) for step in range(num_metrics)
+    ]
+
+
+def make_runs(num_runs, num_entries=20):
+    runs = []
+    for i in range(num_runs):
+        run_id = "%032x" % i
+        info = RunInfo(
+            run_uuid=run_id,
+            run_id=run_id,
+            experiment_id="0",
+            user_id="user",
+            status="FINISHED",
+            start_time=1600000000000,
+            end_time=1600000001000,
+            lifecycle_stage="active",
+            artifact_uri="/tmp/mlruns/0/%s/artifacts" % run_id,
+        )
+        data = RunData(
+            metrics=[Metric("m%d" % j, j * 0.5, 1600000000000, j) for j in range(num_entries)],
+            params=[Param("p%d" % j, "value-%d" % j) for j in range(num_entries)],
+            tags=[RunTag("t%d" % j, "value-%d" % j) for j in range(num_entries)],
+        )
+        runs.append(Run(info, data))
+    return runs
+
+
+def serialize_buffered(response_message, field_name, elements):
+    getattr(response_message, field_name).extend(elements)
+    return _wrap_response(response_message)
+
+
+def serialize_streamed(response_message, field_name, elements):
+    return _wrap_streaming_response(response_message, field_name, elements)
+
+
+def read_response(serialize, response_class, field_name, entities):
+    """
+    Serialize the response listing ``entities`` with ``serialize`` and read its body, returning
+    the time until the first chunk of the body was available, the total time and the body size.
+    """
+    start = time.perf_counter()
+    response = serialize(response_class(), field_name, (entity.to_proto() for entity in entities))
+    chunks = response.iter_encoded()
+    size = len(next(chunks))
+    first_chunk_time = time.perf_counter() - start
+    for chunk in chunks:
+        size += len(chunk)
+    return first_chunk_time, time.perf_counter() - start, size
+
+
+def measure(serialize, response_class, field_name, entities, accept):
+    """
+    Return the latency of the first chunk, the total latency, the peak memory allocated and the
+    size of the response listing ``entities``. Memory is measured in a separate pass, since
+    tracing allocations slows down serialization.
+    """
+    app = Flask(__name__)
+    with app.test_request_context(headers={"Accept": accept}):
+        first_chunk_time, total_time, size = read_response(
+            serialize, response_class, field_name, entities
+        )
+        tracemalloc.start()
+        read_response(serialize, response_class, field_name, entities)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return first_chunk_time, total_time, peak, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--metrics", type=int, default=50000, help="Points of the metric history")
+    parser.add_argument("--runs", type=int, default=1000, help="Runs of the search results")
+    args = parser.parse_args()
+
+    cases = [
+        ("get_metric_history", GetMetricHistory.Response, "metrics", make_metrics(args.metrics)),
+        ("search_runs", SearchRuns.Response, "runs", make_runs(args.runs)),
+    ]
+    print(
+        "{:<20} {:<24} {:<10} {:>14} {:>12} {:>13} {:>12}".format(
+            "endpoint", "format", "mode", "first byte ms", "total ms", "peak MiB", "body MiB"
+        )
+    )
+    for endpoint, response_class, field_name, entities in cases:
+        for accept in ["application/json", "application/x-protobuf"]:
+            for mode, serialize in [
+                ("buffered", serialize_buffered),
+                ("streamed", serialize_streamed),
+            ]:
+                first_chunk_time, total_time, peak, size = measure(
+                    serialize, response_class, field_name, entities, accept
+                )
+                print(
+                    "{:<20} {:<24} {:<10} {:>14.1f} {:>12.1f} {:>13.2f} {:>12.2f}".format(
+                        endpoint,
+                        accept,
+                        mode,
+                        first_chunk_time * 1000,
+                        total_time * 1000,
+                        peak / 2 ** 20,
+                        size / 2 ** 20,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,11 +20,13 @@ You can also use syntax like this:
 
 which automatically terminates the run at the end of the block.
 
-The fluent tracking API is not currently threadsafe. Any concurrent callers to the tracking API must
-implement mutual exclusion manually.
+The fluent tracking API is threadsafe: the stack of active runs is local to each thread, and to
+each asyncio task on Python 3.7 and later, so concurrent threads and tasks can each log to their
+own run.
 
 For a lower level API, see the :py:mod:`mlflow.tracking` module.
 """
+import importlib
 import sys
 
 from mlflow.version import VERSION as __version__  # pylint: disable=unused-import
@@ -42,25 +44,32 @@ warnings.filterwarnings("ignore", message="numpy.ufunc size changed")  # noqa: E
 # log a deprecated warning only once per function per module
 warnings.filterwarnings("module", category=DeprecationWarning)
 
-import mlflow.projects as projects  # noqa: E402
 import mlflow.tracking as tracking  # noqa: E402
 
-# model flavors
-import mlflow.fastai as fastai  # noqa: E402
-import mlflow.gluon as gluon  # noqa: E402
-import mlflow.h2o as h2o  # noqa: E402
-import mlflow.keras as keras  # noqa: E402
-import mlflow.lightgbm as lightgbm  # noqa: E402
-import mlflow.mleap as mleap  # noqa: E402
-import mlflow.onnx as onnx  # noqa: E402
-import mlflow.pyfunc as pyfunc  # noqa: E402
-import mlflow.pytorch as pytorch  # noqa: E402
-import mlflow.sklearn as sklearn  # noqa: E402
-import mlflow.spacy as spacy  # noqa: E402
-import mlflow.spark as spark  # noqa: E402
-import mlflow.tensorflow as tensorflow  # noqa: E402
-import mlflow.xgboost as xgboost  # noqa: E402
-
+# Submodules exposed as attributes of the ``mlflow`` module. The model flavors, ``mlflow.models``
+# and ``mlflow.projects`` import many modules (and possibly their ML framework) that most users of
+# the tracking API never need, so on Python 3.7+ they are only imported on first attribute access
+# (PEP 562), which keeps ``import mlflow`` fast.
+_LAZY_SUBMODULES = [
+    "models",
+    "projects",
+    "types",
+    # model flavors
+    "fastai",
+    "gluon",
+    "h2o",
+    "keras",
+    "lightgbm",
+    "mleap",
+    "onnx",
+    "pyfunc",
+    "pytorch",
+    "sklearn",
+    "spacy",
+    "spark",
+    "tensorflow",
+    "xgboost",
+]
 
 _configure_mlflow_loggers(root_module_name=__name__)
 
@@ -86,6 +95,7 @@ active_run = mlflow.tracking.fluent.active_run
 get_run = mlflow.tracking.fluent.get_run
 start_run = mlflow.tracking.fluent.start_run
 end_run = mlflow.tracking.fluent.end_run
+flush = mlflow.tracking.fluent.flush
 search_runs = mlflow.tracking.fluent.search_runs
 list_run_infos = mlflow.tracking.fluent.list_run_infos
 get_artifact_uri = mlflow.tracking.fluent.get_artifact_uri
@@ -105,7 +115,30 @@ delete_run = mlflow.tracking.fluent.delete_run
 register_model = mlflow.tracking._model_registry.fluent.register_model
 
 
-run = projects.run
+def _import_lazy_attribute(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+    if name == "run":
+        return _import_lazy_attribute("projects").run
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+if sys.version_info >= (3, 7):
+
+    def __getattr__(name):
+        # Cache the attribute so that ``__getattr__`` is only called on first access
+        value = _import_lazy_attribute(name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_LAZY_SUBMODULES) | {"run"})
+
+
+else:
+    for _name in _LAZY_SUBMODULES + ["run"]:
+        globals()[_name] = _import_lazy_attribute(_name)
+    del _name
 
 __all__ = [
     "ActiveRun",
@@ -121,6 +154,7 @@ __all__ = [
     "active_run",
     "start_run",
     "end_run",
+    "flush",
     "search_runs",
     "get_artifact_uri",
     "get_tracking_uri",
@@ -9,10 +9,10 @@ from py4j.java_gateway import CallbackServerParameters
 from pyspark import SparkContext
 from mlflow.utils._spark_utils import _get_active_spark_session
 
-import mlflow
 from mlflow.exceptions import MlflowException
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking.context.abstract_context import RunContextProvider
+from mlflow.tracking.fluent import _get_latest_active_run
 
 _JAVA_PACKAGE = "org.mlflow.spark.autologging"
 _SPARK_TABLE_INFO_TAG_NAME = "sparkDatasourceInfo"
@@ -195,11 +195,12 @@ class PythonSubscriber(object):
         Method called by Scala SparkListener to propagate datasource read events to the current
         Python process
         """
-        # If there's an active run, simply set the tag on it
-        # Note that there's a TOCTOU race condition here - active_run() here can actually throw
-        # if the main thread happens to end the run & pop from the active run stack after we check
-        # the stack size but before we peek
-        active_run = mlflow.active_run()
+        # If there's an active run, simply set the tag on it. This method is called on a thread of
+        # the Py4J callback server, so look up the run among the active runs of all threads rather
+        # than with ``mlflow.active_run()``, which only returns the run started by the calling
+        # thread. Note that the run may end between the lookup and the tag being set, which is
+        # harmless since tags can be set on terminated runs
+        active_run = _get_latest_active_run()
         if active_run:
             _set_run_tag_async(active_run.info.run_id, path, version, data_format)
         else:
@@ -1,3 +1,4 @@
+import importlib
 import json
 import os
 import sys
@@ -6,19 +7,7 @@ import logging
 import click
 from click import UsageError
 
-import mlflow.azureml.cli
-import mlflow.db
-import mlflow.experiments
-import mlflow.models.cli
-import mlflow.deployments.cli
-import mlflow.projects as projects
-import mlflow.runs
-import mlflow.sagemaker.cli
-import mlflow.store.artifact.cli
-import mlflow.store.db.utils
 from mlflow import tracking
-from mlflow.server import _run_server
-from mlflow.server.handlers import initialize_backend_stores
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
 from mlflow.tracking import _get_store
@@ -32,8 +21,66 @@ from mlflow.exceptions import MlflowException
 
 _logger = logging.getLogger(__name__)
 
+# Command groups defined in other modules, mapped to the ``module:attribute`` path of the group and
+# to the first sentence of its help, which is shown by ``mlflow --help`` without importing it
+_LAZY_SUBCOMMANDS = {
+    "artifacts": (
+        "mlflow.store.artifact.cli:commands",
+        "Upload, list, and download artifacts from an MLflow artifact repository.",
+    ),
+    "azureml": ("mlflow.azureml.cli:commands", "Serve models on Azure ML."),
+    "db": ("mlflow.db:commands", "Commands for managing an MLflow tracking database."),
+    "deployments": ("mlflow.deployments.cli:commands", "Deploy MLflow models to custom targets."),
+    "experiments": ("mlflow.experiments:commands", "Manage experiments."),
+    "models": ("mlflow.models.cli:commands", "Deploy MLflow models locally."),
+    "runs": ("mlflow.runs:commands", "Manage runs."),
+    "sagemaker": ("mlflow.sagemaker.cli:commands", "Serve models on SageMaker."),
+}
+
+
+class _LazyGroup(click.Group):
+    """
+    Click group that imports the modules of its lazy subcommands only when they are invoked, so
+    that running a command does not pay for importing the modules (and the flavor, server and
+    cloud SDK dependencies) of all the other commands.
+
+    :param lazy_subcommands: Dict mapping subcommand names to ``(import_path, short_help)`` tuples,
+                             where ``import_path`` is of the form ``module:attribute``.
+    """
 
-@click.group()
+    def __init__(self, *args, **kwargs):
+        self.lazy_subcommands = kwargs.pop("lazy_subcommands", {})
+        super(_LazyGroup, self).__init__(*args, **kwargs)
+
+    def list_commands(self, ctx):
+        return sorted(set(super(_LazyGroup, self).list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name][0].split(":")
+            command = getattr(importlib.import_module(module_name), attribute)
+            self.add_command(command, cmd_name)
+        return super(_LazyGroup, self).get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx, formatter):
+        commands = []
+        for cmd_name in self.list_commands(ctx):
+            if cmd_name in self.commands:
+                command = self.commands[cmd_name]
+            else:
+                # Only used to format the short help of the command without importing it
+                command = click.Command(cmd_name, help=self.lazy_subcommands[cmd_name][1])
+            if not command.hidden:
+                commands.append((cmd_name, command))
+        if commands:
+            # Same layout as ``click.MultiCommand.format_commands``
+            limit = formatter.width - 6 - max(len(cmd_name) for cmd_name, _ in commands)
+            rows = [(cmd_name, command.get_short_help_str(limit)) for cmd_name, command in commands]
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+
+@click.group(cls=_LazyGroup, lazy_subcommands=_LAZY_SUBCOMMANDS)
 @click.version_option()
 def cli():
     pass
@@ -170,6 +217,9 @@ def run(
         if backend_config is None:
             eprint("Specify 'backend_config' when using kubernetes mode.")
             sys.exit(1)
+    # Imported here because importing the projects module (and Docker) is slow
+    import mlflow.projects as projects
+
     try:
         projects.run(
             uri,
@@ -272,6 +322,10 @@ def ui(backend_store_uri, default_artifact_root, port, host):
         else:
             default_artifact_root = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
 
+    # Imported here because importing the server (and Flask) is slow
+    from mlflow.server import _run_server
+    from mlflow.server.handlers import initialize_backend_stores
+
     try:
         initialize_backend_stores(backend_store_uri, default_artifact_root)
     except Exception as e:  # pylint: disable=broad-except
@@ -345,6 +399,14 @@ def _validate_static_prefix(ctx, param, value):  # pylint: disable=unused-argume
     "doesn't exist, it will be created. "
     "Activate prometheus exporter to expose metrics on /metrics endpoint.",
 )
+@click.option(
+    "--compression-min-size",
+    type=int,
+    default=None,
+    help="Minimum size in bytes of the responses compressed with gzip or deflate, for clients "
+    "that accept these encodings. Set to a negative value to disable response compression. "
+    "Default: 1024.",
+)
 def server(
     backend_store_uri,
     default_artifact_root,
@@ -355,6 +417,7 @@ def server(
     gunicorn_opts,
     waitress_opts,
     expose_prometheus,
+    compression_min_size,
 ):
     """
     Run the MLflow tracking server.
@@ -381,6 +444,10 @@ def server(
             )
             sys.exit(1)
 
+    # Imported here because importing the server (and Flask) is slow
+    from mlflow.server import _run_server
+    from mlflow.server.handlers import initialize_backend_stores
+
     try:
         initialize_backend_stores(backend_store_uri, default_artifact_root)
     except Exception as e:  # pylint: disable=broad-except
@@ -399,6 +466,7 @@ def server(
             gunicorn_opts,
             waitress_opts,
             expose_prometheus,
+            compression_min_size,
         )
     except ShellCommandException:
         eprint("Running the mlflow server failed. Please see the logs above for details.")
@@ -452,14 +520,5 @@ def gc(backend_store_uri, run_ids):
         print("Run with ID %s has been permanently deleted." % str(run_id))
 
 
-cli.add_command(mlflow.models.cli.commands)
-cli.add_command(mlflow.deployments.cli.commands)
-cli.add_command(mlflow.sagemaker.cli.commands)
-cli.add_command(mlflow.experiments.commands)
-cli.add_command(mlflow.store.artifact.cli.commands)
-cli.add_command(mlflow.azureml.cli.commands)
-cli.add_command(mlflow.runs.commands)
-cli.add_command(mlflow.db.commands)
-
 if __name__ == "__main__":
     cli()
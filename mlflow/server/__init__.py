@@ -6,6 +6,7 @@ import textwrap
 from flask import Flask, send_from_directory, Response
 
 from mlflow.server import handlers
+from mlflow.server.compression import activate_compression, DEFAULT_COMPRESSION_MIN_SIZE
 from mlflow.server.handlers import (
     get_artifact_handler,
     STATIC_PREFIX_ENV_VAR,
@@ -19,6 +20,7 @@ from mlflow.utils.process import exec_cmd
 BACKEND_STORE_URI_ENV_VAR = "_MLFLOW_SERVER_FILE_STORE"
 ARTIFACT_ROOT_ENV_VAR = "_MLFLOW_SERVER_ARTIFACT_ROOT"
 PROMETHEUS_EXPORTER_ENV_VAR = "prometheus_multiproc_dir"
+COMPRESSION_MIN_SIZE_ENV_VAR = "_MLFLOW_SERVER_COMPRESSION_MIN_SIZE"
 
 REL_STATIC_DIR = "js/build"
 
@@ -37,6 +39,10 @@ if os.getenv(PROMETHEUS_EXPORTER_ENV_VAR):
         os.makedirs(prometheus_metrics_path)
     activate_prometheus_exporter(app)
 
+activate_compression(
+    app, int(os.getenv(COMPRESSION_MIN_SIZE_ENV_VAR) or DEFAULT_COMPRESSION_MIN_SIZE)
+)
+
 
 # Provide a health check endpoint to ensure the application is responsive
 @app.route("/health")
@@ -112,11 +118,14 @@ def _run_server(
     gunicorn_opts=None,
     waitress_opts=None,
     expose_prometheus=None,
+    compression_min_size=None,
 ):
     """
     Run the MLflow server, wrapping it in gunicorn or waitress on windows
     :param static_prefix: If set, the index.html asset will be served from the path static_prefix.
                           If left None, the index.html asset will be served from the root path.
+    :param compression_min_size: If set, minimum size in bytes of the responses compressed with
+                                 gzip or deflate. Responses are not compressed if negative.
     :return: None
     """
     env_map = {}
@@ -130,6 +139,9 @@ def _run_server(
     if expose_prometheus:
         env_map[PROMETHEUS_EXPORTER_ENV_VAR] = expose_prometheus
 
+    if compression_min_size is not None:
+        env_map[COMPRESSION_MIN_SIZE_ENV_VAR] = str(compression_min_size)
+
     # TODO: eventually may want waitress on non-win32
     if sys.platform == "win32":
         full_command = _build_waitress_command(waitress_opts, host, port)
@@ -0,0 +1,139 @@
+import io
+import itertools
+import zlib
+
+from flask import request
+from werkzeug.wrappers import Response
+from werkzeug.wsgi import get_input_stream
+
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils.rest_utils import CONTENT_ENCODINGS_HEADER, CONTENT_TYPES_HEADER
+
+# Content encodings of the request and response bodies supported by the server
+CONTENT_ENCODINGS = ["gzip", "deflate"]
+# Responses smaller than this many bytes are not compressed by default
+DEFAULT_COMPRESSION_MIN_SIZE = 1024
+# Maximum size in bytes of decompressed request bodies, to protect the server against small
+# request bodies that decompress into huge ones
+MAX_DECOMPRESSED_REQUEST_SIZE = 64 * 1024 * 1024
+
+_WBITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def activate_compression(app, min_size=DEFAULT_COMPRESSION_MIN_SIZE):
+    """
+    Decompress the request bodies sent with a ``gzip`` or ``deflate`` ``Content-Encoding``, and
+    compress the responses of at least ``min_size`` bytes for the clients that accept it.
+
+    :param app: Flask app of the tracking server.
+    :param min_size: Minimum size in bytes of the compressed responses. Responses are not
+                     compressed if negative.
+    """
+    app.wsgi_app = _RequestDecompressionMiddleware(app.wsgi_app)
+
+    @app.after_request
+    def compress_response(response):  # pylint: disable=unused-variable
+        # Advertise the supported encodings in API responses, so that clients can compress their
+        # request bodies
+        if CONTENT_TYPES_HEADER in response.headers:
+            response.headers[CONTENT_ENCODINGS_HEADER] = ", ".join(CONTENT_ENCODINGS)
+        if min_size >= 0:
+            _compress_response(response, min_size)
+        return response
+
+    return app
+
+
+class _RequestDecompressionMiddleware(object):
+    """WSGI middleware replacing compressed request bodies with their decompressed content."""
+
+    def __init__(self, wsgi_app):
+        self.wsgi_app = wsgi_app
+
+    def __call__(self, environ, start_response):
+        encoding = environ.get("HTTP_CONTENT_ENCODING", "identity").strip().lower()
+        if encoding == "identity":
+            return self.wsgi_app(environ, start_response)
+        try:
+            body = _decompress(get_input_stream(environ).read(), encoding)
+        except MlflowException as e:
+            response = Response(e.serialize_as_json(), mimetype="application/json")
+            response.status_code = e.get_http_status_code()
+            return response(environ, start_response)
+        environ = dict(environ)
+        del environ["HTTP_CONTENT_ENCODING"]
+        environ["CONTENT_LENGTH"] = str(len(body))
+        environ["wsgi.input"] = io.BytesIO(body)
+        return self.wsgi_app(environ, start_response)
+
+
+def _decompress(body, encoding):
+    if encoding not in CONTENT_ENCODINGS:
+        raise MlflowException(
+            "Unsupported Content-Encoding '{}'. Supported encodings: {}".format(
+                encoding, ", ".join(CONTENT_ENCODINGS)
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    decompressor = zlib.decompressobj(_WBITS[encoding])
+    try:
+        decompressed = decompressor.decompress(body, MAX_DECOMPRESSED_REQUEST_SIZE + 1)
+    except zlib.error as e:
+        raise MlflowException(
+            "Failed to decompress the {} request body: {}".format(encoding, e),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if len(decompressed) > MAX_DECOMPRESSED_REQUEST_SIZE:
+        raise MlflowException(
+            "Decompressed request bodies must be at most {} bytes".format(
+                MAX_DECOMPRESSED_REQUEST_SIZE
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    if not decompressor.eof:
+        raise MlflowException(
+            "Failed to decompress the {} request body: truncated data".format(encoding),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    return decompressed
+
+
+def _compress_response(response, min_size):
+    # Files are sent as they are, since they are often compressed already
+    if response.direct_passthrough or "Content-Encoding" in response.headers:
+        return
+    response.vary.add("Accept-Encoding")
+    encoding = request.accept_encodings.best_match(CONTENT_ENCODINGS)
+    if encoding is None:
+        return
+    if response.is_streamed:
+        # Only compress the streamed responses that turn out to be large enough, without reading
+        # more of them than needed to find out
+        chunks = response.iter_encoded()
+        head = []
+        size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= min_size:
+                response.response = _compress_chunks(itertools.chain(head, chunks), encoding)
+                break
+        else:
+            response.set_data(b"".join(head))
+            return
+    elif response.content_length is not None and response.content_length >= min_size:
+        response.set_data(b"".join(_compress_chunks([response.get_data()], encoding)))
+    else:
+        return
+    response.headers["Content-Encoding"] = encoding
+
+
+def _compress_chunks(chunks, encoding):
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, _WBITS[encoding])
+    for chunk in chunks:
+        # Flush each chunk, so that streamed responses can be decompressed as they are received
+        compressed = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -6,8 +6,11 @@ import re
 import logging
 from functools import wraps
 
-from flask import Response, request, send_file
+import numpy as np
+from flask import Response, has_request_context, request, send_file
 from google.protobuf import descriptor
+from google.protobuf.json_format import MessageToDict
+from google.protobuf.message import DecodeError
 from querystring_parser import parser
 
 from mlflow.entities import Metric, Param, RunTag, ViewType, ExperimentTag
@@ -22,6 +25,7 @@ from mlflow.protos.service_pb2 import (
     MlflowService,
     GetExperiment,
     GetRun,
+    GetRuns,
     SearchRuns,
     ListArtifacts,
     GetMetricHistory,
@@ -37,6 +41,7 @@ from mlflow.protos.service_pb2 import (
     DeleteRun,
     UpdateExperiment,
     LogBatch,
+    LogMetricSeries,
     DeleteTag,
     SetExperimentTag,
     GetExperimentByName,
@@ -70,7 +75,13 @@ from mlflow.store.db.db_types import DATABASE_ENGINES
 from mlflow.tracking._model_registry.registry import ModelRegistryStoreRegistry
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
 from mlflow.utils.proto_json_utils import message_to_json, parse_dict
-from mlflow.utils.validation import _validate_batch_log_api_req
+from mlflow.utils.rest_utils import CONTENT_TYPES_HEADER, PROTOBUF_CONTENT_TYPE
+from mlflow.utils.validation import (
+    _validate_batch_limit,
+    _validate_batch_log_api_req,
+    _validate_get_runs_limit,
+    MAX_METRIC_SERIES_LENGTH_PER_REQUEST,
+)
 from mlflow.utils.string_utils import is_string_type
 from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 
@@ -78,6 +89,12 @@ _logger = logging.getLogger(__name__)
 _tracking_store = None
 _model_registry_store = None
 STATIC_PREFIX_ENV_VAR = "_MLFLOW_STATIC_PREFIX"
+# Content types of the request and response bodies supported by the API endpoints
+_SUPPORTED_CONTENT_TYPES = ", ".join(["application/json", PROTOBUF_CONTENT_TYPE])
+# Approximate size in bytes of the chunks of streamed responses
+_STREAMING_CHUNK_SIZE = 64 * 1024
+# Protobuf wire type of embedded messages
+_WIRETYPE_LENGTH_DELIMITED = 2
 
 
 class TrackingStoreRegistryWrapper(TrackingStoreRegistry):
@@ -154,6 +171,10 @@ def _get_request_json(flask_request=request):
     return flask_request.get_json(force=True, silent=True)
 
 
+def _is_protobuf_request(flask_request=request):
+    return flask_request.mimetype == PROTOBUF_CONTENT_TYPE
+
+
 def _get_request_message(request_message, flask_request=request):
     if flask_request.method == "GET" and len(flask_request.query_string) > 0:
         # This is a hack to make arrays of length 1 work with the parser.
@@ -179,6 +200,16 @@ def _get_request_message(request_message, flask_request=request):
         parse_dict(request_dict, request_message)
         return request_message
 
+    if _is_protobuf_request(flask_request):
+        try:
+            request_message.ParseFromString(flask_request.get_data())
+        except DecodeError as e:
+            raise MlflowException(
+                "Failed to parse the {} request body: {}".format(PROTOBUF_CONTENT_TYPE, e),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return request_message
+
     request_json = _get_request_json(flask_request)
 
     # Older clients may post their JSON double-encoded as strings, so the get_json
@@ -195,6 +226,105 @@ def _get_request_message(request_message, flask_request=request):
     return request_message
 
 
+def _wrap_response(response_message):
+    """
+    Return a response with the given message, serialized in the binary protobuf format if the
+    request prefers ``application/x-protobuf`` over ``application/json`` in its ``Accept`` header,
+    and as JSON otherwise. Responses advertise the content types supported by the server, so that
+    clients can send request bodies in the binary protobuf format too.
+    """
+    if has_request_context() and _accepts_protobuf(request):
+        response = Response(mimetype=PROTOBUF_CONTENT_TYPE)
+        response.set_data(response_message.SerializeToString())
+    else:
+        response = Response(mimetype="application/json")
+        response.set_data(message_to_json(response_message))
+    response.headers[CONTENT_TYPES_HEADER] = _SUPPORTED_CONTENT_TYPES
+    return response
+
+
+def _accepts_protobuf(flask_request):
+    accept = flask_request.accept_mimetypes
+    return accept[PROTOBUF_CONTENT_TYPE] > accept["application/json"]
+
+
+def _wrap_streaming_response(response_message, field_name, elements):
+    """
+    Like ``_wrap_response``, but stream the response body in chunks of about
+    ``_STREAMING_CHUNK_SIZE`` bytes, serializing the elements of the repeated field ``field_name``
+    one at a time. This bounds the memory used to serialize large responses, such as long metric
+    histories, and lets the client start reading the response before it is fully serialized.
+
+    :param response_message: Response message with every field except ``field_name`` set.
+    :param field_name: Name of a repeated message field of the response message.
+    :param elements: Iterable of the protobuf messages to serialize into ``field_name``.
+    """
+    if has_request_context() and _accepts_protobuf(request):
+        chunks = _protobuf_chunks(response_message, field_name, elements)
+        mimetype = PROTOBUF_CONTENT_TYPE
+    else:
+        chunks = _json_chunks(response_message, field_name, elements)
+        mimetype = "application/json"
+    response = Response(_buffer_chunks(chunks), mimetype=mimetype)
+    response.headers[CONTENT_TYPES_HEADER] = _SUPPORTED_CONTENT_TYPES
+    return response
+
+
+def _buffer_chunks(chunks):
+    buffer = []
+    size = 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= _STREAMING_CHUNK_SIZE:
+            yield b"".join(buffer)
+            buffer = []
+            size = 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def _json_chunks(response_message, field_name, elements):
+    has_elements = False
+    for element in elements:
+        prefix = ", " if has_elements else '{{"{}": ['.format(field_name)
+        yield (prefix + _message_to_compact_json(element)).encode("utf-8")
+        has_elements = True
+    fields = [
+        "{}: {}".format(json.dumps(name), json.dumps(value))
+        for name, value in MessageToDict(response_message, preserving_proto_field_name=True).items()
+    ]
+    # Like ``message_to_json``, omit the repeated field from the JSON when it is empty
+    if has_elements:
+        yield "".join(["]"] + [", " + field for field in fields] + ["}"]).encode("utf-8")
+    else:
+        yield ("{" + ", ".join(fields) + "}").encode("utf-8")
+
+
+def _message_to_compact_json(message):
+    return json.dumps(MessageToDict(message, preserving_proto_field_name=True))
+
+
+def _protobuf_chunks(response_message, field_name, elements):
+    # Concatenated protobuf messages are parsed as a single message with their repeated fields
+    # merged, so each element can be serialized on its own as a length-delimited field.
+    field_number = response_message.DESCRIPTOR.fields_by_name[field_name].number
+    key = _encode_varint(field_number << 3 | _WIRETYPE_LENGTH_DELIMITED)
+    for element in elements:
+        data = element.SerializeToString()
+        yield key + _encode_varint(len(data)) + data
+    yield response_message.SerializeToString()
+
+
+def _encode_varint(value):
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+    return bytes(encoded)
+
+
 def _send_artifact(artifact_repository, path):
     filename = os.path.abspath(artifact_repository.download_artifacts(path))
     extension = os.path.splitext(filename)[-1].replace(".", "")
@@ -260,9 +390,7 @@ def _create_experiment():
     )
     response_message = CreateExperiment.Response()
     response_message.experiment_id = experiment_id
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -271,9 +399,7 @@ def _get_experiment():
     response_message = GetExperiment.Response()
     experiment = _get_tracking_store().get_experiment(request_message.experiment_id).to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -288,9 +414,7 @@ def _get_experiment_by_name():
         )
     experiment = store_exp.to_proto()
     response_message.experiment.MergeFrom(experiment)
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -298,9 +422,7 @@ def _delete_experiment():
     request_message = _get_request_message(DeleteExperiment())
     _get_tracking_store().delete_experiment(request_message.experiment_id)
     response_message = DeleteExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -308,9 +430,7 @@ def _restore_experiment():
     request_message = _get_request_message(RestoreExperiment())
     _get_tracking_store().restore_experiment(request_message.experiment_id)
     response_message = RestoreExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -321,9 +441,7 @@ def _update_experiment():
             request_message.experiment_id, request_message.new_name
         )
     response_message = UpdateExperiment.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -340,9 +458,7 @@ def _create_run():
 
     response_message = CreateRun.Response()
     response_message.run.MergeFrom(run.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -353,9 +469,7 @@ def _update_run():
         run_id, request_message.status, request_message.end_time
     )
     response_message = UpdateRun.Response(run_info=updated_info.to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -363,9 +477,7 @@ def _delete_run():
     request_message = _get_request_message(DeleteRun())
     _get_tracking_store().delete_run(request_message.run_id)
     response_message = DeleteRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -373,9 +485,7 @@ def _restore_run():
     request_message = _get_request_message(RestoreRun())
     _get_tracking_store().restore_run(request_message.run_id)
     response_message = RestoreRun.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -387,9 +497,7 @@ def _log_metric():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_metric(run_id, metric)
     response_message = LogMetric.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -399,9 +507,7 @@ def _log_param():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().log_param(run_id, param)
     response_message = LogParam.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -410,9 +516,7 @@ def _set_experiment_tag():
     tag = ExperimentTag(request_message.key, request_message.value)
     _get_tracking_store().set_experiment_tag(request_message.experiment_id, tag)
     response_message = SetExperimentTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -422,9 +526,7 @@ def _set_tag():
     run_id = request_message.run_id or request_message.run_uuid
     _get_tracking_store().set_tag(run_id, tag)
     response_message = SetTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -432,9 +534,7 @@ def _delete_tag():
     request_message = _get_request_message(DeleteTag())
     _get_tracking_store().delete_tag(request_message.run_id, request_message.key)
     response_message = DeleteTag.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -443,9 +543,18 @@ def _get_run():
     response_message = GetRun.Response()
     run_id = request_message.run_id or request_message.run_uuid
     response_message.run.MergeFrom(_get_tracking_store().get_run(run_id).to_proto())
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
+
+
+@catch_mlflow_exception
+def _get_runs():
+    request_message = _get_request_message(GetRuns())
+    run_ids = list(request_message.run_ids)
+    _validate_get_runs_limit(run_ids)
+    run_entities = _get_tracking_store().get_runs(run_ids)
+    return _wrap_streaming_response(
+        GetRuns.Response(), "runs", (run.to_proto() for run in run_entities)
+    )
 
 
 @catch_mlflow_exception
@@ -463,12 +572,11 @@ def _search_runs():
     run_entities = _get_tracking_store().search_runs(
         experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     )
-    response_message.runs.extend([r.to_proto() for r in run_entities])
     if run_entities.token:
         response_message.next_page_token = run_entities.token
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_streaming_response(
+        response_message, "runs", (run.to_proto() for run in run_entities)
+    )
 
 
 @catch_mlflow_exception
@@ -484,9 +592,7 @@ def _list_artifacts():
     artifact_entities = _get_artifact_repo(run).list_artifacts(path)
     response_message.files.extend([a.to_proto() for a in artifact_entities])
     response_message.root_uri = _get_artifact_repo(run).artifact_uri
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -494,11 +600,19 @@ def _get_metric_history():
     request_message = _get_request_message(GetMetricHistory())
     response_message = GetMetricHistory.Response()
     run_id = request_message.run_id or request_message.run_uuid
-    metric_entites = _get_tracking_store().get_metric_history(run_id, request_message.metric_key)
-    response_message.metrics.extend([m.to_proto() for m in metric_entites])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    max_points = request_message.max_points if request_message.HasField("max_points") else None
+    start_step = request_message.start_step if request_message.HasField("start_step") else None
+    end_step = request_message.end_step if request_message.HasField("end_step") else None
+    metric_entites = _get_tracking_store().get_metric_history(
+        run_id,
+        request_message.metric_key,
+        max_points=max_points,
+        start_step=start_step,
+        end_step=end_step,
+    )
+    return _wrap_streaming_response(
+        response_message, "metrics", (metric.to_proto() for metric in metric_entites)
+    )
 
 
 @catch_mlflow_exception
@@ -506,10 +620,9 @@ def _list_experiments():
     request_message = _get_request_message(ListExperiments())
     experiment_entities = _get_tracking_store().list_experiments(request_message.view_type)
     response_message = ListExperiments.Response()
-    response_message.experiments.extend([e.to_proto() for e in experiment_entities])
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_streaming_response(
+        response_message, "experiments", (e.to_proto() for e in experiment_entities)
+    )
 
 
 @catch_mlflow_exception
@@ -519,7 +632,10 @@ def _get_artifact_repo(run):
 
 @catch_mlflow_exception
 def _log_batch():
-    _validate_batch_log_api_req(_get_request_json())
+    if has_request_context() and _is_protobuf_request():
+        _validate_batch_log_api_req(request.get_data())
+    else:
+        _validate_batch_log_api_req(_get_request_json())
     request_message = _get_request_message(LogBatch())
     metrics = [Metric.from_proto(proto_metric) for proto_metric in request_message.metrics]
     params = [Param.from_proto(proto_param) for proto_param in request_message.params]
@@ -528,9 +644,24 @@ def _log_batch():
         run_id=request_message.run_id, metrics=metrics, params=params, tags=tags
     )
     response_message = LogBatch.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
+
+
+@catch_mlflow_exception
+def _log_metric_series():
+    request_message = _get_request_message(LogMetricSeries())
+    _validate_batch_limit(
+        "values", MAX_METRIC_SERIES_LENGTH_PER_REQUEST, len(request_message.values)
+    )
+    _get_tracking_store().log_metric_series(
+        run_id=request_message.run_id,
+        key=request_message.key,
+        values=np.array(request_message.values, dtype=np.float64),
+        steps=np.array(request_message.steps, dtype=np.int64),
+        timestamps=np.array(request_message.timestamps, dtype=np.int64),
+    )
+    response_message = LogMetricSeries.Response()
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -558,15 +689,7 @@ def _log_model():
         run_id=request_message.run_id, mlflow_model=Model.from_dict(model)
     )
     response_message = LogModel.Response()
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
-
-
-def _wrap_response(response_message):
-    response = Response(mimetype="application/json")
-    response.set_data(message_to_json(response_message))
-    return response
+    return _wrap_response(response_message)
 
 
 @catch_mlflow_exception
@@ -847,8 +970,10 @@ HANDLERS = {
     SetTag: _set_tag,
     DeleteTag: _delete_tag,
     LogBatch: _log_batch,
+    LogMetricSeries: _log_metric_series,
     LogModel: _log_model,
     GetRun: _get_run,
+    GetRuns: _get_runs,
     SearchRuns: _search_runs,
     ListArtifacts: _list_artifacts,
     GetMetricHistory: _get_metric_history,
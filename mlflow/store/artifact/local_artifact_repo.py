@@ -1,4 +1,3 @@
-import distutils.dir_util as dir_util
 import os
 import shutil
 
@@ -45,6 +44,9 @@ class LocalArtifactRepository(ArtifactRepository):
         return os.path.isdir(list_dir)
 
     def log_artifacts(self, local_dir, artifact_path=None):
+        # Imported here because importing distutils is slow
+        import distutils.dir_util as dir_util
+
         verify_artifact_path(artifact_path)
         # NOTE: The artifact_path is expected to be in posix format.
         # Posix paths work fine on windows but just in case we normalize it here.
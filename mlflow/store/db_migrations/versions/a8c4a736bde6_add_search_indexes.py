@@ -0,0 +1,49 @@
+"""add indexes for run search and metric history queries
+
+Revision ID: a8c4a736bde6
+Revises: 84291f40a231
+Create Date: 2020-08-03 10:12:41.436216
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a8c4a736bde6"
+down_revision = "84291f40a231"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    dialect_name = op.get_bind().dialect.name
+    # Support the subqueries built for metric, param and tag filters and ``order_by`` clauses in
+    # ``SqlAlchemyStore.search_runs``, which select rows by ``key`` and compare their ``value``
+    op.create_index("index_latest_metrics_key_value", "latest_metrics", ["key", "value"])
+    op.create_index("index_params_key_value", "params", ["key", "value"])
+    if dialect_name == "mssql":
+        # Tag values (up to 5000 characters) can exceed the maximum key length of an MSSQL index,
+        # which would cause inserts of long tag values to fail. Store them as included columns
+        # instead.
+        op.create_index("index_tags_key_value", "tags", ["key"], mssql_include=["value"])
+    elif dialect_name == "postgresql":
+        # PostgreSQL limits the size of index entries to about 2700 bytes, including the values of
+        # included columns, so only index tag keys
+        op.create_index("index_tags_key_value", "tags", ["key"])
+    else:
+        # MySQL limits the length of index keys, so only index a prefix of long tag values
+        op.create_index(
+            "index_tags_key_value", "tags", ["key", "value"], mysql_length={"value": 255}
+        )
+    # Support ``get_metric_history``, which selects metrics by run and key
+    op.create_index("index_metrics_run_uuid_key_step", "metrics", ["run_uuid", "key", "step"])
+    # Support listing the runs of an experiment in a given lifecycle stage, ordered by start time
+    op.create_index(
+        "index_runs_experiment_id_lifecycle_stage_start_time",
+        "runs",
+        ["experiment_id", "lifecycle_stage", "start_time"],
+    )
+
+
+def downgrade():
+    pass
@@ -25,7 +25,6 @@ from mlflow.protos.model_registry_pb2 import (
 )
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.model_registry.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
 
 _PATH_PREFIX = "/api/2.0"
@@ -49,10 +48,10 @@ class RestStore(AbstractStore):
         super(RestStore, self).__init__()
         self.get_host_creds = get_host_creds
 
-    def _call_endpoint(self, api, json_body):
+    def _call_endpoint(self, api, req_body):
         endpoint, method = _METHOD_TO_INFO[api]
         response_proto = api.Response()
-        return call_endpoint(self.get_host_creds(), endpoint, method, json_body, response_proto)
+        return call_endpoint(self.get_host_creds(), endpoint, method, req_body, response_proto)
 
     # CRUD API for RegisteredModel objects
 
@@ -68,9 +67,7 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
-            CreateRegisteredModel(name=name, tags=proto_tags, description=description)
-        )
+        req_body = CreateRegisteredModel(name=name, tags=proto_tags, description=description)
         response_proto = self._call_endpoint(CreateRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -82,7 +79,7 @@ class RestStore(AbstractStore):
         :param description: New description.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(UpdateRegisteredModel(name=name, description=description))
+        req_body = UpdateRegisteredModel(name=name, description=description)
         response_proto = self._call_endpoint(UpdateRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -94,7 +91,7 @@ class RestStore(AbstractStore):
         :param new_name: New proposed name.
         :return: A single updated :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(RenameRegisteredModel(name=name, new_name=new_name))
+        req_body = RenameRegisteredModel(name=name, new_name=new_name)
         response_proto = self._call_endpoint(RenameRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -106,7 +103,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModel(name=name))
+        req_body = DeleteRegisteredModel(name=name)
         self._call_endpoint(DeleteRegisteredModel, req_body)
 
     def list_registered_models(self, max_results, page_token):
@@ -120,9 +117,7 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
-            ListRegisteredModels(page_token=page_token, max_results=max_results)
-        )
+        req_body = ListRegisteredModels(page_token=page_token, max_results=max_results)
         response_proto = self._call_endpoint(ListRegisteredModels, req_body)
         return PagedList(
             [
@@ -148,13 +143,8 @@ class RestStore(AbstractStore):
                 that satisfy the search expressions. The pagination token for the next page can be
                 obtained via the ``token`` attribute of the object.
         """
-        req_body = message_to_json(
-            SearchRegisteredModels(
-                filter=filter_string,
-                max_results=max_results,
-                order_by=order_by,
-                page_token=page_token,
-            )
+        req_body = SearchRegisteredModels(
+            filter=filter_string, max_results=max_results, order_by=order_by, page_token=page_token,
         )
         response_proto = self._call_endpoint(SearchRegisteredModels, req_body)
         registered_models = [
@@ -170,7 +160,7 @@ class RestStore(AbstractStore):
         :param name: Registered model name.
         :return: A single :py:class:`mlflow.entities.model_registry.RegisteredModel` object.
         """
-        req_body = message_to_json(GetRegisteredModel(name=name))
+        req_body = GetRegisteredModel(name=name)
         response_proto = self._call_endpoint(GetRegisteredModel, req_body)
         return RegisteredModel.from_proto(response_proto.registered_model)
 
@@ -184,7 +174,7 @@ class RestStore(AbstractStore):
                        for 'Staging' and 'Production' stages.
         :return: List of :py:class:`mlflow.entities.model_registry.ModelVersion` objects.
         """
-        req_body = message_to_json(GetLatestVersions(name=name, stages=stages))
+        req_body = GetLatestVersions(name=name, stages=stages)
         response_proto = self._call_endpoint(GetLatestVersions, req_body)
         return [
             ModelVersion.from_proto(model_version)
@@ -199,7 +189,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.RegisteredModelTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(SetRegisteredModelTag(name=name, key=tag.key, value=tag.value))
+        req_body = SetRegisteredModelTag(name=name, key=tag.key, value=tag.value)
         self._call_endpoint(SetRegisteredModelTag, req_body)
 
     def delete_registered_model_tag(self, name, key):
@@ -210,7 +200,7 @@ class RestStore(AbstractStore):
         :param key: Registered model tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteRegisteredModelTag(name=name, key=key))
+        req_body = DeleteRegisteredModelTag(name=name, key=key)
         self._call_endpoint(DeleteRegisteredModelTag, req_body)
 
     # CRUD API for ModelVersion objects
@@ -232,15 +222,13 @@ class RestStore(AbstractStore):
                  created in the backend.
         """
         proto_tags = [tag.to_proto() for tag in tags or []]
-        req_body = message_to_json(
-            CreateModelVersion(
-                name=name,
-                source=source,
-                run_id=run_id,
-                run_link=run_link,
-                tags=proto_tags,
-                description=description,
-            )
+        req_body = CreateModelVersion(
+            name=name,
+            source=source,
+            run_id=run_id,
+            run_link=run_link,
+            tags=proto_tags,
+            description=description,
         )
         response_proto = self._call_endpoint(CreateModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
@@ -258,13 +246,11 @@ class RestStore(AbstractStore):
 
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
-            TransitionModelVersionStage(
-                name=name,
-                version=str(version),
-                stage=stage,
-                archive_existing_versions=archive_existing_versions,
-            )
+        req_body = TransitionModelVersionStage(
+            name=name,
+            version=str(version),
+            stage=stage,
+            archive_existing_versions=archive_existing_versions,
         )
         response_proto = self._call_endpoint(TransitionModelVersionStage, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
@@ -278,9 +264,7 @@ class RestStore(AbstractStore):
         :param description: New model description.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(
-            UpdateModelVersion(name=name, version=str(version), description=description)
-        )
+        req_body = UpdateModelVersion(name=name, version=str(version), description=description)
         response_proto = self._call_endpoint(UpdateModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
@@ -292,7 +276,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersion(name=name, version=str(version)))
+        req_body = DeleteModelVersion(name=name, version=str(version))
         self._call_endpoint(DeleteModelVersion, req_body)
 
     def get_model_version(self, name, version):
@@ -303,7 +287,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single :py:class:`mlflow.entities.model_registry.ModelVersion` object.
         """
-        req_body = message_to_json(GetModelVersion(name=name, version=str(version)))
+        req_body = GetModelVersion(name=name, version=str(version))
         response_proto = self._call_endpoint(GetModelVersion, req_body)
         return ModelVersion.from_proto(response_proto.model_version)
 
@@ -317,7 +301,7 @@ class RestStore(AbstractStore):
         :param version: Registered model version.
         :return: A single URI location that allows reads for downloading.
         """
-        req_body = message_to_json(GetModelVersionDownloadUri(name=name, version=str(version)))
+        req_body = GetModelVersionDownloadUri(name=name, version=str(version))
         response_proto = self._call_endpoint(GetModelVersionDownloadUri, req_body)
         return response_proto.artifact_uri
 
@@ -331,7 +315,7 @@ class RestStore(AbstractStore):
         :return: PagedList of :py:class:`mlflow.entities.model_registry.ModelVersion`
                  objects.
         """
-        req_body = message_to_json(SearchModelVersions(filter=filter_string))
+        req_body = SearchModelVersions(filter=filter_string)
         response_proto = self._call_endpoint(SearchModelVersions, req_body)
         model_versions = [ModelVersion.from_proto(mvd) for mvd in response_proto.model_versions]
         return PagedList(model_versions, response_proto.next_page_token)
@@ -345,9 +329,7 @@ class RestStore(AbstractStore):
         :param tag: :py:class:`mlflow.entities.model_registry.ModelVersionTag` instance to log.
         :return: None
         """
-        req_body = message_to_json(
-            SetModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
-        )
+        req_body = SetModelVersionTag(name=name, version=version, key=tag.key, value=tag.value)
         self._call_endpoint(SetModelVersionTag, req_body)
 
     def delete_model_version_tag(self, name, version, key):
@@ -359,5 +341,5 @@ class RestStore(AbstractStore):
         :param key: Tag key.
         :return: None
         """
-        req_body = message_to_json(DeleteModelVersionTag(name=name, version=version, key=key))
+        req_body = DeleteModelVersionTag(name=name, version=version, key=key)
         self._call_endpoint(DeleteModelVersionTag, req_body)
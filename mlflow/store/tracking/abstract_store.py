@@ -1,9 +1,10 @@
 from abc import abstractmethod, ABCMeta
 
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, ViewType
 from mlflow.store.entities.paged_list import PagedList
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.utils.annotations import experimental
+from mlflow.utils.validation import MAX_METRICS_PER_BATCH
 
 
 class AbstractStore:
@@ -118,6 +119,19 @@ class AbstractStore:
         """
         pass
 
+    def get_runs(self, run_ids):
+        """
+        Fetch several runs from backend store, like :py:func:`get_run`. The default implementation
+        fetches the runs one at a time with ``get_run``; stores that can fetch several runs at once
+        should override it.
+
+        :param run_ids: List of unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``, if
+                 all the runs exist. Otherwise, raises an exception.
+        """
+        return [self.get_run(run_id) for run_id in run_ids]
+
     @abstractmethod
     def update_run_info(self, run_id, run_status, end_time):
         """
@@ -195,12 +209,23 @@ class AbstractStore:
         self.log_batch(run_id, metrics=[], params=[], tags=[tag])
 
     @abstractmethod
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(
+        self, run_id, metric_key, max_points=None, start_step=None, end_step=None
+    ):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_points: If specified, the maximum number of values to return. When more values
+                           were logged in the requested step range, the range is split into at
+                           most ``max_points`` equal-width step buckets and only the first value
+                           (lowest step, then earliest timestamp) of each bucket is returned,
+                           ordered by step.
+        :param start_step: If specified, only values logged at a step greater than or equal to
+                           ``start_step`` are returned.
+        :param end_step: If specified, only values logged at a step less than or equal to
+                         ``end_step`` are returned.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
@@ -296,6 +321,30 @@ class AbstractStore:
         """
         pass
 
+    def log_metric_series(self, run_id, key, values, steps, timestamps):
+        """
+        Log a series of values of a metric for the specified run. The default implementation logs
+        the series with ``log_batch`` calls of up to ``MAX_METRICS_PER_BATCH`` metrics; stores
+        that can write the whole series at once should override it.
+
+        :param run_id: String id for the run
+        :param key: Metric name
+        :param values: One-dimensional numpy array of float64 metric values
+        :param steps: One-dimensional numpy array of int64 steps, with one step per value
+        :param timestamps: One-dimensional numpy array of int64 timestamps in milliseconds, with
+                           one timestamp per value
+
+        :return: None.
+        """
+        metrics = [
+            Metric(key, value, timestamp, step)
+            for value, step, timestamp in zip(values.tolist(), steps.tolist(), timestamps.tolist())
+        ]
+        for i in range(0, len(metrics), MAX_METRICS_PER_BATCH):
+            self.log_batch(
+                run_id, metrics=metrics[i : i + MAX_METRICS_PER_BATCH], params=[], tags=[]
+            )
+
     @experimental
     @abstractmethod
     def record_logged_model(self, run_id, mlflow_model):
@@ -1,3 +1,4 @@
+import copy
 import time
 from sqlalchemy.orm import relationship, backref
 import sqlalchemy as sa
@@ -10,7 +11,10 @@ from sqlalchemy import (
     BigInteger,
     PrimaryKeyConstraint,
     Boolean,
+    Index,
 )
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.schema import CreateIndex
 from mlflow.entities import (
     Experiment,
     RunTag,
@@ -172,6 +176,12 @@ class SqlRun(Base):
             name="runs_lifecycle_stage",
         ),
         PrimaryKeyConstraint("run_uuid", name="run_pk"),
+        Index(
+            "index_runs_experiment_id_lifecycle_stage_start_time",
+            "experiment_id",
+            "lifecycle_stage",
+            "start_time",
+        ),
     )
 
     @staticmethod
@@ -250,6 +260,48 @@ class SqlExperimentTag(Base):
         return ExperimentTag(key=self.key, value=self.value)
 
 
+# PostgreSQL limits the size of index entries to about 2700 bytes, which long tag values exceed
+# even as included columns, so indexes can leave such columns out on PostgreSQL
+Index.argument_for("postgresql", "omit", None)
+
+
+def _compile_create_index_omitting(create, compiler, omitted, **kw):
+    """
+    Compile ``create`` with the columns named in ``omitted`` left out of the key columns of the
+    index.
+    """
+    index = create.element
+    omitted = set(omitted or [])
+    key_expressions = [
+        expr for expr in index.expressions if getattr(expr, "name", None) not in omitted
+    ]
+    if len(key_expressions) < len(index.expressions):
+        # Compile a shallow copy of the index, which is not attached to the table
+        index = copy.copy(index)
+        index.expressions = key_expressions
+        create = CreateIndex(index)
+    return compiler.visit_create_index(create, **kw)
+
+
+@compiles(CreateIndex, "mssql")
+def _compile_mssql_create_index(create, compiler, **kw):
+    """
+    Leave the columns listed in ``mssql_include`` out of the key columns of MSSQL indexes, since
+    MSSQL does not allow a column to be both a key column and an included column of an index.
+    """
+    included = create.element.dialect_options["mssql"]["include"]
+    return _compile_create_index_omitting(create, compiler, included, **kw)
+
+
+@compiles(CreateIndex, "postgresql")
+def _compile_postgresql_create_index(create, compiler, **kw):
+    """
+    Leave the columns listed in ``postgresql_omit`` out of PostgreSQL indexes.
+    """
+    omitted = create.element.dialect_options["postgresql"]["omit"]
+    return _compile_create_index_omitting(create, compiler, omitted, **kw)
+
+
 class SqlTag(Base):
     """
     DB model for :py:class:`mlflow.entities.RunTag`. These are recorded in ``tags`` table.
@@ -274,7 +326,20 @@ class SqlTag(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="tag_pk"),
+        # Tag values can exceed the maximum index entry size of MySQL, MSSQL and PostgreSQL, so
+        # MySQL only indexes a prefix of them, MSSQL stores them as included columns and
+        # PostgreSQL only indexes tag keys
+        Index(
+            "index_tags_key_value",
+            "key",
+            "value",
+            mysql_length={"value": 255},
+            mssql_include=["value"],
+            postgresql_omit=["value"],
+        ),
+    )
 
     def __repr__(self):
         return "<SqlRunTag({}, {})>".format(self.key, self.value)
@@ -326,6 +391,7 @@ class SqlMetric(Base):
         PrimaryKeyConstraint(
             "key", "timestamp", "step", "run_uuid", "value", "is_nan", name="metric_pk"
         ),
+        Index("index_metrics_run_uuid_key_step", "run_uuid", "key", "step"),
     )
 
     def __repr__(self):
@@ -379,7 +445,10 @@ class SqlLatestMetric(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="latest_metric_pk"),
+        Index("index_latest_metrics_key_value", "key", "value"),
+    )
 
     def __repr__(self):
         return "<SqlLatestMetric({}, {}, {}, {})>".format(
@@ -421,7 +490,10 @@ class SqlParam(Base):
     SQLAlchemy relationship (many:one) with :py:class:`mlflow.store.dbmodels.models.SqlRun`.
     """
 
-    __table_args__ = (PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),)
+    __table_args__ = (
+        PrimaryKeyConstraint("key", "run_uuid", name="param_pk"),
+        Index("index_params_key_value", "key", "value"),
+    )
 
     def __repr__(self):
         return "<SqlParam({}, {})>".format(self.key, self.value)
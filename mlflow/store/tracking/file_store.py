@@ -1,10 +1,16 @@
 import json
 import logging
+import operator
 import os
 import sys
 import shutil
+import threading
+import warnings
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from mlflow.entities import (
     Experiment,
@@ -23,12 +29,13 @@ from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.entities.run_info import check_run_is_active, check_run_is_deleted
 from mlflow.exceptions import MlflowException, MissingConfigException
 import mlflow.protos.databricks_pb2 as databricks_pb2
-from mlflow.models import Model
 from mlflow.protos.databricks_pb2 import INTERNAL_ERROR, RESOURCE_DOES_NOT_EXIST
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH, SEARCH_MAX_RESULTS_THRESHOLD
 from mlflow.store.tracking.abstract_store import AbstractStore
 from mlflow.utils.validation import (
     _validate_metric_name,
+    _validate_metric_history_params,
+    _validate_metric_series,
     _validate_param_name,
     _validate_run_id,
     _validate_tag_name,
@@ -45,6 +52,7 @@ from mlflow.utils.file_utils import (
     write_yaml,
     read_yaml,
     find,
+    iter_file_lines,
     read_file_lines,
     read_file,
     write_to,
@@ -62,6 +70,71 @@ from mlflow.utils.uri import append_to_uri_path
 from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _TRACKING_DIR_ENV_VAR = "MLFLOW_TRACKING_DIR"
+# Number of threads used to read runs concurrently when listing and searching runs. Runs are read
+# sequentially by default, which is the fastest option on local disks, while network file systems
+# benefit from a larger pool.
+MLFLOW_FILESTORE_RUN_LOADER_POOL_SIZE = "MLFLOW_FILESTORE_RUN_LOADER_POOL_SIZE"
+_DEFAULT_RUN_LOADER_POOL_SIZE = 1
+# Minimum number of runs for which searches filter and order runs with the vectorized functions of
+# `SearchUtils`, which have a fixed overhead but are faster on large numbers of runs.
+_COLUMNAR_SEARCH_MIN_RUNS = 5000
+# Lock held while creating root directories, so that stores created concurrently by several threads
+# do not see a root directory whose default experiment is not created yet
+_root_directory_lock = threading.Lock()
+# Minimum number of stale run index file entries (permanently deleted runs and duplicate entries)
+# above which the index file is rewritten without them, once they outnumber the indexed runs
+_RUN_INDEX_COMPACTION_MIN_STALE_ENTRIES = 1000
+
+
+class _RunIndex(object):
+    """
+    In-memory copy of the run index file of a root directory, shared by all the FileStore instances
+    of the process that use this root directory, so that stores created for every client or fluent
+    API call do not read the whole index file again.
+    """
+
+    def __init__(self):
+        # Mapping of run IDs to experiment IDs, or to None for runs that have been permanently
+        # deleted
+        self.entries = {}
+        # Number of bytes and lines of the index file reflected by ``entries``, and the device and
+        # inode numbers of that file, which change when another process rewrites it
+        self.offset = 0
+        self.num_lines = 0
+        self.file_id = None
+        # False if the index file could not be written, e.g. because the store is read-only, in
+        # which case ``entries`` is only kept in memory
+        self.writable = True
+        self.lock = threading.Lock()
+
+
+_run_indexes = {}
+_run_indexes_lock = threading.Lock()
+_run_indexes_pid = os.getpid()
+
+
+def _reset_run_indexes():
+    global _run_indexes, _run_indexes_lock, _run_indexes_pid
+    # The locks may have been held by another thread of the parent process when it forked
+    _run_indexes = {}
+    _run_indexes_lock = threading.Lock()
+    _run_indexes_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_run_indexes)
+
+
+def _get_run_index(run_index_file):
+    if _run_indexes_pid != os.getpid():
+        # ``os.register_at_fork`` is not available before Python 3.7
+        _reset_run_indexes()
+    run_index_file = os.path.realpath(run_index_file)
+    with _run_indexes_lock:
+        run_index = _run_indexes.get(run_index_file)
+        if run_index is None:
+            run_index = _run_indexes[run_index_file] = _RunIndex()
+    return run_index
 
 
 def _default_root_dir():
@@ -117,11 +190,13 @@ class FileStore(AbstractStore):
     TRASH_FOLDER_NAME = ".trash"
     ARTIFACTS_FOLDER_NAME = "artifacts"
     METRICS_FOLDER_NAME = "metrics"
+    LATEST_METRICS_FOLDER_NAME = ".latest_metrics"
     PARAMS_FOLDER_NAME = "params"
     TAGS_FOLDER_NAME = "tags"
     EXPERIMENT_TAGS_FOLDER_NAME = "tags"
     RESERVED_EXPERIMENT_FOLDERS = [EXPERIMENT_TAGS_FOLDER_NAME]
     META_DATA_FILE_NAME = "meta.yaml"
+    RUN_INDEX_FILE_NAME = ".run_index"
     DEFAULT_EXPERIMENT_ID = "0"
 
     def __init__(self, root_directory=None, artifact_root_uri=None):
@@ -132,14 +207,20 @@ class FileStore(AbstractStore):
         self.root_directory = local_file_uri_to_path(root_directory or _default_root_dir())
         self.artifact_root_uri = artifact_root_uri or path_to_local_file_uri(self.root_directory)
         self.trash_folder = os.path.join(self.root_directory, FileStore.TRASH_FOLDER_NAME)
+        self.run_index_file = os.path.join(self.root_directory, FileStore.RUN_INDEX_FILE_NAME)
+        self._run_index = _get_run_index(self.run_index_file)
+        self._run_loader_pool_size = int(
+            get_env(MLFLOW_FILESTORE_RUN_LOADER_POOL_SIZE) or _DEFAULT_RUN_LOADER_POOL_SIZE
+        )
         # Create root directory if needed
-        if not exists(self.root_directory):
-            mkdir(self.root_directory)
-            self._create_experiment_with_id(
-                name=Experiment.DEFAULT_EXPERIMENT_NAME,
-                experiment_id=FileStore.DEFAULT_EXPERIMENT_ID,
-                artifact_uri=None,
-            )
+        with _root_directory_lock:
+            if not exists(self.root_directory):
+                mkdir(self.root_directory)
+                self._create_experiment_with_id(
+                    name=Experiment.DEFAULT_EXPERIMENT_NAME,
+                    experiment_id=FileStore.DEFAULT_EXPERIMENT_ID,
+                    artifact_uri=None,
+                )
         # Create trash folder if needed
         if not exists(self.trash_folder):
             mkdir(self.trash_folder)
@@ -403,6 +484,7 @@ class FileStore(AbstractStore):
         """
         _, run_dir = self._find_run_root(run_id)
         shutil.rmtree(run_dir)
+        self._add_to_run_index(run_id, None)
 
     def _get_deleted_runs(self):
         experiment_ids = self._get_active_experiments() + self._get_deleted_experiments()
@@ -431,8 +513,55 @@ class FileStore(AbstractStore):
         return parent
 
     def _find_run_root(self, run_uuid):
-        _validate_run_id(run_uuid)
+        return self._find_run_roots([run_uuid])[run_uuid]
+
+    def _find_run_roots(self, run_uuids):
+        """
+        Return a dict mapping each of the given run IDs to the experiment ID and directory of the
+        run, or to ``(None, None)`` if the run does not exist.
+        """
+        for run_uuid in run_uuids:
+            _validate_run_id(run_uuid)
         self._check_root_dir()
+        with self._run_index.lock:
+            run_roots = {run_uuid: self._get_indexed_run_root(run_uuid) for run_uuid in run_uuids}
+            if any(run_root is None for run_root in run_roots.values()):
+                # Pick up the runs created or permanently deleted by other store instances
+                self._refresh_run_index()
+                for run_uuid, run_root in run_roots.items():
+                    if run_root is None:
+                        run_roots[run_uuid] = self._get_indexed_run_root(run_uuid)
+        for run_uuid, run_root in run_roots.items():
+            if run_root is not None:
+                continue
+            # The run was created by a client that did not maintain the index, or its directory
+            # has been moved: fall back to scanning all experiments and remember the result
+            experiment_id, run_dir = self._scan_run_root(run_uuid)
+            if run_dir is not None:
+                self._add_to_run_index(run_uuid, experiment_id)
+            run_roots[run_uuid] = experiment_id, run_dir
+        return run_roots
+
+    def _get_indexed_run_root(self, run_uuid):
+        """
+        Return the experiment ID and directory of the run according to the in-memory run index,
+        ``(None, None)`` if the run has been permanently deleted, or None if the run is not indexed
+        or its indexed location is stale.
+        """
+        if run_uuid not in self._run_index.entries:
+            return None
+        experiment_id = self._run_index.entries[run_uuid]
+        if experiment_id is None:
+            return None, None
+        # Runs never move between experiments, but their experiment may have been deleted or
+        # restored since the run was indexed
+        for parent in [self.root_directory, self.trash_folder]:
+            run_dir = os.path.join(parent, experiment_id, run_uuid)
+            if is_directory(run_dir):
+                return experiment_id, run_dir
+        return None
+
+    def _scan_run_root(self, run_uuid):
         all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
         for experiment_dir in all_experiments:
             runs = find(experiment_dir, run_uuid, full_path=True)
@@ -441,6 +570,106 @@ class FileStore(AbstractStore):
             return os.path.basename(os.path.abspath(experiment_dir)), runs[0]
         return None, None
 
+    def _refresh_run_index(self):
+        """
+        Read the entries appended to the run index file since it was last read, rebuilding the
+        index file if it does not exist. Must be called while holding the run index lock.
+        """
+        run_index = self._run_index
+        if not exists(self.run_index_file):
+            if run_index.writable:
+                self._rebuild_run_index()
+            return
+        with open(self.run_index_file, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if (stat.st_dev, stat.st_ino) != run_index.file_id or stat.st_size < run_index.offset:
+                # The index file has been rewritten by another process, read it from the start
+                run_index.entries = {}
+                run_index.offset = 0
+                run_index.num_lines = 0
+                run_index.file_id = stat.st_dev, stat.st_ino
+            f.seek(run_index.offset)
+            data = f.read()
+        # Only consume complete lines, another process may be in the middle of appending an entry
+        data = data[: data.rfind(b"\n") + 1]
+        lines = data.decode("utf-8").splitlines()
+        for line in lines:
+            run_id, _, experiment_id = line.partition(" ")
+            run_index.entries[run_id] = experiment_id or None
+        run_index.offset += len(data)
+        run_index.num_lines += len(lines)
+        num_runs = sum(1 for experiment_id in run_index.entries.values() if experiment_id)
+        num_stale_lines = run_index.num_lines - num_runs
+        if run_index.writable and num_stale_lines > max(
+            num_runs, _RUN_INDEX_COMPACTION_MIN_STALE_ENTRIES
+        ):
+            # Entries appended by other processes while the file is rewritten are lost, and these
+            # runs are found again by scanning the experiments
+            self._write_run_index(
+                {run_id: exp_id for run_id, exp_id in run_index.entries.items() if exp_id}
+            )
+
+    def _rebuild_run_index(self):
+        """
+        Recreate the run index file by scanning all active and deleted experiments. Must be called
+        while holding the run index lock.
+        """
+        entries = {}
+        all_experiments = self._get_active_experiments(True) + self._get_deleted_experiments(True)
+        for experiment_dir in all_experiments:
+            experiment_id = os.path.basename(os.path.abspath(experiment_dir))
+            for run_id in list_subdirs(experiment_dir):
+                if run_id not in FileStore.RESERVED_EXPERIMENT_FOLDERS:
+                    entries[run_id] = experiment_id
+        self._write_run_index(entries)
+
+    def _write_run_index(self, entries):
+        """
+        Replace the run index file and the in-memory run index with the given entries. The entries
+        are only kept in memory if the file cannot be written. Must be called while holding the run
+        index lock.
+        """
+        run_index = self._run_index
+        run_index.entries = entries
+        data = "".join("%s %s\n" % entry for entry in entries.items()).encode("utf-8")
+        tmp_file = "%s.%s" % (self.run_index_file, uuid.uuid4().hex)
+        try:
+            with open(tmp_file, "wb") as f:
+                f.write(data)
+                stat = os.fstat(f.fileno())
+            os.replace(tmp_file, self.run_index_file)
+        except (IOError, OSError):
+            # The index is only used to speed up lookups, e.g. the store may be read-only
+            logging.debug("Failed to write run index file '%s'", self.run_index_file, exc_info=True)
+            run_index.writable = False
+            return
+        run_index.offset = len(data)
+        run_index.num_lines = len(entries)
+        run_index.file_id = stat.st_dev, stat.st_ino
+
+    def _add_to_run_index(self, run_id, experiment_id):
+        """
+        Append an entry to the run index file. An ``experiment_id`` of None records that the run has
+        been permanently deleted.
+        """
+        run_index = self._run_index
+        with run_index.lock:
+            if not exists(self.run_index_file) and run_index.writable:
+                # Build the index from the runs on disk, which already include this run
+                self._rebuild_run_index()
+                if experiment_id is not None:
+                    return
+            run_index.entries[run_id] = experiment_id
+            if not run_index.writable:
+                return
+            try:
+                with open(self.run_index_file, "ab") as f:
+                    f.write(("%s %s\n" % (run_id, experiment_id or "")).encode("utf-8"))
+            except (IOError, OSError):
+                logging.debug(
+                    "Failed to update run index file '%s'", self.run_index_file, exc_info=True
+                )
+
     def update_run_info(self, run_id, run_status, end_time):
         _validate_run_id(run_id)
         run_info = self._get_run_info(run_id)
@@ -487,6 +716,7 @@ class FileStore(AbstractStore):
         mkdir(run_dir, FileStore.METRICS_FOLDER_NAME)
         mkdir(run_dir, FileStore.PARAMS_FOLDER_NAME)
         mkdir(run_dir, FileStore.ARTIFACTS_FOLDER_NAME)
+        self._add_to_run_index(run_uuid, experiment_id)
         for tag in tags:
             self.set_tag(run_uuid, tag)
         return self.get_run(run_id=run_uuid)
@@ -503,6 +733,27 @@ class FileStore(AbstractStore):
             )
         return self._get_run_from_info(run_info)
 
+    def get_runs(self, run_ids):
+        """
+        Note: Will get both active and deleted runs.
+        """
+        unique_run_ids = list(set(run_ids))
+        run_roots = self._find_run_roots(unique_run_ids)
+        missing_run_ids = [run_id for run_id in unique_run_ids if run_roots[run_id][1] is None]
+        if missing_run_ids:
+            raise MlflowException(
+                "Runs with ids=%s not found" % ", ".join(sorted(missing_run_ids)),
+                databricks_pb2.RESOURCE_DOES_NOT_EXIST,
+            )
+        runs = self._map_concurrently(
+            lambda run_id: self._get_run_from_info(
+                self._get_run_info_from_root(run_id, *run_roots[run_id])
+            ),
+            unique_run_ids,
+        )
+        runs_by_id = dict(zip(unique_run_ids, runs))
+        return [runs_by_id[run_id] for run_id in run_ids]
+
     def _get_run_from_info(self, run_info):
         metrics = self._get_all_metrics(run_info)
         params = self._get_all_params(run_info)
@@ -514,6 +765,9 @@ class FileStore(AbstractStore):
         Note: Will get both active and deleted runs.
         """
         exp_id, run_dir = self._find_run_root(run_uuid)
+        return self._get_run_info_from_root(run_uuid, exp_id, run_dir)
+
+    def _get_run_info_from_root(self, run_uuid, exp_id, run_dir):
         if run_dir is None:
             raise MlflowException(
                 "Run '%s' not found" % run_uuid, databricks_pb2.RESOURCE_DOES_NOT_EXIST
@@ -570,6 +824,41 @@ class FileStore(AbstractStore):
     @staticmethod
     def _get_metric_from_file(parent_path, metric_name):
         _validate_metric_name(metric_name)
+        metric_stat = os.stat(os.path.join(parent_path, metric_name))
+        latest_metric_path = FileStore._get_latest_metric_path(
+            os.path.dirname(parent_path), metric_name
+        )
+        metric = FileStore._read_latest_metric(latest_metric_path, metric_name, metric_stat)
+        if metric is None:
+            metric = FileStore._compute_latest_metric(parent_path, metric_name)
+            FileStore._write_latest_metric(latest_metric_path, metric, metric_stat)
+        return metric
+
+    @staticmethod
+    def _compute_latest_metric(parent_path, metric_name):
+        with open(os.path.join(parent_path, metric_name), "rb") as f:
+            data = f.read()
+        num_lines = data.count(b"\n") + (0 if data.endswith(b"\n") else 1)
+        if data.strip():
+            # Parse the file in a single vectorized pass rather than creating a Metric per line
+            with warnings.catch_warnings():
+                # NumPy warns instead of raising when the data contains non-numeric fields
+                warnings.simplefilter("error", DeprecationWarning)
+                try:
+                    fields = np.fromstring(data.decode("utf-8"), dtype=np.float64, sep=" ")
+                except (DeprecationWarning, ValueError):
+                    fields = []
+            if len(fields) == 3 * num_lines:
+                steps = fields.reshape(num_lines, 3)[:, 2]
+                lines = data.splitlines()
+                # Only select candidates on the step: large steps may not be represented exactly
+                # as floats, so timestamps and values are compared on the exactly parsed lines
+                metric_objs = [
+                    FileStore._get_metric_from_line(metric_name, lines[i].decode("utf-8"))
+                    for i in np.flatnonzero(steps == steps.max())
+                ]
+                return max(metric_objs, key=lambda m: (m.step, m.timestamp, m.value))
+        # Files containing lines without step or malformed lines are parsed line by line
         metric_objs = [
             FileStore._get_metric_from_line(metric_name, line)
             for line in read_file_lines(parent_path, metric_name)
@@ -582,6 +871,53 @@ class FileStore(AbstractStore):
         # https://docs.python.org/3/reference/expressions.html#value-comparisons
         return max(metric_objs, key=lambda m: (m.step, m.timestamp, m.value))
 
+    @staticmethod
+    def _get_latest_metric_path(run_dir, metric_name):
+        return os.path.join(run_dir, FileStore.LATEST_METRICS_FOLDER_NAME, metric_name)
+
+    @staticmethod
+    def _read_latest_metric(latest_metric_path, metric_name, metric_stat):
+        """
+        Read the latest value of a metric cached alongside the metric file. Return None if there is
+        no cached value or if it does not reflect the current size and modification time of the
+        metric file.
+        """
+        try:
+            with open(latest_metric_path, "r") as f:
+                content = f.read()
+        except (IOError, OSError):
+            return None
+        size, _, metric_line = content.partition(" ")
+        mtime, _, metric_line = metric_line.partition(" ")
+        if size != str(metric_stat.st_size) or mtime != str(metric_stat.st_mtime_ns):
+            return None
+        try:
+            return FileStore._get_metric_from_line(metric_name, metric_line)
+        except (MlflowException, ValueError):
+            return None
+
+    @staticmethod
+    def _write_latest_metric(latest_metric_path, metric, metric_stat):
+        """
+        Cache the latest value of a metric for the given size and modification time of the metric
+        file. The cache is only used to speed up reads, so failing to write it is not an error.
+        """
+        content = "%s %s %s %s %s\n" % (
+            metric_stat.st_size,
+            metric_stat.st_mtime_ns,
+            metric.timestamp,
+            metric.value,
+            metric.step,
+        )
+        tmp_path = "%s.%s" % (latest_metric_path, uuid.uuid4().hex)
+        try:
+            make_containing_dirs(latest_metric_path)
+            with open(tmp_path, "w") as f:
+                f.write(content)
+            os.replace(tmp_path, latest_metric_path)
+        except (IOError, OSError):
+            logging.debug("Failed to cache latest metric '%s'", latest_metric_path, exc_info=True)
+
     def get_all_metrics(self, run_uuid):
         _validate_run_id(run_uuid)
         run_info = self._get_run_info(run_uuid)
@@ -608,13 +944,18 @@ class FileStore(AbstractStore):
         step = int(metric_parts[2]) if len(metric_parts) == 3 else 0
         return Metric(key=metric_name, value=val, timestamp=ts, step=step)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(
+        self, run_id, metric_key, max_points=None, start_step=None, end_step=None
+    ):
         _validate_run_id(run_id)
         _validate_metric_name(metric_key)
+        _validate_metric_history_params(max_points, start_step, end_step)
         run_info = self._get_run_info(run_id)
-        return self._get_metric_history(run_info, metric_key)
+        return self._get_metric_history(run_info, metric_key, max_points, start_step, end_step)
 
-    def _get_metric_history(self, run_info, metric_key):
+    def _get_metric_history(
+        self, run_info, metric_key, max_points=None, start_step=None, end_step=None
+    ):
         parent_path, metric_files = self._get_run_files(run_info, "metric")
         if metric_key not in metric_files:
             run_id = run_info.run_id
@@ -622,10 +963,43 @@ class FileStore(AbstractStore):
                 "Metric '%s' not found under run '%s'" % (metric_key, run_id),
                 databricks_pb2.RESOURCE_DOES_NOT_EXIST,
             )
-        return [
-            FileStore._get_metric_from_line(metric_key, line)
-            for line in read_file_lines(parent_path, metric_key)
-        ]
+        if max_points is None:
+            return list(
+                FileStore._iter_metric_history(parent_path, metric_key, start_step, end_step)
+            )
+
+        # Downsampling is done in two streaming passes over the metric file so that only the
+        # returned metrics are held in memory: the first pass finds the logged step range, the
+        # second one keeps the first metric (lowest step, then earliest timestamp) of each of the
+        # at most `max_points` equal-width step buckets.
+        num_points = 0
+        min_step = max_step = None
+        for metric in FileStore._iter_metric_history(parent_path, metric_key, start_step, end_step):
+            num_points += 1
+            min_step = metric.step if min_step is None else min(min_step, metric.step)
+            max_step = metric.step if max_step is None else max(max_step, metric.step)
+        sort_key = operator.attrgetter("step", "timestamp", "value")
+        if num_points <= max_points:
+            return sorted(
+                FileStore._iter_metric_history(parent_path, metric_key, start_step, end_step),
+                key=sort_key,
+            )
+        bucket_width = -(-(max_step - min_step + 1) // max_points)
+        bucket_metrics = {}
+        for metric in FileStore._iter_metric_history(parent_path, metric_key, start_step, end_step):
+            bucket = (metric.step - min_step) // bucket_width
+            if bucket not in bucket_metrics or sort_key(metric) < sort_key(bucket_metrics[bucket]):
+                bucket_metrics[bucket] = metric
+        return [bucket_metrics[bucket] for bucket in sorted(bucket_metrics)]
+
+    @staticmethod
+    def _iter_metric_history(parent_path, metric_key, start_step=None, end_step=None):
+        for line in iter_file_lines(parent_path, metric_key):
+            metric = FileStore._get_metric_from_line(metric_key, line)
+            if (start_step is None or metric.step >= start_step) and (
+                end_step is None or metric.step <= end_step
+            ):
+                yield metric
 
     @staticmethod
     def _get_param_from_file(parent_path, param_name):
@@ -692,30 +1066,51 @@ class FileStore(AbstractStore):
             and os.path.isdir(x),
             full_path=True,
         )
-        run_infos = []
-        for r_dir in run_dirs:
-            try:
-                # trap and warn known issues, will raise unexpected exceptions to caller
-                run_info = self._get_run_info_from_dir(r_dir)
-                if run_info.experiment_id != experiment_id:
-                    logging.warning(
-                        "Wrong experiment ID (%s) recorded for run '%s'. "
-                        "It should be %s. Run will be ignored.",
-                        str(run_info.experiment_id),
-                        str(run_info.run_id),
-                        str(experiment_id),
-                        exc_info=True,
-                    )
-                    continue
-                if LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage):
-                    run_infos.append(run_info)
-            except MissingConfigException as rnfe:
-                # trap malformed run exception and log warning
-                r_id = os.path.basename(r_dir)
+        run_infos = self._map_concurrently(
+            lambda r_dir: self._get_listed_run_info(r_dir, experiment_id), run_dirs
+        )
+        return [
+            run_info
+            for run_info in run_infos
+            if run_info is not None
+            and LifecycleStage.matches_view_type(view_type, run_info.lifecycle_stage)
+        ]
+
+    def _get_listed_run_info(self, run_dir, experiment_id):
+        """
+        Read the run info of a run listed under the given experiment. Return None if the run is
+        malformed or recorded under another experiment.
+        """
+        try:
+            # trap and warn known issues, will raise unexpected exceptions to caller
+            run_info = self._get_run_info_from_dir(run_dir)
+            if run_info.experiment_id != experiment_id:
                 logging.warning(
-                    "Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True
+                    "Wrong experiment ID (%s) recorded for run '%s'. "
+                    "It should be %s. Run will be ignored.",
+                    str(run_info.experiment_id),
+                    str(run_info.run_id),
+                    str(experiment_id),
+                    exc_info=True,
                 )
-        return run_infos
+                return None
+            return run_info
+        except MissingConfigException as rnfe:
+            # trap malformed run exception and log warning
+            r_id = os.path.basename(run_dir)
+            logging.warning("Malformed run '%s'. Detailed error %s", r_id, str(rnfe), exc_info=True)
+            return None
+
+    def _map_concurrently(self, func, items):
+        """
+        Apply ``func`` to every element of ``items`` on a pool of threads and return the results in
+        the order of ``items``. Reading runs is bound by file system latency rather than CPU, which
+        matters on network file systems such as NFS.
+        """
+        if self._run_loader_pool_size <= 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self._run_loader_pool_size, len(items))) as pool:
+            return list(pool.map(func, items))
 
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
@@ -726,15 +1121,89 @@ class FileStore(AbstractStore):
                 "most {}, but got value {}".format(SEARCH_MAX_RESULTS_THRESHOLD, max_results),
                 databricks_pb2.INVALID_PARAMETER_VALUE,
             )
+        # Filter clauses are evaluated in increasing order of the cost of reading the run data they
+        # depend on: attributes from the run metadata first, then params and tags, then metrics.
+        # Only the run data referenced by the filter or the ordering is read until the page of
+        # runs to return is known, so that the cost of a filtered search is proportional to the
+        # number of matching runs rather than to the number of runs in the experiments.
+        attribute_clauses, param_and_tag_clauses, metric_clauses = [], [], []
+        for clause in SearchUtils.parse_search_filter(filter_string):
+            key_type, comparator = clause["type"], clause["comparator"].upper()
+            if SearchUtils.is_attribute(key_type, comparator):
+                attribute_clauses.append(clause)
+            elif SearchUtils.is_param(key_type, comparator) or SearchUtils.is_tag(
+                key_type, comparator
+            ):
+                param_and_tag_clauses.append(clause)
+            else:
+                metric_clauses.append(clause)
+        referenced_keys = [(clause["type"], clause["key"]) for clause in param_and_tag_clauses]
+        referenced_keys += [(clause["type"], clause["key"]) for clause in metric_clauses]
+        referenced_keys += [
+            SearchUtils.parse_order_by_for_search_runs(order_by_clause)[:2]
+            for order_by_clause in order_by or []
+        ]
+        # `SearchUtils.is_*` also validates the comparator, any valid comparator can be passed
+        metric_keys = {
+            key for key_type, key in referenced_keys if SearchUtils.is_metric(key_type, "=")
+        }
+        param_keys = {
+            key for key_type, key in referenced_keys if SearchUtils.is_param(key_type, "=")
+        }
+        tag_keys = {key for key_type, key in referenced_keys if SearchUtils.is_tag(key_type, "=")}
+
         runs = []
         for experiment_id in experiment_ids:
-            run_infos = self._list_run_infos(experiment_id, run_view_type)
-            runs.extend(self._get_run_from_info(r) for r in run_infos)
-        filtered = SearchUtils.filter(runs, filter_string)
-        sorted_runs = SearchUtils.sort(filtered, order_by)
-        runs, next_page_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+            runs.extend(
+                Run(run_info, RunData())
+                for run_info in self._list_run_infos(experiment_id, run_view_type)
+            )
+        runs = SearchUtils.filter_parsed(
+            runs, attribute_clauses, columnar=len(runs) >= _COLUMNAR_SEARCH_MIN_RUNS
+        )
+        if param_keys or tag_keys:
+            runs = self._map_concurrently(
+                lambda run: self._get_run_with_data(run, param_keys=param_keys, tag_keys=tag_keys),
+                runs,
+            )
+            runs = SearchUtils.filter_parsed(
+                runs, param_and_tag_clauses, columnar=len(runs) >= _COLUMNAR_SEARCH_MIN_RUNS
+            )
+        if metric_keys:
+            runs = self._map_concurrently(
+                lambda run: self._get_run_with_data(run, metric_keys=metric_keys), runs
+            )
+            runs = SearchUtils.filter_parsed(
+                runs, metric_clauses, columnar=len(runs) >= _COLUMNAR_SEARCH_MIN_RUNS
+            )
+        runs, next_page_token = SearchUtils.sort_and_paginate(
+            runs,
+            order_by,
+            page_token,
+            max_results,
+            columnar=len(runs) >= _COLUMNAR_SEARCH_MIN_RUNS,
+        )
+        runs = self._map_concurrently(lambda run: self._get_run_from_info(run.info), runs)
         return runs, next_page_token
 
+    def _get_run_with_data(self, run, metric_keys=(), param_keys=(), tag_keys=()):
+        """
+        Return a copy of ``run`` whose data additionally contains the latest values of the metrics
+        with the given keys, and the params and tags with the given keys, if they were logged.
+        """
+        metrics = list(run.data._metric_objs)
+        params = [Param(key, value) for key, value in run.data.params.items()]
+        tags = [RunTag(key, value) for key, value in run.data.tags.items()]
+        for resource_type, keys, read_func, values in [
+            ("metric", metric_keys, FileStore._get_metric_from_file, metrics),
+            ("param", param_keys, FileStore._get_param_from_file, params),
+            ("tag", tag_keys, FileStore._get_tag_from_file, tags),
+        ]:
+            if keys:
+                parent_path, files = self._get_run_files(run.info, resource_type)
+                values.extend(read_func(parent_path, key) for key in keys.intersection(files))
+        return Run(run.info, RunData(metrics, params, tags))
+
     def log_metric(self, run_id, metric):
         _validate_run_id(run_id)
         _validate_metric_name(metric.key)
@@ -743,9 +1212,59 @@ class FileStore(AbstractStore):
         self._log_run_metric(run_info, metric)
 
     def _log_run_metric(self, run_info, metric):
-        metric_path = self._get_metric_path(run_info.experiment_id, run_info.run_id, metric.key)
+        _validate_metric_name(metric.key)
+        metric_line = "%s %s %s\n" % (metric.timestamp, metric.value, metric.step)
+        self._append_run_metric_lines(run_info, metric.key, metric_line, metric)
+
+    def log_metric_series(self, run_id, key, values, steps, timestamps):
+        _validate_run_id(run_id)
+        _validate_metric_series(key, values, steps, timestamps)
+        if len(values) == 0:
+            return
+        run_info = self._get_run_info(run_id)
+        check_run_is_active(run_info)
+        # The whole series is appended to the metric file with a single write
+        metric_lines = "".join(
+            "%s %s %s\n" % entry
+            for entry in zip(timestamps.tolist(), values.tolist(), steps.tolist())
+        )
+        latest = np.lexsort((values, timestamps, steps))[-1]
+        latest_metric = Metric(
+            key, float(values[latest]), int(timestamps[latest]), int(steps[latest])
+        )
+        self._append_run_metric_lines(run_info, key, metric_lines, latest_metric)
+
+    def _append_run_metric_lines(self, run_info, metric_key, metric_lines, logged_metric):
+        """
+        Append ``metric_lines`` to the file of the metric ``metric_key`` in the specified run, and
+        update the cached latest value of the metric with ``logged_metric``, the latest of the
+        appended values.
+        """
+        run_dir = self._get_run_dir(run_info.experiment_id, run_info.run_id)
+        metric_path = os.path.join(run_dir, FileStore.METRICS_FOLDER_NAME, metric_key)
         make_containing_dirs(metric_path)
-        append_to(metric_path, "%s %s %s\n" % (metric.timestamp, metric.value, metric.step))
+        latest_metric_path = FileStore._get_latest_metric_path(run_dir, metric_key)
+        if exists(metric_path):
+            metric_stat = os.stat(metric_path)
+            size = metric_stat.st_size
+            latest_metric = FileStore._read_latest_metric(
+                latest_metric_path, metric_key, metric_stat
+            )
+        else:
+            size = 0
+            latest_metric = logged_metric
+        append_to(metric_path, metric_lines)
+        if latest_metric is None:
+            # The cached latest value is stale, it will be recomputed on the next read
+            return
+        metric_stat = os.stat(metric_path)
+        # Only update the cached latest value if no other writer appended to the metric file
+        # concurrently, otherwise leave it stale
+        if metric_stat.st_size == size + len(metric_lines.encode("utf-8")):
+            latest_metric = max(
+                [latest_metric, logged_metric], key=lambda m: (m.step, m.timestamp, m.value)
+            )
+            FileStore._write_latest_metric(latest_metric_path, latest_metric, metric_stat)
 
     def _writeable_value(self, tag_value):
         if tag_value is None:
@@ -864,6 +1383,8 @@ class FileStore(AbstractStore):
             raise MlflowException(e, INTERNAL_ERROR)
 
     def record_logged_model(self, run_id, mlflow_model):
+        from mlflow.models import Model
+
         if not isinstance(mlflow_model, Model):
             raise TypeError(
                 "Argument 'mlflow_model' should be mlflow.models.Model, got '{}'".format(
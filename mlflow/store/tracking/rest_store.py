@@ -6,6 +6,7 @@ from mlflow.protos.service_pb2 import (
     MlflowService,
     GetExperiment,
     GetRun,
+    GetRuns,
     SearchRuns,
     ListExperiments,
     GetMetricHistory,
@@ -20,14 +21,15 @@ from mlflow.protos.service_pb2 import (
     RestoreExperiment,
     UpdateExperiment,
     LogBatch,
+    LogMetricSeries,
     LogModel,
     DeleteTag,
     SetExperimentTag,
     GetExperimentByName,
 )
 from mlflow.store.tracking.abstract_store import AbstractStore
-from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import call_endpoint, extract_api_info_for_service
+from mlflow.utils.validation import MAX_METRIC_SERIES_LENGTH_PER_REQUEST, MAX_RUN_IDS_PER_REQUEST
 
 _PATH_PREFIX = "/api/2.0"
 _METHOD_TO_INFO = extract_api_info_for_service(MlflowService, _PATH_PREFIX)
@@ -46,16 +48,16 @@ class RestStore(AbstractStore):
         super(RestStore, self).__init__()
         self.get_host_creds = get_host_creds
 
-    def _call_endpoint(self, api, json_body):
+    def _call_endpoint(self, api, req_body):
         endpoint, method = _METHOD_TO_INFO[api]
         response_proto = api.Response()
-        return call_endpoint(self.get_host_creds(), endpoint, method, json_body, response_proto)
+        return call_endpoint(self.get_host_creds(), endpoint, method, req_body, response_proto)
 
     def list_experiments(self, view_type=ViewType.ACTIVE_ONLY):
         """
         :return: a list of all known Experiment objects
         """
-        req_body = message_to_json(ListExperiments(view_type=view_type))
+        req_body = ListExperiments(view_type=view_type)
         response_proto = self._call_endpoint(ListExperiments, req_body)
         return [
             Experiment.from_proto(experiment_proto)
@@ -71,7 +73,7 @@ class RestStore(AbstractStore):
 
         :return: experiment_id (string) for the newly created experiment if successful, else None
         """
-        req_body = message_to_json(CreateExperiment(name=name, artifact_location=artifact_location))
+        req_body = CreateExperiment(name=name, artifact_location=artifact_location)
         response_proto = self._call_endpoint(CreateExperiment, req_body)
         return response_proto.experiment_id
 
@@ -84,22 +86,20 @@ class RestStore(AbstractStore):
         :return: A single :py:class:`mlflow.entities.Experiment` object if it exists,
         otherwise raises an Exception.
         """
-        req_body = message_to_json(GetExperiment(experiment_id=str(experiment_id)))
+        req_body = GetExperiment(experiment_id=str(experiment_id))
         response_proto = self._call_endpoint(GetExperiment, req_body)
         return Experiment.from_proto(response_proto.experiment)
 
     def delete_experiment(self, experiment_id):
-        req_body = message_to_json(DeleteExperiment(experiment_id=str(experiment_id)))
+        req_body = DeleteExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(DeleteExperiment, req_body)
 
     def restore_experiment(self, experiment_id):
-        req_body = message_to_json(RestoreExperiment(experiment_id=str(experiment_id)))
+        req_body = RestoreExperiment(experiment_id=str(experiment_id))
         self._call_endpoint(RestoreExperiment, req_body)
 
     def rename_experiment(self, experiment_id, new_name):
-        req_body = message_to_json(
-            UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
-        )
+        req_body = UpdateExperiment(experiment_id=str(experiment_id), new_name=new_name)
         self._call_endpoint(UpdateExperiment, req_body)
 
     def get_run(self, run_id):
@@ -110,15 +110,21 @@ class RestStore(AbstractStore):
 
         :return: A single Run object if it exists, otherwise raises an Exception
         """
-        req_body = message_to_json(GetRun(run_uuid=run_id, run_id=run_id))
+        req_body = GetRun(run_uuid=run_id, run_id=run_id)
         response_proto = self._call_endpoint(GetRun, req_body)
         return Run.from_proto(response_proto.run)
 
+    def get_runs(self, run_ids):
+        runs = []
+        for i in range(0, len(run_ids), MAX_RUN_IDS_PER_REQUEST):
+            req_body = GetRuns(run_ids=run_ids[i : i + MAX_RUN_IDS_PER_REQUEST])
+            response_proto = self._call_endpoint(GetRuns, req_body)
+            runs.extend(Run.from_proto(run) for run in response_proto.runs)
+        return runs
+
     def update_run_info(self, run_id, run_status, end_time):
         """ Updates the metadata of the specified run. """
-        req_body = message_to_json(
-            UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status, end_time=end_time)
-        )
+        req_body = UpdateRun(run_uuid=run_id, run_id=run_id, status=run_status, end_time=end_time)
         response_proto = self._call_endpoint(UpdateRun, req_body)
         return RunInfo.from_proto(response_proto.run_info)
 
@@ -134,13 +140,11 @@ class RestStore(AbstractStore):
         :return: The created Run object
         """
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
-            CreateRun(
-                experiment_id=str(experiment_id),
-                user_id=user_id,
-                start_time=start_time,
-                tags=tag_protos,
-            )
+        req_body = CreateRun(
+            experiment_id=str(experiment_id),
+            user_id=user_id,
+            start_time=start_time,
+            tags=tag_protos,
         )
         response_proto = self._call_endpoint(CreateRun, req_body)
         run = Run.from_proto(response_proto.run)
@@ -153,15 +157,13 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param metric: Metric instance to log
         """
-        req_body = message_to_json(
-            LogMetric(
-                run_uuid=run_id,
-                run_id=run_id,
-                key=metric.key,
-                value=metric.value,
-                timestamp=metric.timestamp,
-                step=metric.step,
-            )
+        req_body = LogMetric(
+            run_uuid=run_id,
+            run_id=run_id,
+            key=metric.key,
+            value=metric.value,
+            timestamp=metric.timestamp,
+            step=metric.step,
         )
         self._call_endpoint(LogMetric, req_body)
 
@@ -172,9 +174,7 @@ class RestStore(AbstractStore):
         :param run_id: String id for the run
         :param param: Param instance to log
         """
-        req_body = message_to_json(
-            LogParam(run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
-        )
+        req_body = LogParam(run_uuid=run_id, run_id=run_id, key=param.key, value=param.value)
         self._call_endpoint(LogParam, req_body)
 
     def set_experiment_tag(self, experiment_id, tag):
@@ -184,9 +184,7 @@ class RestStore(AbstractStore):
         :param experiment_id: String ID of the experiment
         :param tag: ExperimentRunTag instance to log
         """
-        req_body = message_to_json(
-            SetExperimentTag(experiment_id=experiment_id, key=tag.key, value=tag.value)
-        )
+        req_body = SetExperimentTag(experiment_id=experiment_id, key=tag.key, value=tag.value)
         self._call_endpoint(SetExperimentTag, req_body)
 
     def set_tag(self, run_id, tag):
@@ -196,9 +194,7 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param tag: RunTag instance to log
         """
-        req_body = message_to_json(
-            SetTag(run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
-        )
+        req_body = SetTag(run_uuid=run_id, run_id=run_id, key=tag.key, value=tag.value)
         self._call_endpoint(SetTag, req_body)
 
     def delete_tag(self, run_id, key):
@@ -207,20 +203,36 @@ class RestStore(AbstractStore):
         :param run_id: String ID of the run
         :param key: Name of the tag
         """
-        req_body = message_to_json(DeleteTag(run_id=run_id, key=key))
+        req_body = DeleteTag(run_id=run_id, key=key)
         self._call_endpoint(DeleteTag, req_body)
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(
+        self, run_id, metric_key, max_points=None, start_step=None, end_step=None
+    ):
         """
         Return all logged values for a given metric.
 
         :param run_id: Unique identifier for run
         :param metric_key: Metric name within the run
+        :param max_points: If specified, the maximum number of values to return. When more values
+                           were logged in the requested step range, the range is split into at
+                           most ``max_points`` equal-width step buckets and only the first value
+                           (lowest step, then earliest timestamp) of each bucket is returned,
+                           ordered by step.
+        :param start_step: If specified, only values logged at a step greater than or equal to
+                           ``start_step`` are returned.
+        :param end_step: If specified, only values logged at a step less than or equal to
+                         ``end_step`` are returned.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        req_body = message_to_json(
-            GetMetricHistory(run_uuid=run_id, run_id=run_id, metric_key=metric_key)
+        req_body = GetMetricHistory(
+            run_uuid=run_id,
+            run_id=run_id,
+            metric_key=metric_key,
+            max_points=max_points,
+            start_step=start_step,
+            end_step=end_step,
         )
         response_proto = self._call_endpoint(GetMetricHistory, req_body)
         return [Metric.from_proto(metric) for metric in response_proto.metrics]
@@ -237,7 +249,7 @@ class RestStore(AbstractStore):
             order_by=order_by,
             page_token=page_token,
         )
-        req_body = message_to_json(sr)
+        req_body = sr
         response_proto = self._call_endpoint(SearchRuns, req_body)
         runs = [Run.from_proto(proto_run) for proto_run in response_proto.runs]
         # If next_page_token is not set, we will see it as "". We need to convert this to None.
@@ -247,16 +259,16 @@ class RestStore(AbstractStore):
         return runs, next_page_token
 
     def delete_run(self, run_id):
-        req_body = message_to_json(DeleteRun(run_id=run_id))
+        req_body = DeleteRun(run_id=run_id)
         self._call_endpoint(DeleteRun, req_body)
 
     def restore_run(self, run_id):
-        req_body = message_to_json(RestoreRun(run_id=run_id))
+        req_body = RestoreRun(run_id=run_id)
         self._call_endpoint(RestoreRun, req_body)
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = GetExperimentByName(experiment_name=experiment_name)
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -278,13 +290,25 @@ class RestStore(AbstractStore):
         metric_protos = [metric.to_proto() for metric in metrics]
         param_protos = [param.to_proto() for param in params]
         tag_protos = [tag.to_proto() for tag in tags]
-        req_body = message_to_json(
-            LogBatch(metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id)
+        req_body = LogBatch(
+            metrics=metric_protos, params=param_protos, tags=tag_protos, run_id=run_id
         )
         self._call_endpoint(LogBatch, req_body)
 
+    def log_metric_series(self, run_id, key, values, steps, timestamps):
+        for i in range(0, len(values), MAX_METRIC_SERIES_LENGTH_PER_REQUEST):
+            chunk = slice(i, i + MAX_METRIC_SERIES_LENGTH_PER_REQUEST)
+            req_body = LogMetricSeries(
+                run_id=run_id,
+                key=key,
+                values=values[chunk].tolist(),
+                steps=steps[chunk].tolist(),
+                timestamps=timestamps[chunk].tolist(),
+            )
+            self._call_endpoint(LogMetricSeries, req_body)
+
     def record_logged_model(self, run_id, mlflow_model):
-        req_body = message_to_json(LogModel(run_id=run_id, model_json=mlflow_model.to_json()))
+        req_body = LogModel(run_id=run_id, model_json=mlflow_model.to_json())
         self._call_endpoint(LogModel, req_body)
 
 
@@ -299,7 +323,7 @@ class DatabricksRestStore(RestStore):
 
     def get_experiment_by_name(self, experiment_name):
         try:
-            req_body = message_to_json(GetExperimentByName(experiment_name=experiment_name))
+            req_body = GetExperimentByName(experiment_name=experiment_name)
             response_proto = self._call_endpoint(GetExperimentByName, req_body)
             return Experiment.from_proto(response_proto.experiment)
         except MlflowException as e:
@@ -3,13 +3,15 @@ import logging
 import uuid
 
 import math
+
+import numpy as np
 import sqlalchemy
 import sqlalchemy.sql.expression as sql
+from sqlalchemy.dialects import mysql, postgresql
 
 from mlflow.entities.lifecycle_stage import LifecycleStage
-from mlflow.models import Model
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_THRESHOLD
-from mlflow.store.db.db_types import MYSQL, MSSQL
+from mlflow.store.db.db_types import MYSQL, MSSQL, POSTGRES, SQLITE
 import mlflow.store.db.utils
 from mlflow.store.tracking.dbmodels.models import (
     SqlExperiment,
@@ -42,6 +44,8 @@ from mlflow.utils.validation import (
     _validate_batch_log_data,
     _validate_run_id,
     _validate_metric,
+    _validate_metric_history_params,
+    _validate_metric_series,
     _validate_experiment_tag,
     _validate_tag,
 )
@@ -49,6 +53,18 @@ from mlflow.utils.mlflow_tags import MLFLOW_LOGGED_MODELS
 
 _logger = logging.getLogger(__name__)
 
+# Maximum number of metric keys referenced by a single ``IN`` clause when looking up existing
+# entries during batch logging. This keeps the number of bound parameters per statement well
+# below the limits imposed by some databases (e.g. SQLite's default of 999).
+_MAX_KEYS_PER_QUERY = 100
+
+# Maximum number of run IDs referenced by a single ``IN`` clause when fetching several runs, for
+# the same reason
+_MAX_RUN_IDS_PER_QUERY = 500
+
+# Minimum SQLite version supporting ``INSERT ... ON CONFLICT DO UPDATE`` (upsert) statements
+_SQLITE_MIN_UPSERT_VERSION = (3, 24, 0)
+
 # For each database table, fetch its columns and define an appropriate attribute for each column
 # on the table's associated object representation (Mapper). This is necessary to ensure that
 # columns defined via backreference are available as Mapper instance attributes (e.g.,
@@ -473,6 +489,29 @@ class SqlAlchemyStore(AbstractStore):
             run = self._get_run(run_uuid=run_id, session=session, eager=True)
             return run.to_mlflow_entity()
 
+    def get_runs(self, run_ids):
+        unique_run_ids = list(set(run_ids))
+        runs = {}
+        with self.ManagedSessionMaker() as session:
+            # Fetch the runs with one query per chunk of run IDs, rather than one per run, eagerly
+            # loading their summary metrics, params, and tags like ``get_run``
+            for i in range(0, len(unique_run_ids), _MAX_RUN_IDS_PER_QUERY):
+                sql_runs = (
+                    session.query(SqlRun)
+                    .options(*self._get_eager_run_query_options())
+                    .filter(SqlRun.run_uuid.in_(unique_run_ids[i : i + _MAX_RUN_IDS_PER_QUERY]))
+                    .all()
+                )
+                for sql_run in sql_runs:
+                    runs[sql_run.run_uuid] = sql_run.to_mlflow_entity()
+        missing_run_ids = [run_id for run_id in unique_run_ids if run_id not in runs]
+        if missing_run_ids:
+            raise MlflowException(
+                "Runs with ids={} not found".format(", ".join(sorted(missing_run_ids))),
+                RESOURCE_DOES_NOT_EXIST,
+            )
+        return [runs[run_id] for run_id in run_ids]
+
     def restore_run(self, run_id):
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
@@ -507,14 +546,7 @@ class SqlAlchemyStore(AbstractStore):
 
     def log_metric(self, run_id, metric):
         _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
-        is_nan = math.isnan(metric.value)
-        if is_nan:
-            value = 0
-        elif math.isinf(metric.value):
-            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
-            value = 1.7976931348623157e308 if metric.value > 0 else -1.7976931348623157e308
-        else:
-            value = metric.value
+        value, is_nan = self._get_sql_metric_value(metric.value)
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
@@ -533,7 +565,106 @@ class SqlAlchemyStore(AbstractStore):
             # already present in the ``metrics`` table. If the logged metric was already present,
             # we assume that the ``latest_metrics`` table already accounts for its presence
             if just_created:
+                self._update_latest_metrics_if_necessary([logged_metric], session)
+
+    @staticmethod
+    def _get_sql_metric_value(metric_value):
+        """
+        :return: A tuple ``(value, is_nan)`` containing a representation of ``metric_value`` that
+                 can be stored in the ``value`` column of the ``metrics`` table, along with a
+                 flag indicating whether ``metric_value`` is NaN.
+        """
+        if math.isnan(metric_value):
+            return 0, True
+        elif math.isinf(metric_value):
+            #  NB: Sql can not represent Infs = > We replace +/- Inf with max/min 64b float value
+            return (1.7976931348623157e308 if metric_value > 0 else -1.7976931348623157e308), False
+        else:
+            return metric_value, False
+
+    def _update_latest_metrics_if_necessary(self, logged_metrics, session):
+        """
+        Update the ``latest_metrics`` table with the specified ``SqlMetric`` objects, which must
+        contain at most one entry per metric key. The latest value of a metric key is replaced
+        only if the logged metric is strictly more recent, as determined by ``step``,
+        ``timestamp``, and ``value``.
+
+        On PostgreSQL, MySQL, and SQLite >= 3.24, this is done with a single conditional upsert
+        statement per metric key rather than by locking and reading the current latest value.
+        """
+        if not logged_metrics:
+            return
+        upsert_statement = self._get_latest_metrics_upsert_statement()
+        if upsert_statement is None:
+            for logged_metric in logged_metrics:
                 self._update_latest_metric_if_necessary(logged_metric, session)
+            return
+        session.execute(
+            upsert_statement,
+            [
+                {
+                    "run_uuid": m.run_uuid,
+                    "key": m.key,
+                    "value": m.value,
+                    "timestamp": m.timestamp,
+                    "step": m.step,
+                    "is_nan": m.is_nan,
+                }
+                for m in logged_metrics
+            ],
+        )
+
+    def _get_latest_metrics_upsert_statement(self):
+        """
+        :return: A dialect-specific ``INSERT`` statement for the ``latest_metrics`` table that
+                 only overwrites an existing row if the inserted ``(step, timestamp, value)``
+                 tuple is greater than that of the existing row, or ``None`` if the database
+                 does not support such a statement.
+        """
+        table = SqlLatestMetric.__table__
+        if self.db_type == POSTGRES:
+            insert_statement = postgresql.insert(table)
+            excluded = insert_statement.excluded
+            return insert_statement.on_conflict_do_update(
+                index_elements=[table.c.key, table.c.run_uuid],
+                set_={col: excluded[col] for col in ("value", "timestamp", "step", "is_nan")},
+                where=sqlalchemy.tuple_(excluded.step, excluded.timestamp, excluded.value)
+                > sqlalchemy.tuple_(table.c.step, table.c.timestamp, table.c.value),
+            )
+        elif self.db_type == MYSQL:
+            # SQLAlchemy only renders ``VALUES(<column>)`` for inserted columns that are used
+            # directly as update values, so the inserted columns are referenced explicitly here
+            def inserted(col):
+                return sql.literal_column("VALUES({})".format(col))
+
+            is_newer = sqlalchemy.tuple_(
+                inserted("step"), inserted("timestamp"), inserted("value")
+            ) > sqlalchemy.tuple_(table.c.step, table.c.timestamp, table.c.value)
+            # MySQL evaluates the assignments from left to right, and each assignment observes
+            # the columns updated by the previous ones. Assigning ``is_nan``, ``value``,
+            # ``timestamp`` and ``step`` in this order keeps ``is_newer`` correct: once a column
+            # has been updated, ``is_newer`` can only become false for subsequent columns whose
+            # existing and inserted values are already equal.
+            return mysql.insert(table).on_duplicate_key_update(
+                [
+                    (col, sql.case([(is_newer, inserted(col))], else_=table.c[col]))
+                    for col in ("is_nan", "value", "timestamp", "step")
+                ]
+            )
+        elif (
+            self.db_type == SQLITE
+            and self.engine.dialect.server_version_info >= _SQLITE_MIN_UPSERT_VERSION
+        ):
+            # SQLAlchemy does not provide an ``INSERT ... ON CONFLICT`` construct for SQLite
+            return sql.text(
+                "INSERT INTO latest_metrics (key, value, timestamp, step, is_nan, run_uuid) "
+                "VALUES (:key, :value, :timestamp, :step, :is_nan, :run_uuid) "
+                "ON CONFLICT (key, run_uuid) DO UPDATE SET value = excluded.value, "
+                "timestamp = excluded.timestamp, step = excluded.step, is_nan = excluded.is_nan "
+                "WHERE (excluded.step, excluded.timestamp, excluded.value) > "
+                "(latest_metrics.step, latest_metrics.timestamp, latest_metrics.value)"
+            )
+        return None
 
     @staticmethod
     def _update_latest_metric_if_necessary(logged_metric, session):
@@ -572,9 +703,54 @@ class SqlAlchemyStore(AbstractStore):
                 )
             )
 
-    def get_metric_history(self, run_id, metric_key):
+    def get_metric_history(
+        self, run_id, metric_key, max_points=None, start_step=None, end_step=None
+    ):
+        _validate_metric_history_params(max_points, start_step, end_step)
         with self.ManagedSessionMaker() as session:
-            metrics = session.query(SqlMetric).filter_by(run_uuid=run_id, key=metric_key).all()
+            query_filters = [SqlMetric.run_uuid == run_id, SqlMetric.key == metric_key]
+            if start_step is not None:
+                query_filters.append(SqlMetric.step >= start_step)
+            if end_step is not None:
+                query_filters.append(SqlMetric.step <= end_step)
+            if max_points is None:
+                metrics = session.query(SqlMetric).filter(*query_filters).all()
+                return [metric.to_mlflow_entity() for metric in metrics]
+
+            num_points, min_step, max_step = (
+                session.query(
+                    sqlalchemy.func.count(SqlMetric.step),
+                    sqlalchemy.func.min(SqlMetric.step),
+                    sqlalchemy.func.max(SqlMetric.step),
+                )
+                .filter(*query_filters)
+                .one()
+            )
+            history_query = session.query(SqlMetric).filter(*query_filters)
+            if num_points > max_points:
+                # Split the step range into at most `max_points` buckets of equal width and only
+                # fetch the metrics logged at the lowest step of each bucket
+                bucket_width = -(-(max_step - min_step + 1) // max_points)
+                bucket = (SqlMetric.step - min_step) / bucket_width
+                if self.db_type == MYSQL:
+                    # MySQL performs decimal division on integers
+                    bucket = sqlalchemy.func.floor(bucket)
+                bucket_steps = (
+                    session.query(sqlalchemy.func.min(SqlMetric.step))
+                    .filter(*query_filters)
+                    .group_by(bucket)
+                )
+                history_query = history_query.filter(SqlMetric.step.in_(bucket_steps.subquery()))
+            metrics = history_query.order_by(
+                SqlMetric.step, SqlMetric.timestamp, SqlMetric.value
+            ).all()
+            if num_points > max_points:
+                # Several values may have been logged at the same step, keep the earliest one
+                metrics = [
+                    metric
+                    for i, metric in enumerate(metrics)
+                    if i == 0 or metric.step != metrics[i - 1].step
+                ]
             return [metric.to_mlflow_entity() for metric in metrics]
 
     def log_param(self, run_id, param):
@@ -681,11 +857,16 @@ class SqlAlchemyStore(AbstractStore):
     def _search_runs(
         self, experiment_ids, filter_string, run_view_type, max_results, order_by, page_token
     ):
-        def compute_next_token(current_size):
+        def compute_next_token(runs):
             next_token = None
-            if max_results == current_size:
+            if max_results == len(runs):
                 final_offset = offset + max_results
-                next_token = SearchUtils.create_page_token(final_offset)
+                # Record the sort key values of the last run so that the next page can be fetched
+                # with a keyset predicate rather than by scanning and discarding earlier rows
+                last_sort_key = (
+                    [get_value(runs[-1]) for _, _, get_value in keyset_columns] if runs else None
+                )
+                next_token = SearchUtils.create_page_token(final_offset, last_sort_key)
 
             return next_token
 
@@ -704,7 +885,7 @@ class SqlAlchemyStore(AbstractStore):
             # ``run.to_mlflow_entity()``, so eager loading helps avoid additional database queries
             # that are otherwise executed at attribute access time under a lazy loading model.
             parsed_filters = SearchUtils.parse_search_filter(filter_string)
-            parsed_orderby, sorting_joins = _get_orderby_clauses(order_by, session)
+            parsed_orderby, sorting_joins, keyset_columns = _get_orderby_clauses(order_by, session)
 
             query = session.query(SqlRun)
             for j in _get_sqlalchemy_filter_clauses(parsed_filters, session):
@@ -716,7 +897,8 @@ class SqlAlchemyStore(AbstractStore):
                 query = query.outerjoin(j)
 
             offset = SearchUtils.parse_start_offset_from_page_token(page_token)
-            queried_runs = (
+            last_sort_key = SearchUtils.parse_sort_key_from_page_token(page_token)
+            query = (
                 query.distinct()
                 .options(*self._get_eager_run_query_options())
                 .filter(
@@ -725,13 +907,18 @@ class SqlAlchemyStore(AbstractStore):
                     *_get_attributes_filtering_clauses(parsed_filters)
                 )
                 .order_by(*parsed_orderby)
-                .offset(offset)
-                .limit(max_results)
-                .all()
             )
+            if last_sort_key is not None:
+                query = query.filter(
+                    _get_keyset_filtering_clause(keyset_columns, last_sort_key, self.db_type)
+                )
+            else:
+                # Page tokens that only contain an offset are still supported
+                query = query.offset(offset)
+            queried_runs = query.limit(max_results).all()
 
             runs = [run.to_mlflow_entity() for run in queried_runs]
-            next_page_token = compute_next_token(len(runs))
+            next_page_token = compute_next_token(runs)
 
         return runs, next_page_token
 
@@ -739,22 +926,226 @@ class SqlAlchemyStore(AbstractStore):
         _validate_run_id(run_id)
         _validate_batch_log_data(metrics, params, tags)
         _validate_batch_log_limits(metrics, params, tags)
+        # All entities are written within a single transaction: the run is fetched and checked
+        # once, and params, metrics and tags are each written with a bulk INSERT rather than
+        # with one session (and one commit) per entity. If any write fails, nothing is logged.
         with self.ManagedSessionMaker() as session:
             run = self._get_run(run_uuid=run_id, session=session)
             self._check_run_is_active(run)
-        try:
-            for param in params:
-                self.log_param(run_id, param)
-            for metric in metrics:
-                self.log_metric(run_id, metric)
-            for tag in tags:
-                self.set_tag(run_id, tag)
-        except MlflowException as e:
-            raise e
-        except Exception as e:
-            raise MlflowException(e, INTERNAL_ERROR)
+            try:
+                self._log_params(session, run_id, params)
+                self._log_metrics(session, run_id, metrics)
+                self._set_tags(session, run_id, tags)
+            except MlflowException as e:
+                raise e
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+
+    @staticmethod
+    def _log_params(session, run_id, params):
+        """
+        Bulk insert ``params`` for the specified run within ``session``. Params that have already
+        been logged with the same value are skipped; attempting to change the value of a param
+        raises an ``MlflowException``.
+        """
+        if not params:
+            return
+        new_params = {}
+        for param in params:
+            if param.key in new_params and new_params[param.key] != param.value:
+                raise MlflowException(
+                    "Changing param values is not allowed. Param with key='{}' was already"
+                    " logged with value='{}' for run ID='{}'. Attempted logging new value"
+                    " '{}'.".format(param.key, new_params[param.key], run_id, param.value),
+                    INVALID_PARAMETER_VALUE,
+                )
+            new_params[param.key] = param.value
+
+        existing_params = (
+            session.query(SqlParam.key, SqlParam.value)
+            .filter(SqlParam.run_uuid == run_id, SqlParam.key.in_(list(new_params.keys())))
+            .all()
+        )
+        for key, old_value in existing_params:
+            if new_params[key] != old_value:
+                raise MlflowException(
+                    "Changing param values is not allowed. Param with key='{}' was already"
+                    " logged with value='{}' for run ID='{}'. Attempted logging new value"
+                    " '{}'.".format(key, old_value, run_id, new_params[key]),
+                    INVALID_PARAMETER_VALUE,
+                )
+            del new_params[key]
+
+        session.bulk_insert_mappings(
+            SqlParam,
+            [{"run_uuid": run_id, "key": key, "value": value} for key, value in new_params.items()],
+        )
+
+    def _log_metrics(self, session, run_id, metrics):
+        """
+        Bulk insert ``metrics`` for the specified run within ``session`` and update the
+        ``latest_metrics`` table once per metric key. Metric entries that are already present in
+        the ``metrics`` table are skipped, consistent with ``log_metric``.
+        """
+        if not metrics:
+            return
+        new_metrics = {}
+        for metric in metrics:
+            value, is_nan = self._get_sql_metric_value(metric.value)
+            sql_metric = SqlMetric(
+                run_uuid=run_id,
+                key=metric.key,
+                value=value,
+                timestamp=metric.timestamp,
+                step=metric.step,
+                is_nan=is_nan,
+            )
+            pk = (sql_metric.key, sql_metric.timestamp, sql_metric.step, value, is_nan)
+            new_metrics.setdefault(pk, sql_metric)
+
+        # Only fetch the existing metric history that overlaps with the batch (by key, timestamp
+        # and step range) to filter out metric entries that were previously logged
+        keys = list({m.key for m in new_metrics.values()})
+        timestamps = [m.timestamp for m in new_metrics.values()]
+        steps = [m.step for m in new_metrics.values()]
+        for i in range(0, len(keys), _MAX_KEYS_PER_QUERY):
+            existing_metrics = (
+                session.query(
+                    SqlMetric.key,
+                    SqlMetric.timestamp,
+                    SqlMetric.step,
+                    SqlMetric.value,
+                    SqlMetric.is_nan,
+                )
+                .filter(
+                    SqlMetric.run_uuid == run_id,
+                    SqlMetric.key.in_(keys[i : i + _MAX_KEYS_PER_QUERY]),
+                    SqlMetric.timestamp.between(min(timestamps), max(timestamps)),
+                    SqlMetric.step.between(min(steps), max(steps)),
+                )
+                .all()
+            )
+            for existing_metric in existing_metrics:
+                new_metrics.pop(tuple(existing_metric), None)
+        if not new_metrics:
+            return
+
+        session.bulk_insert_mappings(
+            SqlMetric,
+            [
+                {
+                    "run_uuid": m.run_uuid,
+                    "key": m.key,
+                    "value": m.value,
+                    "timestamp": m.timestamp,
+                    "step": m.step,
+                    "is_nan": m.is_nan,
+                }
+                for m in new_metrics.values()
+            ],
+        )
+
+        latest_metrics = {}
+        for m in new_metrics.values():
+            latest = latest_metrics.get(m.key)
+            if latest is None or (m.step, m.timestamp, m.value) > (
+                latest.step,
+                latest.timestamp,
+                latest.value,
+            ):
+                latest_metrics[m.key] = m
+        self._update_latest_metrics_if_necessary(list(latest_metrics.values()), session)
+
+    def log_metric_series(self, run_id, key, values, steps, timestamps):
+        _validate_run_id(run_id)
+        _validate_metric_series(key, values, steps, timestamps)
+        if len(values) == 0:
+            return
+        # NaN and +/- Inf values are stored as in ``log_metric``
+        is_nan = np.isnan(values)
+        sql_values = np.clip(
+            np.where(is_nan, 0, values), -1.7976931348623157e308, 1.7976931348623157e308
+        )
+        new_entries = dict.fromkeys(
+            zip(timestamps.tolist(), steps.tolist(), sql_values.tolist(), is_nan.tolist())
+        )
+        latest = np.lexsort((sql_values, timestamps, steps))[-1]
+        with self.ManagedSessionMaker() as session:
+            run = self._get_run(run_uuid=run_id, session=session)
+            self._check_run_is_active(run)
+            try:
+                # Metric entries that are already present in the ``metrics`` table are skipped,
+                # consistent with ``log_metric``
+                existing_entries = (
+                    session.query(
+                        SqlMetric.timestamp, SqlMetric.step, SqlMetric.value, SqlMetric.is_nan
+                    )
+                    .filter(
+                        SqlMetric.run_uuid == run_id,
+                        SqlMetric.key == key,
+                        SqlMetric.timestamp.between(int(timestamps.min()), int(timestamps.max())),
+                        SqlMetric.step.between(int(steps.min()), int(steps.max())),
+                    )
+                    .all()
+                )
+                for existing_entry in existing_entries:
+                    new_entries.pop(tuple(existing_entry), None)
+                if not new_entries:
+                    return
+                # A single executemany INSERT through the SQLAlchemy Core, which avoids creating
+                # an ORM object per value
+                session.execute(
+                    SqlMetric.__table__.insert(),
+                    [
+                        {
+                            "run_uuid": run_id,
+                            "key": key,
+                            "value": value,
+                            "timestamp": timestamp,
+                            "step": step,
+                            "is_nan": nan,
+                        }
+                        for timestamp, step, value, nan in new_entries
+                    ],
+                )
+                latest_metric = SqlMetric(
+                    run_uuid=run_id,
+                    key=key,
+                    value=float(sql_values[latest]),
+                    timestamp=int(timestamps[latest]),
+                    step=int(steps[latest]),
+                    is_nan=bool(is_nan[latest]),
+                )
+                self._update_latest_metrics_if_necessary([latest_metric], session)
+            except MlflowException as e:
+                raise e
+            except Exception as e:
+                raise MlflowException(e, INTERNAL_ERROR)
+
+    @staticmethod
+    def _set_tags(session, run_id, tags):
+        """
+        Set ``tags`` on the specified run within ``session``, inserting new tags in bulk and
+        overwriting the values of existing tags. If a key is repeated, the last value wins.
+        """
+        if not tags:
+            return
+        new_tags = {tag.key: tag.value for tag in tags}
+        existing_tags = (
+            session.query(SqlTag)
+            .filter(SqlTag.run_uuid == run_id, SqlTag.key.in_(list(new_tags.keys())))
+            .all()
+        )
+        for existing_tag in existing_tags:
+            existing_tag.value = new_tags.pop(existing_tag.key)
+        session.bulk_insert_mappings(
+            SqlTag,
+            [{"run_uuid": run_id, "key": key, "value": value} for key, value in new_tags.items()],
+        )
 
     def record_logged_model(self, run_id, mlflow_model):
+        from mlflow.models import Model
+
         if not isinstance(mlflow_model, Model):
             raise TypeError(
                 "Argument 'mlflow_model' should be mlflow.models.Model, got '{}'".format(
@@ -840,10 +1231,18 @@ def _get_sqlalchemy_filter_clauses(parsed, session):
 def _get_orderby_clauses(order_by_list, session):
     """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
     Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
+
+    :return: A tuple ``(clauses, ordering_joins, keyset_columns)``. ``clauses`` are the
+             ``ORDER BY`` clauses, ``ordering_joins`` are subqueries that must be outer-joined to
+             the runs table, and ``keyset_columns`` is a list of
+             ``(expression, ascending, get_value)`` tuples describing the full sort key, where
+             ``get_value`` extracts the value of ``expression`` from a
+             :py:class:`mlflow.entities.Run`. ``keyset_columns`` is used for keyset pagination.
     """
 
     clauses = []
     ordering_joins = []
+    keyset_columns = []
     clause_id = 0
     observed_order_by_clauses = set()
     # contrary to filters, it is not easily feasible to separately handle sorting
@@ -880,15 +1279,12 @@ def _get_orderby_clauses(order_by_list, session):
             # same main query, the CASE WHEN columns need to have unique names to
             # avoid ambiguity
             if SearchUtils.is_metric(key_type, "="):
-                clauses.append(
-                    sql.case(
-                        [(subquery.c.is_nan.is_(True), 1), (order_value.is_(None), 1)], else_=0
-                    ).label("clause_%s" % clause_id)
+                case = sql.case(
+                    [(subquery.c.is_nan.is_(True), 1), (order_value.is_(None), 1)], else_=0
                 )
             else:  # other entities do not have an 'is_nan' field
-                clauses.append(
-                    sql.case([(order_value.is_(None), 1)], else_=0).label("clause_%s" % clause_id)
-                )
+                case = sql.case([(order_value.is_(None), 1)], else_=0)
+            clauses.append(case.label("clause_%s" % clause_id))
 
             if (key_type, key) in observed_order_by_clauses:
                 raise MlflowException(
@@ -901,7 +1297,86 @@ def _get_orderby_clauses(order_by_list, session):
             else:
                 clauses.append(order_value.desc())
 
+            get_flag, get_value = _get_sort_value_getters(key_type, key)
+            keyset_columns.append((case, True, get_flag))
+            keyset_columns.append((order_value, ascending, get_value))
+
     if (SearchUtils._ATTRIBUTE_IDENTIFIER, SqlRun.start_time.key) not in observed_order_by_clauses:
         clauses.append(SqlRun.start_time.desc())
+        keyset_columns.append((SqlRun.start_time, False, lambda run: run.info.start_time))
     clauses.append(SqlRun.run_uuid)
-    return clauses, ordering_joins
+    keyset_columns.append((SqlRun.run_uuid, True, lambda run: run.info.run_id))
+    return clauses, ordering_joins, keyset_columns
+
+
+def _get_sort_value_getters(key_type, key):
+    """
+    :return: A pair of functions that respectively return, for a :py:class:`mlflow.entities.Run`,
+             the value of the ``CASE`` sort clause for the specified sort key (``1`` if the value
+             is missing or NaN, ``0`` otherwise) and the value stored in the database for the
+             sort key (``None`` if the run has no such value).
+    """
+    if SearchUtils.is_metric(key_type, "="):
+
+        def get_metric_flag(run):
+            value = run.data.metrics.get(key)
+            return 1 if value is None or math.isnan(value) else 0
+
+        def get_metric_value(run):
+            value = run.data.metrics.get(key)
+            # NaN metric values are stored as 0 along with an ``is_nan`` flag
+            return 0 if value is not None and math.isnan(value) else value
+
+        return get_metric_flag, get_metric_value
+    elif SearchUtils.is_param(key_type, "="):
+
+        def get_value(run):
+            return run.data.params.get(key)
+
+    elif SearchUtils.is_tag(key_type, "="):
+
+        def get_value(run):
+            return run.data.tags.get(key)
+
+    else:
+
+        def get_value(run):
+            return getattr(run.info, key)
+
+    return (lambda run: 1 if get_value(run) is None else 0), get_value
+
+
+def _get_keyset_filtering_clause(keyset_columns, last_sort_key, db_type):
+    """
+    Creates a clause selecting the rows that come strictly after the row with sort key
+    ``last_sort_key`` in the ordering described by ``keyset_columns`` (see
+    ``_get_orderby_clauses``), i.e.
+    ``(c1 > v1) OR (c1 = v1 AND c2 > v2) OR (c1 = v1 AND c2 = v2 AND c3 > v3) ...``, where ``>``
+    is replaced by ``<`` for descending columns and NULL values are placed according to the
+    default NULL ordering of the database.
+    """
+    if len(last_sort_key) != len(keyset_columns):
+        raise MlflowException(
+            "Invalid page token, the sort key %s does not match the requested ordering"
+            % last_sort_key,
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    # PostgreSQL sorts NULL values after non-NULL values in ascending order, while MySQL, SQLite
+    # and MSSQL sort them first
+    nulls_first_when_ascending = db_type != POSTGRES
+
+    clauses = []
+    equalities = []
+    for (column, ascending, _), value in zip(keyset_columns, last_sort_key):
+        nulls_after_values = ascending != nulls_first_when_ascending
+        if value is None:
+            after = column.isnot(None) if not nulls_after_values else sql.false()
+            equal = column.is_(None)
+        else:
+            after = column > value if ascending else column < value
+            if nulls_after_values:
+                after = sql.or_(after, column.is_(None))
+            equal = column == value
+        clauses.append(sql.and_(*(equalities + [after])))
+        equalities.append(equal)
+    return sql.or_(*clauses)
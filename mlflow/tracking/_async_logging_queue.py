@@ -0,0 +1,155 @@
+"""
+Internal module implementing the queue used by the fluent API to log metrics, params and tags
+asynchronously. Logged entries are sent to the tracking store by a background thread, which
+coalesces consecutive entries of a run into ``log_batch`` calls.
+"""
+import logging
+import os
+import threading
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.utils.validation import (
+    MAX_ENTITIES_PER_BATCH,
+    MAX_METRICS_PER_BATCH,
+    MAX_PARAMS_TAGS_PER_BATCH,
+)
+
+_logger = logging.getLogger(__name__)
+
+
+class AsyncLoggingQueue(object):
+    """
+    Queue of metrics, params and tags to log to runs, which are sent by a background thread.
+
+    :param log_batch_fn: Function called by the background thread to log a batch of entities,
+                         with a destination returned by the caller of ``log`` (e.g. a tracking URI),
+                         a run ID, and lists of metrics, params and tags.
+    """
+
+    def __init__(self, log_batch_fn):
+        self._log_batch_fn = log_batch_fn
+        self._reset()
+        if hasattr(os, "register_at_fork"):
+            # The entries queued by the parent process are sent by the parent process
+            os.register_at_fork(after_in_child=self._reset)
+
+    def _reset(self):
+        self._condition = threading.Condition()
+        # Queued ``(destination, run_id, entity)`` tuples, in logging order
+        self._entries = []
+        # Number of entries queued and sent since the queue was created. Entries are sent in
+        # logging order, so an entry has been sent once ``_num_sent`` reaches its sequence number.
+        self._num_queued = 0
+        self._num_sent = 0
+        # Sequence number of the last entry queued for each ``(destination, run_id)``, and errors
+        # raised while sending the entries of each ``(destination, run_id)``
+        self._last_queued = {}
+        self._errors = {}
+        self._thread = None
+        self._pid = os.getpid()
+
+    def log(self, destination, run_id, metrics=(), params=(), tags=()):
+        """
+        Queue metrics, params and tags to log to a run, and return without waiting for them to be
+        sent. Errors are raised by the next call to ``flush``.
+        """
+        if self._pid != os.getpid():
+            # ``os.register_at_fork`` is not available before Python 3.7
+            self._reset()
+        with self._condition:
+            for entities in (metrics, params, tags):
+                self._entries.extend((destination, run_id, entity) for entity in entities)
+            self._num_queued += len(metrics) + len(params) + len(tags)
+            self._last_queued[(destination, run_id)] = self._num_queued
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._send_entries, name="MlflowAsyncLoggingQueue"
+                )
+                self._thread.daemon = True
+                self._thread.start()
+            self._condition.notify_all()
+
+    def flush(self, run_id=None):
+        """
+        Wait until the entries queued before the call are sent. If some of them failed to be sent
+        since the last call to ``flush``, raise the first error and log the others.
+
+        :param run_id: If specified, only wait for the entries of this run and only raise their
+                       errors, so that the runs logged by other threads are not affected.
+        """
+        if self._pid != os.getpid():
+            self._reset()
+
+        def matches(key):
+            return run_id is None or key[1] == run_id
+
+        with self._condition:
+            # Entries queued after the call are not waited for, so that the call returns even if
+            # other threads keep logging
+            target = max(
+                [num_queued for key, num_queued in self._last_queued.items() if matches(key)],
+                default=0,
+            )
+            while self._num_sent < target:
+                self._condition.wait()
+            for key in [key for key, num_queued in self._last_queued.items() if matches(key)]:
+                if self._last_queued[key] <= self._num_sent:
+                    del self._last_queued[key]
+            errors = []
+            for key in [key for key in self._errors if matches(key)]:
+                errors.extend(self._errors.pop(key))
+        for error in errors[1:]:
+            _logger.error("Failed to log metrics, params or tags asynchronously: %s", error)
+        if errors:
+            raise errors[0]
+
+    def _next_batch(self):
+        """
+        Remove the longest prefix of the queued entries that can be logged with a single
+        ``log_batch`` call from the queue, and return it as a ``(destination, run_id, metrics,
+        params, tags)`` tuple. Batches are cut at the batch size limits, and before a param or a
+        tag that is already in the batch, so that a later value of a tag overrides an earlier one.
+        """
+        destination, run_id, _ = self._entries[0]
+        metrics, params, tags = [], [], []
+        param_keys, tag_keys = set(), set()
+        size = 0
+        for entry_destination, entry_run_id, entity in self._entries:
+            if (entry_destination, entry_run_id) != (destination, run_id):
+                break
+            if size == MAX_ENTITIES_PER_BATCH:
+                break
+            if isinstance(entity, Metric):
+                if len(metrics) == MAX_METRICS_PER_BATCH:
+                    break
+                metrics.append(entity)
+            elif isinstance(entity, Param):
+                if len(params) == MAX_PARAMS_TAGS_PER_BATCH or entity.key in param_keys:
+                    break
+                param_keys.add(entity.key)
+                params.append(entity)
+            elif isinstance(entity, RunTag):
+                if len(tags) == MAX_PARAMS_TAGS_PER_BATCH or entity.key in tag_keys:
+                    break
+                tag_keys.add(entity.key)
+                tags.append(entity)
+            size += 1
+        del self._entries[:size]
+        return destination, run_id, metrics, params, tags
+
+    def _send_entries(self):
+        while True:
+            with self._condition:
+                while not self._entries:
+                    self._condition.wait()
+                batch = self._next_batch()
+            destination, run_id, metrics, params, tags = batch
+            try:
+                self._log_batch_fn(*batch)
+            except Exception as e:  # pylint: disable=broad-except
+                with self._condition:
+                    self._errors.setdefault((destination, run_id), []).append(e)
+            finally:
+                with self._condition:
+                    self._num_sent += len(metrics) + len(params) + len(tags)
+                    self._condition.notify_all()
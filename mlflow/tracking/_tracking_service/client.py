@@ -6,9 +6,12 @@ exposed in the :py:mod:`mlflow.tracking` module.
 
 import time
 import os
+
+import numpy as np
 from six import iteritems
 
-from mlflow.models import Model
+from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking._tracking_service import utils
 from mlflow.utils.validation import (
@@ -18,6 +21,7 @@ from mlflow.utils.validation import (
     _validate_experiment_artifact_location,
     _validate_experiment_name,
     _validate_metric,
+    _validate_metric_series,
 )
 from mlflow.entities import Param, Metric, RunStatus, RunTag, ViewType, ExperimentTag
 from mlflow.store.artifact.artifact_repository_registry import get_artifact_repository
@@ -55,16 +59,48 @@ class TrackingServiceClient(object):
         _validate_run_id(run_id)
         return self.store.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_runs(self, run_ids):
+        """
+        Fetch several runs from backend store with a single call to the store, like
+        :py:func:`get_run`.
+
+        :param run_ids: List of unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``, if
+                 all the runs exist. Otherwise, raises an exception.
+        """
+        run_ids = list(run_ids)
+        for run_id in run_ids:
+            _validate_run_id(run_id)
+        if not run_ids:
+            return []
+        return self.store.get_runs(run_ids)
+
+    def get_metric_history(self, run_id, key, max_points=None, start_step=None, end_step=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param max_points: If specified, the maximum number of values to return. When more values
+                           were logged in the requested step range, the range is split into at
+                           most ``max_points`` equal-width step buckets and only the first value
+                           (lowest step, then earliest timestamp) of each bucket is returned,
+                           ordered by step.
+        :param start_step: If specified, only values logged at a step greater than or equal to
+                           ``start_step`` are returned.
+        :param end_step: If specified, only values logged at a step less than or equal to
+                         ``end_step`` are returned.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        return self.store.get_metric_history(run_id=run_id, metric_key=key)
+        return self.store.get_metric_history(
+            run_id=run_id,
+            metric_key=key,
+            max_points=max_points,
+            start_step=start_step,
+            end_step=end_step,
+        )
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -183,6 +219,40 @@ class TrackingServiceClient(object):
         metric = Metric(key, value, timestamp, step)
         self.store.log_metric(run_id, metric)
 
+    def log_metric_series(self, run_id, key, values, steps=None, timestamps=None):
+        """
+        Log a series of values of a metric against the run ID.
+
+        :param run_id: The run id to which the metric series should be logged.
+        :param key: Metric name.
+        :param values: Array-like of metric values (floats).
+        :param steps: Array-like of integer training steps, one per value. Defaults to
+                      ``0, 1, ..., len(values) - 1``.
+        :param timestamps: Array-like of timestamps in milliseconds, one per value. Defaults to the
+                           current system time for every value.
+        """
+        try:
+            values = np.asarray(values, dtype=np.float64)
+            if steps is None:
+                steps = np.arange(values.size, dtype=np.int64)
+            else:
+                steps = np.asarray(steps, dtype=np.int64)
+            if timestamps is None:
+                timestamps = np.full(values.shape, int(time.time() * 1000), dtype=np.int64)
+            else:
+                timestamps = np.asarray(timestamps, dtype=np.int64)
+        except (TypeError, ValueError) as e:
+            raise MlflowException(
+                "Got invalid series for metric '%s': %s. Please specify values as doubles "
+                "(64-bit floating point) and steps and timestamps as longs (64-bit integers)."
+                % (key, e),
+                INVALID_PARAMETER_VALUE,
+            )
+        _validate_metric_series(key, values, steps, timestamps)
+        if values.size == 0:
+            return
+        self.store.log_metric_series(run_id, key, values, steps, timestamps)
+
     def log_param(self, run_id, key, value):
         """
         Log a parameter against the run ID. Value is converted to a string.
@@ -247,6 +317,8 @@ class TrackingServiceClient(object):
         self.store.log_batch(run_id=run_id, metrics=metrics, params=params, tags=tags)
 
     def _record_logged_model(self, run_id, mlflow_model):
+        from mlflow.models import Model
+
         if not isinstance(mlflow_model, Model):
             raise TypeError(
                 "Argument 'mlflow_model' should be of type mlflow.models.Model but was "
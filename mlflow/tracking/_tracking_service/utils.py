@@ -1,5 +1,6 @@
 import os
 import sys
+import threading
 from functools import partial
 
 from mlflow.store.tracking import DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
@@ -81,12 +82,42 @@ def _get_file_store(store_uri, **_):
     return FileStore(store_uri, store_uri)
 
 
+# SqlAlchemyStore instances by store URI and artifact URI. Creating a store creates a database
+# engine with its own connection pool and checks (or initializes) the database schema, so stores are
+# reused rather than created for every client, and are never created concurrently by two threads.
+_sqlalchemy_stores = {}
+_sqlalchemy_stores_lock = threading.Lock()
+_sqlalchemy_stores_pid = os.getpid()
+
+
+def _reset_sqlalchemy_stores():
+    global _sqlalchemy_stores, _sqlalchemy_stores_lock, _sqlalchemy_stores_pid
+    # The connections of the parent process must not be used by a forked child process, and the
+    # lock may have been held by another thread of the parent process when it forked
+    _sqlalchemy_stores = {}
+    _sqlalchemy_stores_lock = threading.Lock()
+    _sqlalchemy_stores_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sqlalchemy_stores)
+
+
 def _get_sqlalchemy_store(store_uri, artifact_uri):
     from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
 
     if artifact_uri is None:
         artifact_uri = DEFAULT_LOCAL_FILE_AND_ARTIFACT_PATH
-    return SqlAlchemyStore(store_uri, artifact_uri)
+    if _sqlalchemy_stores_pid != os.getpid():
+        # ``os.register_at_fork`` is not available before Python 3.7
+        _reset_sqlalchemy_stores()
+    with _sqlalchemy_stores_lock:
+        store = _sqlalchemy_stores.get((store_uri, artifact_uri))
+        if store is None:
+            store = _sqlalchemy_stores[(store_uri, artifact_uri)] = SqlAlchemyStore(
+                store_uri, artifact_uri
+            )
+    return store
 
 
 def _get_default_host_creds(store_uri):
@@ -109,16 +109,40 @@ class MlflowClient(object):
         """
         return self._tracking_client.get_run(run_id)
 
-    def get_metric_history(self, run_id, key):
+    def get_runs(self, run_ids):
+        """
+        Fetch several runs from backend store, like :py:func:`get_run`, with a single call to the
+        store rather than one call per run. With a remote tracking server, runs are fetched with
+        one request per 1000 run IDs.
+
+        :param run_ids: List of unique identifiers of the runs.
+
+        :return: A list of :py:class:`mlflow.entities.Run` objects, in the order of ``run_ids``, if
+                 all the runs exist. Otherwise, raises an exception.
+        """
+        return self._tracking_client.get_runs(run_ids)
+
+    def get_metric_history(self, run_id, key, max_points=None, start_step=None, end_step=None):
         """
         Return a list of metric objects corresponding to all values logged for a given metric.
 
         :param run_id: Unique identifier for run
         :param key: Metric name within the run
+        :param max_points: If specified, the maximum number of values to return. When more values
+                           were logged in the requested step range, the range is split into at
+                           most ``max_points`` equal-width step buckets and only the first value
+                           (lowest step, then earliest timestamp) of each bucket is returned,
+                           ordered by step.
+        :param start_step: If specified, only values logged at a step greater than or equal to
+                           ``start_step`` are returned.
+        :param end_step: If specified, only values logged at a step less than or equal to
+                         ``end_step`` are returned.
 
         :return: A list of :py:class:`mlflow.entities.Metric` entities if logged, else empty list
         """
-        return self._tracking_client.get_metric_history(run_id, key)
+        return self._tracking_client.get_metric_history(
+            run_id, key, max_points=max_points, start_step=start_step, end_step=end_step
+        )
 
     def create_run(self, experiment_id, start_time=None, tags=None):
         """
@@ -222,6 +246,24 @@ class MlflowClient(object):
         """
         self._tracking_client.log_metric(run_id, key, value, timestamp, step)
 
+    def log_metric_series(self, run_id, key, values, steps=None, timestamps=None):
+        """
+        Log a series of values of a metric against the run ID, for example the values of a metric
+        at each step of a training loop, with a single call to the tracking store.
+
+        :param run_id: The run id to which the metric series should be logged.
+        :param key: Metric name.
+        :param values: Metric values, as a list or a one-dimensional numpy array of floats. Note
+                       that some special values such as +/- Infinity may be replaced by other
+                       values depending on the store.
+        :param steps: Integer training steps (iterations) at which the values were calculated,
+                      with one step per value. Defaults to ``0, 1, ..., len(values) - 1``.
+        :param timestamps: Times when the values were calculated, in milliseconds since the
+                           epoch, with one timestamp per value. Defaults to the current system
+                           time for every value.
+        """
+        self._tracking_client.log_metric_series(run_id, key, values, steps, timestamps)
+
     def log_param(self, run_id, key, value):
         """
         Log a parameter against the run ID. Value is converted to a string.
@@ -7,32 +7,105 @@ import os
 import atexit
 import time
 import logging
+import threading
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
-import pandas as pd
 
 from mlflow.entities import Run, RunStatus, Param, RunTag, Metric, ViewType
 from mlflow.entities.lifecycle_stage import LifecycleStage
 from mlflow.exceptions import MlflowException
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
 from mlflow.tracking.client import MlflowClient
 from mlflow.tracking import artifact_utils
+from mlflow.tracking._async_logging_queue import AsyncLoggingQueue
+from mlflow.tracking._tracking_service.utils import get_tracking_uri
 from mlflow.tracking.context import registry as context_registry
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.utils import env
 from mlflow.utils.databricks_utils import is_in_databricks_notebook, get_notebook_id
 from mlflow.utils.mlflow_tags import MLFLOW_PARENT_RUN_ID, MLFLOW_RUN_NAME
-from mlflow.utils.validation import _validate_run_id
+from mlflow.utils.search_utils import SearchUtils
+from mlflow.utils.validation import (
+    _validate_run_id,
+    _validate_metric,
+    _validate_param_name,
+    _validate_tag_name,
+)
 
 _EXPERIMENT_ID_ENV_VAR = "MLFLOW_EXPERIMENT_ID"
 _EXPERIMENT_NAME_ENV_VAR = "MLFLOW_EXPERIMENT_NAME"
 _RUN_ID_ENV_VAR = "MLFLOW_RUN_ID"
-_active_run_stack = []
+_ASYNC_LOGGING_ENV_VAR = "MLFLOW_ASYNC_LOGGING"
 _active_experiment_id = None
 
 SEARCH_MAX_RESULTS_PANDAS = 100000
 NUM_RUNS_PER_PAGE_PANDAS = 10000
+_SEARCH_RUNS_INFO_COLUMNS = [
+    "run_id",
+    "experiment_id",
+    "status",
+    "artifact_uri",
+    "start_time",
+    "end_time",
+]
 
 _logger = logging.getLogger(__name__)
 
+try:
+    from contextvars import ContextVar
+except ImportError:  # Python < 3.7
+    ContextVar = None
+
+
+class _ThreadLocalVariable(object):
+    """
+    Replacement for ``contextvars.ContextVar`` on Python versions that do not provide it, whose
+    value is local to each thread.
+    """
+
+    def __init__(self, name, default):
+        self.name = name
+        self._default = default
+        self._local = threading.local()
+
+    def get(self):
+        return getattr(self._local, "value", self._default)
+
+    def set(self, value):
+        self._local.value = value
+
+
+# Stack of the active runs, local to each thread and asyncio task. It is stored as a tuple which is
+# replaced rather than mutated, because a new asyncio task starts with the values of the context
+# that created it: the task can then start and end runs without affecting that context.
+_active_run_stack = (ContextVar or _ThreadLocalVariable)("mlflow_active_run_stack", default=())
+# Active runs of all threads and asyncio tasks by run ID, in the order in which they were started,
+# which are ended when the process exits
+_active_runs = OrderedDict()
+_active_runs_lock = threading.Lock()
+
+
+# Clients used by the thread of the asynchronous logging queue, by tracking URI, and the process
+# that created them, since their stores must not be used by forked child processes
+_async_logging_clients = {}
+_async_logging_clients_pid = os.getpid()
+
+
+def _log_batch_to_tracking_uri(tracking_uri, run_id, metrics, params, tags):
+    global _async_logging_clients, _async_logging_clients_pid
+    if _async_logging_clients_pid != os.getpid():
+        _async_logging_clients = {}
+        _async_logging_clients_pid = os.getpid()
+    client = _async_logging_clients.get(tracking_uri)
+    if client is None:
+        client = _async_logging_clients[tracking_uri] = MlflowClient(tracking_uri)
+    client.log_batch(run_id, metrics=metrics, params=params, tags=tags)
+
+
+_async_logging_queue = AsyncLoggingQueue(_log_batch_to_tracking_uri)
+
 
 def set_experiment(experiment_name):
     """
@@ -60,8 +133,9 @@ def set_experiment(experiment_name):
 class ActiveRun(Run):  # pylint: disable=W0223
     """Wrapper around :py:class:`mlflow.entities.Run` to enable using Python ``with`` syntax."""
 
-    def __init__(self, run):
+    def __init__(self, run, async_logging=False):
         Run.__init__(self, run.info, run.data)
+        self._async_logging = async_logging
 
     def __enter__(self):
         return self
@@ -72,7 +146,7 @@ class ActiveRun(Run):  # pylint: disable=W0223
         return exc_type is None
 
 
-def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
+def start_run(run_id=None, experiment_id=None, run_name=None, nested=False, async_logging=None):
     """
     Start a new MLflow run, setting it as the active run under which metrics and parameters
     will be logged. The return value can be used as a context manager within a ``with`` block;
@@ -85,6 +159,12 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
     MLflow sets a variety of default tags on the run, as defined in
     :ref:`MLflow system tags <system_tags>`.
 
+    The run is active in the current thread, or in the current asyncio task on Python 3.7 and
+    later, so concurrent threads and tasks can each start and log to their own runs. Threads do
+    not inherit the active runs of the thread that started them, while asyncio tasks start with
+    the active runs of the code that created them. The runs of all threads and tasks that are
+    still active when the process exits are ended with the ``FINISHED`` status.
+
     :param run_id: If specified, get the run with the specified UUID and log parameters
                      and metrics under that run. The run's end time is unset and its status
                      is set to running, but the run's other attributes (``source_version``,
@@ -98,19 +178,28 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
     :param run_name: Name of new run (stored as a ``mlflow.runName`` tag).
                      Used only when ``run_id`` is unspecified.
     :param nested: Controls whether run is nested in parent run. ``True`` creates a nest run.
+    :param async_logging: If ``True``, metrics, params and tags logged under the run with the
+                          fluent API are queued and sent to the tracking server by a background
+                          thread, which batches them with ``log_batch`` calls. Logging errors are
+                          raised by :py:func:`mlflow.flush`, which waits for the queued entries of
+                          all runs to be sent, or by :py:func:`mlflow.end_run`, which only waits
+                          for the entries of the run and marks the run as ``FAILED`` if some of
+                          them could not be logged. If unspecified, asynchronous logging is
+                          enabled when the ``MLFLOW_ASYNC_LOGGING`` environment variable is set
+                          to ``true``.
     :return: :py:class:`mlflow.ActiveRun` object that acts as a context manager wrapping
              the run's state.
     """
-    global _active_run_stack
     # back compat for int experiment_id
     experiment_id = str(experiment_id) if isinstance(experiment_id, int) else experiment_id
-    if len(_active_run_stack) > 0 and not nested:
+    active_run_stack = _active_run_stack.get()
+    if len(active_run_stack) > 0 and not nested:
         raise Exception(
             (
                 "Run with UUID {} is already active. To start a new run, first end the "
                 + "current run with mlflow.end_run(). To start a nested "
                 + "run, call start_run with nested=True"
-            ).format(_active_run_stack[0].info.run_id)
+            ).format(active_run_stack[0].info.run_id)
         )
     if run_id:
         existing_run_id = run_id
@@ -141,8 +230,8 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
                 "deleted state.".format(existing_run_id)
             )
     else:
-        if len(_active_run_stack) > 0:
-            parent_run_id = _active_run_stack[-1].info.run_id
+        if len(active_run_stack) > 0:
+            parent_run_id = active_run_stack[-1].info.run_id
         else:
             parent_run_id = None
 
@@ -158,21 +247,88 @@ def start_run(run_id=None, experiment_id=None, run_name=None, nested=False):
 
         active_run_obj = MlflowClient().create_run(experiment_id=exp_id_for_run, tags=tags)
 
-    _active_run_stack.append(ActiveRun(active_run_obj))
-    return _active_run_stack[-1]
+    if async_logging is None:
+        async_logging = os.environ.get(_ASYNC_LOGGING_ENV_VAR, "false").lower() == "true"
+    new_active_run = ActiveRun(active_run_obj, async_logging=async_logging)
+    _active_run_stack.set(active_run_stack + (new_active_run,))
+    with _active_runs_lock:
+        _active_runs[new_active_run.info.run_id] = new_active_run
+    return new_active_run
 
 
 def end_run(status=RunStatus.to_string(RunStatus.FINISHED)):
     """End an active MLflow run (if there is one)."""
-    global _active_run_stack
-    if len(_active_run_stack) > 0:
+    active_run_stack = _active_run_stack.get()
+    if len(active_run_stack) > 0:
         # Clear out the global existing run environment variable as well.
         env.unset_variable(_RUN_ID_ENV_VAR)
-        run = _active_run_stack.pop()
+        run = active_run_stack[-1]
+        _active_run_stack.set(active_run_stack[:-1])
+        _terminate_run(run, status)
+
+
+def _terminate_run(run, status):
+    with _active_runs_lock:
+        _active_runs.pop(run.info.run_id, None)
+    try:
+        _async_logging_queue.flush(run.info.run_id)
+    except Exception:
+        status = RunStatus.to_string(RunStatus.FAILED)
+        raise
+    finally:
         MlflowClient().set_terminated(run.info.run_id, status)
 
 
-atexit.register(end_run)
+def _get_latest_active_run():
+    """
+    Returns the most recently started run that is still active in any thread or asyncio task of
+    the process, or None if there is no such run. Unlike ``active_run``, this can be called from
+    threads that did not start the run, such as threads receiving callbacks from other processes.
+    """
+    with _active_runs_lock:
+        runs = list(_active_runs.values())
+    return runs[-1] if runs else None
+
+
+def _end_active_runs():
+    """
+    End the runs that are still active when the process exits, including the runs started by
+    other threads and asyncio tasks than the main thread.
+    """
+    try:
+        end_run()
+    except Exception as e:  # pylint: disable=broad-except
+        _logger.error("Failed to end the active run: %s", e)
+    with _active_runs_lock:
+        runs = list(_active_runs.values())
+    # End nested runs before their parent runs
+    for run in reversed(runs):
+        try:
+            _terminate_run(run, RunStatus.to_string(RunStatus.FINISHED))
+        except Exception as e:  # pylint: disable=broad-except
+            _logger.error("Failed to end run '%s': %s", run.info.run_id, e)
+
+
+atexit.register(_end_active_runs)
+
+
+def flush():
+    """
+    Wait until the metrics, params and tags logged asynchronously (see the ``async_logging``
+    argument of :py:func:`mlflow.start_run`) are sent to the tracking server. If some of them
+    failed to be logged, raise the first error.
+    """
+    _async_logging_queue.flush()
+
+
+def _log_async(run_id, metrics=(), params=(), tags=()):
+    for metric in metrics:
+        _validate_metric(metric.key, metric.value, metric.timestamp, metric.step)
+    for param in params:
+        _validate_param_name(param.key)
+    for tag in tags:
+        _validate_tag_name(tag.key)
+    _async_logging_queue.log(get_tracking_uri(), run_id, metrics, params, tags)
 
 
 def active_run():
@@ -187,7 +343,8 @@ def active_run():
         client = mlflow.tracking.MlflowClient()
         data = client.get_run(mlflow.active_run().info.run_id).data
     """
-    return _active_run_stack[-1] if len(_active_run_stack) > 0 else None
+    active_run_stack = _active_run_stack.get()
+    return active_run_stack[-1] if len(active_run_stack) > 0 else None
 
 
 def get_run(run_id):
@@ -215,8 +372,11 @@ def log_param(key, value):
     :param key: Parameter name (string)
     :param value: Parameter value (string, but will be string-ified if not)
     """
-    run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_param(run_id, key, value)
+    run = _get_or_start_run()
+    if run._async_logging:
+        _log_async(run.info.run_id, params=[Param(key, str(value))])
+    else:
+        MlflowClient().log_param(run.info.run_id, key, value)
 
 
 def set_tag(key, value):
@@ -227,8 +387,11 @@ def set_tag(key, value):
     :param key: Tag name (string)
     :param value: Tag value (string, but will be string-ified if not)
     """
-    run_id = _get_or_start_run().info.run_id
-    MlflowClient().set_tag(run_id, key, value)
+    run = _get_or_start_run()
+    if run._async_logging:
+        _log_async(run.info.run_id, tags=[RunTag(key, str(value))])
+    else:
+        MlflowClient().set_tag(run.info.run_id, key, value)
 
 
 def delete_tag(key):
@@ -238,8 +401,11 @@ def delete_tag(key):
 
     :param key: Name of the tag
     """
-    run_id = _get_or_start_run().info.run_id
-    MlflowClient().delete_tag(run_id, key)
+    run = _get_or_start_run()
+    if run._async_logging:
+        # Tags set before must be logged before the tag is deleted
+        _async_logging_queue.flush(run.info.run_id)
+    MlflowClient().delete_tag(run.info.run_id, key)
 
 
 def log_metric(key, value, step=None):
@@ -253,8 +419,12 @@ def log_metric(key, value, step=None):
                   SQLAlchemy store replaces +/- Inf with max / min float values.
     :param step: Metric step (int). Defaults to zero if unspecified.
     """
-    run_id = _get_or_start_run().info.run_id
-    MlflowClient().log_metric(run_id, key, value, int(time.time() * 1000), step or 0)
+    run = _get_or_start_run()
+    timestamp = int(time.time() * 1000)
+    if run._async_logging:
+        _log_async(run.info.run_id, metrics=[Metric(key, value, timestamp, step or 0)])
+    else:
+        MlflowClient().log_metric(run.info.run_id, key, value, timestamp, step or 0)
 
 
 def log_metrics(metrics, step=None):
@@ -270,10 +440,13 @@ def log_metrics(metrics, step=None):
 
     :returns: None
     """
-    run_id = _get_or_start_run().info.run_id
+    run = _get_or_start_run()
     timestamp = int(time.time() * 1000)
     metrics_arr = [Metric(key, value, timestamp, step or 0) for key, value in metrics.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=metrics_arr, params=[], tags=[])
+    if run._async_logging:
+        _log_async(run.info.run_id, metrics=metrics_arr)
+    else:
+        MlflowClient().log_batch(run_id=run.info.run_id, metrics=metrics_arr, params=[], tags=[])
 
 
 def log_params(params):
@@ -285,9 +458,12 @@ def log_params(params):
                    not)
     :returns: None
     """
-    run_id = _get_or_start_run().info.run_id
+    run = _get_or_start_run()
     params_arr = [Param(key, str(value)) for key, value in params.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=params_arr, tags=[])
+    if run._async_logging:
+        _log_async(run.info.run_id, params=params_arr)
+    else:
+        MlflowClient().log_batch(run_id=run.info.run_id, metrics=[], params=params_arr, tags=[])
 
 
 def set_tags(tags):
@@ -299,9 +475,12 @@ def set_tags(tags):
                  not)
     :returns: None
     """
-    run_id = _get_or_start_run().info.run_id
+    run = _get_or_start_run()
     tags_arr = [RunTag(key, str(value)) for key, value in tags.items()]
-    MlflowClient().log_batch(run_id=run_id, metrics=[], params=[], tags=tags_arr)
+    if run._async_logging:
+        _log_async(run.info.run_id, tags=tags_arr)
+    else:
+        MlflowClient().log_batch(run_id=run.info.run_id, metrics=[], params=[], tags=tags_arr)
 
 
 def log_artifact(local_path, artifact_path=None):
@@ -413,6 +592,8 @@ def search_runs(
     run_view_type=ViewType.ACTIVE_ONLY,
     max_results=SEARCH_MAX_RESULTS_PANDAS,
     order_by=None,
+    columns=None,
+    max_concurrent_pages=1,
 ):
     """
     Get a pandas DataFrame of runs that fit the search criteria.
@@ -426,12 +607,38 @@ def search_runs(
     :param order_by: List of columns to order by (e.g., "metrics.rmse"). The ``order_by`` column
                      can contain an optional ``DESC`` or ``ASC`` value. The default is ``ASC``.
                      The default ordering is to sort by ``start_time DESC``, then ``run_id``.
+    :param columns: Optional list of the columns to return, in order (e.g.,
+                    ``["run_id", "metrics.rmse", "params.lr"]``). Columns are either run attributes
+                    (``run_id``, ``experiment_id``, ``status``, ``artifact_uri``, ``start_time``
+                    and ``end_time``), or metrics, params and tags prefixed with ``metrics.``,
+                    ``params.`` and ``tags.``. A column is returned even if no run has a value for
+                    it. By default, all the attributes and every metric, param and tag logged by
+                    any of the runs are returned.
+    :param max_concurrent_pages: The maximum number of pages of runs to fetch concurrently. Values
+                                 greater than 1 only take effect with tracking stores whose page
+                                 tokens encode the offset of the page, such as file stores,
+                                 database-backed stores and tracking servers using them.
 
     :return: A pandas.DataFrame of runs, where each metric, parameter, and tag
         are expanded into their own columns named metrics.*, params.*, and tags.*
         respectively. For runs that don't have a particular metric, parameter, or tag, their
         value will be (NumPy) Nan, None, or None respectively.
     """
+    selected_keys = None
+    if columns is not None:
+        selected_keys = {"metrics": [], "params": [], "tags": []}
+        for column in columns:
+            if column in _SEARCH_RUNS_INFO_COLUMNS:
+                continue
+            prefix, _, key = column.partition(".")
+            if prefix not in selected_keys or not key:
+                raise MlflowException(
+                    "Invalid column '{}'. Columns must be one of {} or start with 'metrics.', "
+                    "'params.' or 'tags.'".format(column, _SEARCH_RUNS_INFO_COLUMNS),
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            selected_keys[prefix].append(key)
+
     if not experiment_ids:
         experiment_ids = _get_experiment_id()
 
@@ -442,71 +649,64 @@ def search_runs(
             experiment_ids, filter_string, run_view_type, number_to_get, order_by, next_page_token
         )
 
-    runs = _paginate(pagination_wrapper_func, NUM_RUNS_PER_PAGE_PANDAS, max_results)
+    runs = _paginate(
+        pagination_wrapper_func, NUM_RUNS_PER_PAGE_PANDAS, max_results, max_concurrent_pages
+    )
 
-    info = {
-        "run_id": [],
-        "experiment_id": [],
-        "status": [],
-        "artifact_uri": [],
-        "start_time": [],
-        "end_time": [],
+    import pandas as pd
+
+    infos = [run.info for run in runs]
+    datas = [run.data for run in runs]
+    data = {
+        "run_id": [info.run_id for info in infos],
+        "experiment_id": [info.experiment_id for info in infos],
+        "status": [info.status for info in infos],
+        "artifact_uri": [info.artifact_uri for info in infos],
+        "start_time": pd.to_datetime([info.start_time for info in infos], unit="ms", utc=True),
+        "end_time": pd.to_datetime([info.end_time for info in infos], unit="ms", utc=True),
     }
-    params, metrics, tags = ({}, {}, {})
     PARAM_NULL, METRIC_NULL, TAG_NULL = (None, np.nan, None)
-    for i, run in enumerate(runs):
-        info["run_id"].append(run.info.run_id)
-        info["experiment_id"].append(run.info.experiment_id)
-        info["status"].append(run.info.status)
-        info["artifact_uri"].append(run.info.artifact_uri)
-        info["start_time"].append(pd.to_datetime(run.info.start_time, unit="ms", utc=True))
-        info["end_time"].append(pd.to_datetime(run.info.end_time, unit="ms", utc=True))
-
-        # Params
-        param_keys = set(params.keys())
-        for key in param_keys:
-            if key in run.data.params:
-                params[key].append(run.data.params[key])
-            else:
-                params[key].append(PARAM_NULL)
-        new_params = set(run.data.params.keys()) - param_keys
-        for p in new_params:
-            params[p] = [PARAM_NULL] * i  # Fill in null values for all previous runs
-            params[p].append(run.data.params[p])
-
-        # Metrics
-        metric_keys = set(metrics.keys())
-        for key in metric_keys:
-            if key in run.data.metrics:
-                metrics[key].append(run.data.metrics[key])
+    for prefix, run_data, dtype, null_value in [
+        ("metrics", [run_data.metrics for run_data in datas], np.float64, METRIC_NULL),
+        ("params", [run_data.params for run_data in datas], object, PARAM_NULL),
+        ("tags", [run_data.tags for run_data in datas], object, TAG_NULL),
+    ]:
+        keys = selected_keys[prefix] if selected_keys is not None else None
+        for key, values in _get_run_data_columns(run_data, dtype, null_value, keys).items():
+            data[prefix + "." + key] = values
+    return pd.DataFrame(data, columns=columns)
+
+
+def _get_run_data_columns(run_data, dtype, null_value, keys=None):
+    """
+    Build the ``search_runs`` columns of the metrics, params or tags of a list of runs.
+
+    :param run_data: List of the dicts of the metrics, params or tags of each run.
+    :param dtype: Numpy dtype of the columns.
+    :param null_value: Value of the runs that don't have a particular key.
+    :param keys: List of the keys to build columns for. By default, columns are built for every
+                 key of any of the runs, in order of appearance.
+    :return: Dict mapping each key to a numpy array of its values for each run.
+    """
+    # Row indices and values of each key, collected in a single pass over the runs
+    key_rows, key_values = {}, {}
+    for row, values in enumerate(run_data):
+        items = values.items() if keys is None else ((k, values[k]) for k in keys if k in values)
+        for key, value in items:
+            rows = key_rows.get(key)
+            if rows is None:
+                key_rows[key], key_values[key] = [row], [value]
             else:
-                metrics[key].append(METRIC_NULL)
-        new_metrics = set(run.data.metrics.keys()) - metric_keys
-        for m in new_metrics:
-            metrics[m] = [METRIC_NULL] * i
-            metrics[m].append(run.data.metrics[m])
-
-        # Tags
-        tag_keys = set(tags.keys())
-        for key in tag_keys:
-            if key in run.data.tags:
-                tags[key].append(run.data.tags[key])
-            else:
-                tags[key].append(TAG_NULL)
-        new_tags = set(run.data.tags.keys()) - tag_keys
-        for t in new_tags:
-            tags[t] = [TAG_NULL] * i
-            tags[t].append(run.data.tags[t])
-
-    data = {}
-    data.update(info)
-    for key in metrics:
-        data["metrics." + key] = metrics[key]
-    for key in params:
-        data["params." + key] = params[key]
-    for key in tags:
-        data["tags." + key] = tags[key]
-    return pd.DataFrame(data)
+                rows.append(row)
+                key_values[key].append(value)
+
+    columns = {}
+    for key in key_rows if keys is None else keys:
+        column = np.full(len(run_data), null_value, dtype=dtype)
+        if key in key_rows:
+            column[key_rows[key]] = key_values[key]
+        columns[key] = column
+    return columns
 
 
 def list_run_infos(
@@ -514,6 +714,7 @@ def list_run_infos(
     run_view_type=ViewType.ACTIVE_ONLY,
     max_results=SEARCH_MAX_RESULTS_DEFAULT,
     order_by=None,
+    max_concurrent_pages=1,
 ):
     """
     Return run information for runs which belong to the experiment_id.
@@ -522,6 +723,8 @@ def list_run_infos(
     :param run_view_type: ACTIVE_ONLY, DELETED_ONLY, or ALL runs
     :param max_results: Maximum number of results desired.
     :param order_by: List of order_by clauses.
+    :param max_concurrent_pages: The maximum number of pages of results to fetch concurrently, see
+                                 :py:func:`mlflow.search_runs`.
 
     :return: A list of :py:class:`mlflow.entities.RunInfo` objects that satisfy the
         search expressions.
@@ -533,13 +736,23 @@ def list_run_infos(
             experiment_id, run_view_type, number_to_get, order_by, next_page_token
         )
 
-    return _paginate(pagination_wrapper_func, SEARCH_MAX_RESULTS_DEFAULT, max_results)
+    return _paginate(
+        pagination_wrapper_func, SEARCH_MAX_RESULTS_DEFAULT, max_results, max_concurrent_pages
+    )
 
 
-def _paginate(paginated_fn, max_results_per_page, max_results):
+def _paginate(paginated_fn, max_results_per_page, max_results, max_concurrent_pages=1):
     """
     Intended to be a general use pagination utility.
 
+    Pages are requested on worker threads. The next page is requested as soon as the token of the
+    current page is received, before the results of the current page are processed. If
+    ``max_concurrent_pages`` is greater than 1 and page tokens encode the offset of the page, as
+    the tokens of the ``FileStore`` and ``SqlAlchemyStore`` do, the following pages are also
+    requested ahead of time with tokens computed from their offsets, so that up to
+    ``max_concurrent_pages`` pages are fetched concurrently. If a page token does not match the
+    offset of the page, pagination falls back to following the page tokens one at a time.
+
     :param paginated_fn:
     :type paginated_fn: This function is expected to take in the number of results to retrieve
         per page and a pagination token, and return a PagedList object
@@ -547,29 +760,75 @@ def _paginate(paginated_fn, max_results_per_page, max_results):
     :type max_results_per_page: The maximum number of results to retrieve per page
     :param max_results:
     :type max_results: The maximum number of results to retrieve overall
+    :param max_concurrent_pages:
+    :type max_concurrent_pages: The maximum number of pages to request concurrently
     :return: Returns a list of entities, as determined by the paginated_fn parameter, with no more
         entities than specified by max_results
     :rtype: list[object]
     """
     all_results = []
-    next_page_token = None
-    while len(all_results) < max_results:
-        num_to_get = max_results - len(all_results)
-        if num_to_get < max_results_per_page:
-            page_results = paginated_fn(num_to_get, next_page_token)
-        else:
-            page_results = paginated_fn(max_results_per_page, next_page_token)
-        all_results.extend(page_results)
-        if hasattr(page_results, "token") and page_results.token:
-            next_page_token = page_results.token
-        else:
-            break
+    if max_results <= 0:
+        return all_results
+
+    def get_page(offset, page_token):
+        return paginated_fn(min(max_results_per_page, max_results - offset), page_token)
+
+    with ThreadPoolExecutor(max_workers=max(max_concurrent_pages, 1)) as executor:
+        # Offsets and futures of the requested pages, in order
+        requested_pages = deque([(0, executor.submit(get_page, 0, None))])
+        while requested_pages:
+            offset, page_future = requested_pages.popleft()
+            page_results = page_future.result()
+            next_offset = offset + len(page_results)
+            next_page_token = getattr(page_results, "token", None)
+            if next_page_token and next_offset < max_results:
+                offset_page_tokens = max_concurrent_pages > 1 and (
+                    _get_page_token_offset(next_page_token) == next_offset
+                )
+                if requested_pages and (
+                    not offset_page_tokens or requested_pages[0][0] != next_offset
+                ):
+                    # The pages requested ahead of time do not follow this page
+                    for _, requested_page_future in requested_pages:
+                        requested_page_future.cancel()
+                    requested_pages.clear()
+                if not requested_pages:
+                    requested_pages.append(
+                        (next_offset, executor.submit(get_page, next_offset, next_page_token))
+                    )
+                if offset_page_tokens:
+                    request_offset = requested_pages[-1][0] + max_results_per_page
+                    while (
+                        len(requested_pages) < max_concurrent_pages and request_offset < max_results
+                    ):
+                        page_token = SearchUtils.create_page_token(request_offset)
+                        requested_pages.append(
+                            (request_offset, executor.submit(get_page, request_offset, page_token))
+                        )
+                        request_offset += max_results_per_page
+            else:
+                for _, requested_page_future in requested_pages:
+                    requested_page_future.cancel()
+                requested_pages.clear()
+            all_results.extend(page_results)
     return all_results
 
 
+def _get_page_token_offset(page_token):
+    """
+    Returns the offset encoded into a page token issued by the ``FileStore`` or the
+    ``SqlAlchemyStore``, or None if the page token does not encode an offset.
+    """
+    try:
+        return SearchUtils.parse_start_offset_from_page_token(page_token)
+    except MlflowException:
+        return None
+
+
 def _get_or_start_run():
-    if len(_active_run_stack) > 0:
-        return _active_run_stack[-1]
+    active_run_stack = _active_run_stack.get()
+    if len(active_run_stack) > 0:
+        return active_run_stack[-1]
     return start_run()
 
 
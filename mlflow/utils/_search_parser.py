@@ -0,0 +1,566 @@
+"""
+Tokenizer and recursive-descent parser for the search filter and order-by grammar used by
+:py:class:`mlflow.utils.search_utils.SearchUtils`.
+
+The grammar is the small SQL subset MLflow accepts, e.g.
+``metrics.acc > 0.9 AND params."model" LIKE 'tf%'`` or ``metrics.acc DESC``. The parser
+produces the same token groups (comparisons, identifiers, parenthesis, ...) that ``sqlparse``
+0.3.1 produced, so that ``SearchUtils`` can validate them and report errors the same way, at a
+fraction of the cost.
+
+The groups only match ``sqlparse`` for inputs made of MLflow's grammar, valid or not. Malformed
+inputs using other SQL syntax can be reported with a different error message, since:
+
+- only common SQL keywords are keywords, other unquoted words such as ``user`` are names;
+- ``AS`` aliases, ``::`` casts, ``:=`` assignments, square brackets and ``CASE`` blocks are not
+  grouped.
+"""
+import re
+
+# Token kinds
+WHITESPACE = "whitespace"
+NEWLINE = "newline"
+COMMENT = "comment"
+NAME = "name"
+STRING = "string"
+SYMBOL = "symbol"
+PLACEHOLDER = "placeholder"
+INTEGER = "integer"
+FLOAT = "float"
+HEXADECIMAL = "hexadecimal"
+KEYWORD = "keyword"
+# Statement keywords and type names, which unlike other keywords cannot be items of a list
+OTHER_KEYWORD = "other_keyword"
+ORDER = "order"
+COMPARISON_OPERATOR = "comparison_operator"
+OPERATOR = "operator"
+WILDCARD = "wildcard"
+ASSIGNMENT = "assignment"
+PUNCTUATION = "punctuation"
+LITERAL = "literal"
+COMMAND = "command"
+ERROR = "error"
+
+# Group kinds
+IDENTIFIER = "identifier"
+COMPARISON = "comparison"
+OPERATION = "operation"
+PARENTHESIS = "parenthesis"
+FUNCTION = "function"
+IDENTIFIER_LIST = "identifier_list"
+
+NUMERIC_KINDS = frozenset([INTEGER, FLOAT])
+
+# Unquoted words that are not names: the common SQL keywords and the literals MLflow rejects as
+# values. Every other bare word is a name.
+_KEYWORDS = frozenset(
+    (
+        "AND AS BETWEEN BY CASE DISTINCT ELSE END FALSE FOR FROM FULL GROUP IF IN INNER IS ISNULL "
+        "JOIN KEY LEFT LIKE LOOP MAX MIN NOT NOTNULL NULL ON OR ORDER OUTER SET SOURCE "
+        "STRAIGHT_JOIN THEN TIMESTAMP TRUE TYPE VERSION WHEN WHERE WHILE"
+    ).split()
+)
+_OTHER_KEYWORDS = frozenset(
+    "ALTER CREATE DELETE DROP INSERT MERGE REPLACE SELECT UPDATE UPSERT".split()
+)
+_ORDER_KEYWORDS = frozenset(["ASC", "DESC"])
+
+_LETTER = "A-ZÀ-Ü"
+_LEXER_RULES = [
+    (r"(--|# ).*?(\r\n|\r|\n|$)", COMMENT),
+    (r"/\*[\s\S]*?\*/", COMMENT),
+    (r"(\r\n|\r|\n)", NEWLINE),
+    (r"[^\S\r\n]+", WHITESPACE),
+    (
+        r"[:*`\u00b4$?%\\]",
+        [
+            (r":=", ASSIGNMENT),
+            (r"::", PUNCTUATION),
+            (r"\*", WILDCARD),
+            (r"`(``|[^`])*`", NAME),
+            (r"\u00b4(\u00b4\u00b4|[^\u00b4])*\u00b4", NAME),
+            (
+                r"(?P<dollar_quote>(?<!\S)\$(?:[_%s]\w*)?\$)[\s\S]*?(?P=dollar_quote)" % _LETTER,
+                LITERAL,
+            ),
+            # Placeholders, e.g. ``?`` or ``$1``
+            (r"\?", PLACEHOLDER),
+            (r"%(\(\w+\))?s", PLACEHOLDER),
+            (r"(?<!\w)[$:?]\w+", PLACEHOLDER),
+            (r"\\\w+", COMMAND),
+        ],
+    ),
+    (r"(CASE|IN|VALUES|USING|FROM|AS)\b", KEYWORD),
+    (r"(@|##|#)[%s]\w+" % _LETTER, NAME),
+    # Names followed by a period, e.g. ``metrics`` in ``metrics.acc``, and names following one.
+    (r"[%s]\w*(?=\s*\.)" % _LETTER, NAME),
+    (r"(?<=\.)[%s]\w*" % _LETTER, NAME),
+    # Function names, e.g. ``lower`` in ``lower(name)``
+    (r"[%s]\w*(?=\()" % _LETTER, NAME),
+    (r"-?0x[\dA-F]+", HEXADECIMAL),
+    (r"-?\d*(\.\d+)?E-?\d+", FLOAT),
+    (r"(?![_%s])-?(\d+(\.\d*)|\.\d+)(?![_%s])" % (_LETTER, _LETTER), FLOAT),
+    (r"(?![_%s])-?\d+(?![_%s])" % (_LETTER, _LETTER), INTEGER),
+    (r"'(''|\\\\|\\'|[^'])*'", STRING),
+    (r'"(""|\\\\|\\"|[^"])*"', SYMBOL),
+    (r'(""|".*?[^\\]")', SYMBOL),
+    (r"(?<![\w\])])(\[[^\]]+\])", NAME),
+    # Keywords made of several words
+    (
+        r"(?:LEFT|RIGHT|FULL|INNER|OUTER|STRAIGHT|CROSS|NATURAL|JOIN|END|NOT|NULLS|UNION|CREATE"
+        r"|DOUBLE|GROUP|ORDER|LATERAL|AT|WITH)\b",
+        [
+            (
+                r"((LEFT\s+|RIGHT\s+|FULL\s+)?(INNER\s+|OUTER\s+|STRAIGHT\s+)?"
+                r"|(CROSS\s+|NATURAL\s+)?)?JOIN\b",
+                KEYWORD,
+            ),
+            (r"END(\s+IF|\s+LOOP|\s+WHILE)?\b", KEYWORD),
+            (r"NOT\s+NULL\b", KEYWORD),
+            (r"NULLS\s+(FIRST|LAST)\b", KEYWORD),
+            (r"UNION\s+ALL\b", KEYWORD),
+            (r"CREATE(\s+OR\s+REPLACE)?\b", OTHER_KEYWORD),
+            (r"DOUBLE\s+PRECISION\b", OTHER_KEYWORD),
+            (r"GROUP\s+BY\b", KEYWORD),
+            (r"ORDER\s+BY\b", KEYWORD),
+            (r"(LATERAL\s+VIEW\s+)(EXPLODE|INLINE|PARSE_URL_TUPLE|POSEXPLODE|STACK)\b", KEYWORD),
+            (r"(AT|WITH')\s+TIME\s+ZONE\s+'[^']+'", OTHER_KEYWORD),
+        ],
+    ),
+    (r"(NOT\s+)?(LIKE|ILIKE)\b", COMPARISON_OPERATOR),
+    (r"[0-9_%s][_$#\w]*" % _LETTER, None),
+    (r"[;:()\[\],.]", PUNCTUATION),
+    (r"[<>=~!]+", COMPARISON_OPERATOR),
+    (r"[+/@#%^&|`?-]+", OPERATOR),
+]
+_LEXER_KINDS = {}
+
+
+def _lexer_pattern(rules):
+    alternatives = []
+    for regex, kind in rules:
+        if isinstance(kind, list):
+            # A list of rules, which are only tried if ``regex`` matches, to skip them quickly
+            alternatives.append("(?=%s)(?:%s)" % (regex, _lexer_pattern(kind)))
+        else:
+            name = "rule%d" % len(_LEXER_KINDS)
+            _LEXER_KINDS[name] = kind
+            alternatives.append("(?P<%s>%s)" % (name, regex))
+    return "|".join(alternatives)
+
+
+# All rules combined into a single pattern; like the rules themselves, alternatives are tried in
+# order and the first one that matches wins.
+_LEXER_PATTERN = re.compile(_lexer_pattern(_LEXER_RULES), re.IGNORECASE | re.UNICODE)
+
+
+class Token(object):
+    """
+    A token or a group of tokens of a search expression. ``value`` is the source text the token
+    spans and ``tokens`` holds the children of a group.
+    """
+
+    __slots__ = ["kind", "value", "tokens", "is_whitespace"]
+
+    def __init__(self, kind, value, tokens=None):
+        self.kind = kind
+        self.value = value
+        self.tokens = tokens
+        self.is_whitespace = kind == WHITESPACE or kind == NEWLINE
+
+    @property
+    def is_group(self):
+        return self.tokens is not None
+
+    def is_keyword(self, *values):
+        return self.kind == KEYWORD and self.value.upper() in values
+
+    def __str__(self):
+        return self.value
+
+    def __repr__(self):
+        return "<%s %r>" % (self.kind, self.value)
+
+
+def _word_kind(word):
+    upper = word.upper()
+    if upper in _KEYWORDS:
+        return KEYWORD
+    elif upper in _OTHER_KEYWORDS:
+        return OTHER_KEYWORD
+    elif upper in _ORDER_KEYWORDS:
+        return ORDER
+    return NAME
+
+
+def tokenize(text):
+    """Split ``text`` into a list of :py:class:`Token`."""
+    tokens = []
+    pos = 0
+    length = len(text)
+    while pos < length:
+        match = _LEXER_PATTERN.match(text, pos)
+        if match is None:
+            tokens.append(Token(ERROR, text[pos]))
+            pos += 1
+            continue
+        value = match.group()
+        tokens.append(Token(_LEXER_KINDS[match.lastgroup] or _word_kind(value), value))
+        pos = match.end()
+    return tokens
+
+
+# Keywords closing a block, which like closing parenthesis decrease the nesting level
+_BLOCK_ENDS = frozenset(["END", "END IF", "END WHILE"])
+
+
+def _is_single_line_comment(token):
+    return token.kind == COMMENT and not token.value.startswith("/*")
+
+
+def split_statements(tokens):
+    """
+    Split a token list into statements separated by semicolons outside of parenthesis. Spaces
+    and single-line comments after a semicolon belong to the statement it terminates.
+    """
+    statements = []
+    current = []
+    level = 0
+    terminated = False
+    for token in tokens:
+        if terminated and token.kind != WHITESPACE and not _is_single_line_comment(token):
+            statements.append(current)
+            current = []
+            level = 0
+            terminated = False
+        if token.kind == PUNCTUATION:
+            if token.value == "(":
+                level += 1
+            elif token.value == ")":
+                level -= 1
+            elif token.value == ";" and level <= 0:
+                terminated = True
+        elif token.kind == KEYWORD and " ".join(token.value.upper().split()) in _BLOCK_ENDS:
+            level -= 1
+        current.append(token)
+    if current:
+        statements.append(current)
+    return statements
+
+
+def _group(kind, tokens):
+    return Token(kind, "".join(token.value for token in tokens), tokens)
+
+
+class _Parser(object):
+    """
+    Recursive-descent parser turning the tokens of one statement into a flat list of top-level
+    tokens and groups::
+
+        statement  := item*
+        item       := comparison | operand | token
+        comparison := operand (COMPARISON_OPERATOR operand)+
+        operand    := primary (OPERATOR primary)*
+        primary    := identifier | function | number | string | NULL | parenthesis
+        function   := NAME parenthesis
+        identifier := part ("." part)* [ORDER]  |  number ORDER
+        part       := NAME | SYMBOL
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _peek(self, pos):
+        """Return the index of the first non-whitespace token at or after ``pos``."""
+        while pos < len(self.tokens) and self.tokens[pos].is_whitespace:
+            pos += 1
+        return pos
+
+    def _token_at(self, pos):
+        return self.tokens[pos] if pos < len(self.tokens) else None
+
+    def parse_statement(self):
+        items = []
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if token.is_whitespace:
+                items.append(token)
+                self.pos += 1
+                continue
+            if token.kind == COMMENT:
+                items.append(self._parse_comment())
+                continue
+            operand = self._parse_operand()
+            if operand is None:
+                items.append(self._parse_primary_or_token())
+            else:
+                items.append(self._parse_comparison(operand))
+        return _group_identifier_lists(_align_comments(_group_aliases(items)))
+
+    def _parse_comment(self):
+        """
+        Group consecutive comments with the whitespace following them, unless they end the
+        statement.
+        """
+        start = self.pos
+        end = start + 1
+        while end < len(self.tokens) and (
+            self.tokens[end].kind == COMMENT or self.tokens[end].is_whitespace
+        ):
+            end += 1
+        if end == len(self.tokens):
+            self.pos = start + 1
+            return self.tokens[start]
+        self.pos = end
+        return _group(COMMENT, self.tokens[start:end])
+
+    def _parse_comparison(self, lhs):
+        while True:
+            operand_end = self.pos
+            comparator_pos = self._peek(operand_end)
+            comparator = self._token_at(comparator_pos)
+            if comparator is None or comparator.kind != COMPARISON_OPERATOR:
+                return lhs
+            rhs_start = self._peek(comparator_pos + 1)
+            self.pos = rhs_start
+            rhs = self._parse_operand()
+            if rhs is None:
+                self.pos = operand_end
+                return lhs
+            lhs = _group(COMPARISON, [lhs] + self.tokens[operand_end:rhs_start] + [rhs])
+
+    def _parse_operand(self):
+        left = self._parse_primary()
+        if left is None or left.is_keyword("NULL"):
+            # NULL can be compared but is not an operand of other operators
+            return left
+        while True:
+            op_pos = self._peek(self.pos)
+            op = self._token_at(op_pos)
+            if op is None or op.kind not in (OPERATOR, WILDCARD):
+                return left
+            right_pos = self._peek(op_pos + 1)
+            saved = self.pos
+            self.pos = right_pos
+            right = self._parse_primary()
+            if right is None or right.is_keyword("NULL"):
+                self.pos = saved
+                return left
+            left = _group(OPERATION, [left] + self.tokens[saved:right_pos] + [right])
+
+    def _parse_primary(self):
+        token = self._token_at(self.pos)
+        if token is None:
+            return None
+        if token.kind in (NAME, SYMBOL):
+            return self._parse_identifier()
+        if token.kind == PLACEHOLDER:
+            return self._parse_name()
+        if token.kind in NUMERIC_KINDS or token.kind == STRING or token.is_keyword("NULL"):
+            self.pos += 1
+            if token.kind in NUMERIC_KINDS:
+                return self._parse_order(token)
+            return token
+        if token.kind == HEXADECIMAL:
+            # Hexadecimal numbers are only operands as part of an identifier, e.g. ``0x1f DESC``
+            self.pos += 1
+            identifier = self._parse_order(token)
+            if identifier is token:
+                self.pos -= 1
+                return None
+            return identifier
+        if token.kind == PUNCTUATION and token.value == "(":
+            parenthesis = self._parse_parenthesis()
+            if parenthesis.kind != PARENTHESIS:
+                # An unbalanced parenthesis is not an operand
+                self.pos -= 1
+                return None
+            return parenthesis
+        return None
+
+    def _parse_primary_or_token(self):
+        token = self.tokens[self.pos]
+        if token.kind == PUNCTUATION and token.value == "(":
+            return self._parse_parenthesis()
+        self.pos += 1
+        if token.kind == HEXADECIMAL:
+            return self._parse_order(token)
+        return token
+
+    def _parse_parenthesis(self):
+        start = self.pos
+        depth = 0
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            self.pos += 1
+            if token.kind == PUNCTUATION and token.value == "(":
+                depth += 1
+            elif token.kind == PUNCTUATION and token.value == ")":
+                depth -= 1
+                if depth == 0:
+                    return _group(PARENTHESIS, self.tokens[start : self.pos])
+        # Unbalanced parenthesis: leave the opening one as a stand-alone token
+        self.pos = start + 1
+        return self.tokens[start]
+
+    def _parse_name(self):
+        """
+        Parse a name, quoted name or placeholder, which is a function call if it is not quoted and
+        followed by parenthesis.
+        """
+        start = self.pos
+        self.pos += 1
+        paren_pos = self._peek(self.pos)
+        paren = self._token_at(paren_pos)
+        if (
+            self.tokens[start].kind in (NAME, PLACEHOLDER)
+            and paren is not None
+            and paren.kind == PUNCTUATION
+            and paren.value == "("
+        ):
+            self.pos = paren_pos
+            arguments = self._parse_parenthesis()
+            if arguments.kind == PARENTHESIS:
+                return _group(FUNCTION, self.tokens[start:paren_pos] + [arguments])
+            self.pos = start + 1
+        return self.tokens[start]
+
+    def _parse_identifier(self):
+        parts = [self._parse_name()]
+        # Periods continue an identifier after a name or another period, but not after a function
+        # call or a wildcard, e.g. ``metrics.*``
+        while parts[-1].kind in (NAME, SYMBOL, PUNCTUATION):
+            dot_pos = self._peek(self.pos)
+            dot = self._token_at(dot_pos)
+            if dot is None or dot.kind != PUNCTUATION or dot.value != ".":
+                break
+            part_pos = self._peek(dot_pos + 1)
+            part = self._token_at(part_pos)
+            if part is not None and part.kind in (NAME, SYMBOL, WILDCARD, PLACEHOLDER):
+                before_dot = self.pos
+                self.pos = part_pos
+                name = self._parse_name()
+                # Placeholders only follow a period as the name of a function call
+                if name.kind != PLACEHOLDER:
+                    parts += self.tokens[before_dot:part_pos] + [name]
+                    continue
+                self.pos = before_dot
+            # A trailing period still belongs to the identifier, e.g. ``metrics.``
+            parts += self.tokens[self.pos : dot_pos + 1]
+            self.pos = dot_pos + 1
+        if len(parts) == 1 and parts[0].kind == FUNCTION:
+            return parts[0]
+        return self._parse_order(_group(IDENTIFIER, parts))
+
+    def _parse_order(self, token):
+        while True:
+            order_pos = self._peek(self.pos)
+            order = self._token_at(order_pos)
+            if order is None or order.kind != ORDER:
+                return token
+            tokens = [token] + self.tokens[self.pos : order_pos + 1]
+            self.pos = order_pos + 1
+            token = _group(IDENTIFIER, tokens)
+
+
+def _group_aliases(items):
+    """
+    Merge an item followed by an identifier into a single identifier, like SQL aliases, e.g.
+    ``metrics.acc descending``. An alias is not aliased again, so ``a b c d`` groups into
+    ``a b`` and ``c d``.
+    """
+    aliasable = (PARENTHESIS, FUNCTION, IDENTIFIER, OPERATION, COMPARISON, HEXADECIMAL) + tuple(
+        NUMERIC_KINDS
+    )
+    grouped = []
+    alias_index = None
+    for token in items:
+        if token.kind == IDENTIFIER:
+            prev_index = len(grouped) - 1
+            while prev_index >= 0 and grouped[prev_index].is_whitespace:
+                prev_index -= 1
+            if (
+                prev_index >= 0
+                and prev_index != alias_index
+                and grouped[prev_index].kind in aliasable
+            ):
+                tokens = grouped[prev_index:] + [token]
+                del grouped[prev_index:]
+                grouped.append(_group(IDENTIFIER, tokens))
+                alias_index = prev_index
+                continue
+        grouped.append(token)
+    return grouped
+
+
+def _align_comments(items):
+    """
+    Merge comments into the group preceding them, e.g. ``metrics.acc /* c */`` into the
+    ``metrics.acc`` identifier.
+    """
+    grouped = []
+    for token in items:
+        if token.kind == COMMENT and token.is_group:
+            prev_index = len(grouped) - 1
+            while prev_index >= 0 and grouped[prev_index].is_whitespace:
+                prev_index -= 1
+            if prev_index >= 0 and grouped[prev_index].is_group:
+                prev = grouped[prev_index]
+                tokens = prev.tokens + grouped[prev_index + 1 :] + [token]
+                del grouped[prev_index:]
+                token = _group(prev.kind, tokens)
+        grouped.append(token)
+    return grouped
+
+
+def _group_identifier_lists(items):
+    """Group comma separated items, e.g. ``a = 1, b = 2``, into a single identifier list."""
+    listable = (
+        COMPARISON,
+        FUNCTION,
+        IDENTIFIER,
+        OPERATION,
+        IDENTIFIER_LIST,
+        NAME,
+        SYMBOL,
+        PLACEHOLDER,
+        STRING,
+        KEYWORD,
+        WILDCARD,
+    ) + tuple(NUMERIC_KINDS)
+    grouped = []
+    i = 0
+    while i < len(items):
+        token = items[i]
+        if token.kind == PUNCTUATION and token.value == ",":
+            prev_index = len(grouped) - 1
+            while prev_index >= 0 and grouped[prev_index].is_whitespace:
+                prev_index -= 1
+            next_index = i + 1
+            while next_index < len(items) and items[next_index].is_whitespace:
+                next_index += 1
+            if (
+                prev_index >= 0
+                and grouped[prev_index].kind in listable
+                and next_index < len(items)
+                and items[next_index].kind in listable
+            ):
+                tokens = grouped[prev_index:] + items[i : next_index + 1]
+                if grouped[prev_index].kind == IDENTIFIER_LIST:
+                    tokens = grouped[prev_index].tokens + tokens[1:]
+                del grouped[prev_index:]
+                grouped.append(_group(IDENTIFIER_LIST, tokens))
+                i = next_index + 1
+                continue
+        grouped.append(token)
+        i += 1
+    return grouped
+
+
+def parse(text):
+    """
+    Parse ``text`` into a list of statements. Each statement is the list of its top-level
+    tokens, in which comparisons, identifiers, operations and parenthesis are grouped.
+    """
+    return [_Parser(tokens).parse_statement() for tokens in split_statements(tokenize(text))]
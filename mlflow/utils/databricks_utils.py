@@ -5,7 +5,6 @@ import subprocess
 
 from mlflow.exceptions import MlflowException
 from mlflow.utils.rest_utils import MlflowHostCreds
-from databricks_cli.configure import provider
 from mlflow.utils._spark_utils import _get_active_spark_session
 from mlflow.utils.uri import get_db_info_from_uri
 
@@ -199,6 +198,8 @@ def get_databricks_host_creds(server_uri=None):
     :return: :py:class:`mlflow.rest_utils.MlflowHostCreds` which includes the hostname and
         authentication information necessary to talk to the Databricks server.
     """
+    from databricks_cli.configure import provider
+
     profile, path = get_db_info_from_uri(server_uri)
     if not hasattr(provider, "get_config"):
         _logger.warning(
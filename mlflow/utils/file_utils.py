@@ -216,6 +216,21 @@ def read_file_lines(parent_path, file_name):
         return f.readlines()
 
 
+def iter_file_lines(parent_path, file_name):
+    """
+    Lazily iterate over the lines of the file without reading the whole file into memory.
+
+    :param parent_path: Full path to the directory that contains the file.
+    :param file_name: Leaf file name.
+
+    :return: A generator yielding the lines of the file.
+    """
+    file_path = os.path.join(parent_path, file_name)
+    with codecs.open(file_path, mode="r", encoding=ENCODING) as f:
+        for line in f:
+            yield line
+
+
 def read_file(parent_path, file_name):
     """
     Return the contents of the file.
@@ -1,36 +1,145 @@
 import base64
+import gzip
+import os
+import threading
 import time
 import logging
 import json
 
 import requests
+from google.protobuf.message import Message
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from mlflow import __version__
 from mlflow.protos import databricks_pb2
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
-from mlflow.utils.proto_json_utils import parse_dict
+from mlflow.utils.env import get_env
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
 from mlflow.utils.string_utils import strip_suffix
 from mlflow.exceptions import MlflowException, RestException
 
 RESOURCE_DOES_NOT_EXIST = "RESOURCE_DOES_NOT_EXIST"
+# Content type of request and response bodies in the binary protobuf format
+PROTOBUF_CONTENT_TYPE = "application/x-protobuf"
+# Response header in which MLflow servers list the content types that their REST API supports
+CONTENT_TYPES_HEADER = "X-MLflow-Content-Types"
+# Response header in which MLflow servers list the content encodings of request bodies that their
+# REST API supports
+CONTENT_ENCODINGS_HEADER = "X-MLflow-Content-Encodings"
 
 _logger = logging.getLogger(__name__)
 
 _DEFAULT_HEADERS = {"User-Agent": "mlflow-python-client/%s" % __version__}
 
+# HTTP requests are made with a ``requests.Session`` shared by all the requests made to the same
+# host with the same credentials in a process, so that connections are kept alive and reused
+# rather than opened for every request. These environment variables configure the sessions.
+# Maximum number of connections kept open to a host
+MLFLOW_HTTP_POOL_MAXSIZE = "MLFLOW_HTTP_POOL_MAXSIZE"
+# Set to "false" to close connections after each request rather than reusing them
+MLFLOW_HTTP_KEEP_ALIVE = "MLFLOW_HTTP_KEEP_ALIVE"
+# Maximum number of retries of requests that fail to connect, or that fail to read the response
+# of an idempotent request, and backoff factor of the exponential delay between these retries
+MLFLOW_HTTP_REQUEST_MAX_RETRIES = "MLFLOW_HTTP_REQUEST_MAX_RETRIES"
+MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR = "MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR"
+_DEFAULT_HTTP_POOL_MAXSIZE = 10
+_DEFAULT_HTTP_REQUEST_MAX_RETRIES = 3
+_DEFAULT_HTTP_REQUEST_BACKOFF_FACTOR = 0.1
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+_sessions_pid = os.getpid()
+# Hosts whose responses advertised support for the binary protobuf format
+_protobuf_hosts = set()
+# Hosts whose responses advertised support for gzip compressed request bodies, and minimum size in
+# bytes of the request bodies compressed when sent to these hosts
+_gzip_hosts = set()
+_REQUEST_COMPRESSION_MIN_SIZE = 1024
+
+
+def _reset_sessions():
+    global _sessions, _sessions_lock, _sessions_pid
+    # The connections of the parent process must not be used by a forked child process, and the
+    # lock may have been held by another thread of the parent process when it forked
+    _sessions = {}
+    _sessions_lock = threading.Lock()
+    _sessions_pid = os.getpid()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_sessions)
+
+
+def _create_session():
+    max_retries = int(get_env(MLFLOW_HTTP_REQUEST_MAX_RETRIES) or _DEFAULT_HTTP_REQUEST_MAX_RETRIES)
+    backoff_factor = float(
+        get_env(MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR) or _DEFAULT_HTTP_REQUEST_BACKOFF_FACTOR
+    )
+    pool_maxsize = int(get_env(MLFLOW_HTTP_POOL_MAXSIZE) or _DEFAULT_HTTP_POOL_MAXSIZE)
+    # Responses with error status codes are retried by ``http_request``
+    retry = Retry(
+        total=max_retries,
+        connect=max_retries,
+        read=max_retries,
+        status=0,
+        backoff_factor=backoff_factor,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=pool_maxsize, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    if (get_env(MLFLOW_HTTP_KEEP_ALIVE) or "true").lower() == "false":
+        session.headers["Connection"] = "close"
+    return session
+
+
+def _get_session(host_creds):
+    """
+    Returns the ``requests.Session`` used for the requests made with ``host_creds`` in this
+    process, creating it on first use.
+    """
+    key = (
+        strip_suffix(host_creds.host, "/"),
+        host_creds.username,
+        host_creds.password,
+        host_creds.token,
+        host_creds.ignore_tls_verification,
+        host_creds.client_cert_path,
+        host_creds.server_cert_path,
+    )
+    if _sessions_pid != os.getpid():
+        # ``os.register_at_fork`` is not available before Python 3.7
+        _reset_sessions()
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _sessions[key] = _create_session()
+    return session
+
 
 def http_request(
-    host_creds, endpoint, retries=3, retry_interval=3, max_rate_limit_interval=60, **kwargs
+    host_creds,
+    endpoint,
+    retries=3,
+    retry_interval=3,
+    max_rate_limit_interval=60,
+    extra_headers=None,
+    **kwargs
 ):
     """
     Makes an HTTP request with the specified method to the specified hostname/endpoint. Ratelimit
     error code (429) will be retried with an exponential back off (1, 2, 4, ... seconds) for at most
     `max_rate_limit_interval` seconds.  Internal errors (500s) will be retried up to `retries` times
     , waiting `retry_interval` seconds between successive retries. Parses the API response
-    (assumed to be JSON) into a Python object and returns it.
+    (assumed to be JSON) into a Python object and returns it. Requests made with the same
+    ``host_creds`` reuse the same pool of connections. Large request bodies are compressed with
+    gzip once a response of the host has listed gzip in its ``X-MLflow-Content-Encodings`` header.
 
     :param host_creds: A :py:class:`mlflow.rest_utils.MlflowHostCreds` object containing
         hostname and optional authentication.
+    :param extra_headers: Optional dict of headers to send in addition to the default headers.
     :return: Parsed API response
     """
     hostname = host_creds.host
@@ -42,6 +151,8 @@ def http_request(
         auth_str = "Bearer %s" % host_creds.token
 
     headers = dict(_DEFAULT_HEADERS)
+    if extra_headers:
+        headers.update(extra_headers)
     if auth_str:
         headers["Authorization"] = auth_str
 
@@ -53,8 +164,10 @@ def http_request(
     if host_creds.client_cert_path is not None:
         kwargs["cert"] = host_creds.client_cert_path
 
+    session = _get_session(host_creds)
+
     def request_with_ratelimit_retries(max_rate_limit_interval, **kwargs):
-        response = requests.request(**kwargs)
+        response = session.request(**kwargs)
         time_left = max_rate_limit_interval
         sleep = 1
         while response.status_code == 429 and time_left > 0:
@@ -67,17 +180,21 @@ def http_request(
             )
             time.sleep(sleep)
             time_left -= sleep
-            response = requests.request(**kwargs)
+            response = session.request(**kwargs)
             sleep = min(time_left, sleep * 2)  # sleep for 1, 2, 4, ... seconds;
         return response
 
     cleaned_hostname = strip_suffix(hostname, "/")
     url = "%s%s" % (cleaned_hostname, endpoint)
+    if cleaned_hostname in _gzip_hosts:
+        _compress_request_body(headers, kwargs)
     for i in range(retries):
         response = request_with_ratelimit_retries(
             max_rate_limit_interval, url=url, headers=headers, verify=verify, **kwargs
         )
         if response.status_code >= 200 and response.status_code < 500:
+            if "gzip" in response.headers.get(CONTENT_ENCODINGS_HEADER, ""):
+                _gzip_hosts.add(cleaned_hostname)
             return response
         else:
             _logger.error(
@@ -102,6 +219,23 @@ def _can_parse_as_json(string):
         return False
 
 
+def _compress_request_body(headers, kwargs):
+    """
+    Compress the ``data`` or ``json`` body of a request with gzip, if it is at least
+    ``_REQUEST_COMPRESSION_MIN_SIZE`` bytes long, updating ``headers`` and ``kwargs`` in place.
+    """
+    data = kwargs.get("data")
+    if kwargs.get("json") is not None:
+        data = json.dumps(kwargs["json"]).encode("utf-8")
+    if not isinstance(data, bytes) or len(data) < _REQUEST_COMPRESSION_MIN_SIZE:
+        return
+    if "json" in kwargs:
+        del kwargs["json"]
+        headers.setdefault("Content-Type", "application/json")
+    kwargs["data"] = gzip.compress(data, compresslevel=6)
+    headers["Content-Encoding"] = "gzip"
+
+
 def http_request_safe(host_creds, endpoint, **kwargs):
     """
     Wrapper around ``http_request`` that also verifies that the request succeeds with code 200.
@@ -141,20 +275,47 @@ def extract_api_info_for_service(service, path_prefix):
 
 
 def call_endpoint(host_creds, endpoint, method, json_body, response_proto):
-    # Convert json string to json dictionary, to pass to requests
-    if json_body:
-        json_body = json.loads(json_body)
-    if method == "GET":
+    """
+    Call a REST API endpoint, and parse its response into ``response_proto``.
+
+    Requests and responses are sent as JSON, unless an earlier response of the host advertised
+    support for the binary protobuf format in its ``X-MLflow-Content-Types`` header. The request
+    body is then sent in the binary protobuf format if ``json_body`` is a protobuf message, and the
+    response is requested in the binary protobuf format.
+
+    :param json_body: The request, as a JSON string or as a protobuf message.
+    :param response_proto: Protobuf message into which the response is parsed.
+    :return: ``response_proto``
+    """
+    host = strip_suffix(host_creds.host, "/")
+    use_protobuf = host in _protobuf_hosts
+    extra_headers = {"Accept": PROTOBUF_CONTENT_TYPE} if use_protobuf else None
+    if use_protobuf and method != "GET" and isinstance(json_body, Message):
         response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, params=json_body
+            host_creds=host_creds,
+            endpoint=endpoint,
+            method=method,
+            data=json_body.SerializeToString(),
+            extra_headers=dict(extra_headers, **{"Content-Type": PROTOBUF_CONTENT_TYPE}),
         )
     else:
-        response = http_request(
-            host_creds=host_creds, endpoint=endpoint, method=method, json=json_body
-        )
+        if isinstance(json_body, Message):
+            json_body = message_to_json(json_body)
+        # Convert json string to json dictionary, to pass to requests
+        if json_body:
+            json_body = json.loads(json_body)
+        kwargs = {"params" if method == "GET" else "json": json_body}
+        if extra_headers:
+            kwargs["extra_headers"] = extra_headers
+        response = http_request(host_creds=host_creds, endpoint=endpoint, method=method, **kwargs)
     response = verify_rest_response(response, endpoint)
-    js_dict = json.loads(response.text)
-    parse_dict(js_dict=js_dict, message=response_proto)
+    if PROTOBUF_CONTENT_TYPE in response.headers.get(CONTENT_TYPES_HEADER, ""):
+        _protobuf_hosts.add(host)
+    if response.headers.get("Content-Type") == PROTOBUF_CONTENT_TYPE:
+        response_proto.ParseFromString(response.content)
+    else:
+        js_dict = json.loads(response.text)
+        parse_dict(js_dict=js_dict, message=response_proto)
     return response_proto
 
 
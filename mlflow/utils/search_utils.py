@@ -1,20 +1,36 @@
 import base64
+import heapq
 import json
 import operator
 import re
 import shlex
+from functools import lru_cache
 
-import sqlparse
-from sqlparse.sql import Identifier, Token, Comparison, Statement
-from sqlparse.tokens import Token as TokenType
+import numpy as np
 
 from mlflow.entities import RunInfo
 from mlflow.exceptions import MlflowException
 from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE
+from mlflow.utils import _search_parser
 
 import math
 
 
+class _ReversedSortValue(object):
+    """Wraps a sort value so that it orders in descending order."""
+
+    __slots__ = ["value"]
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return other.value < self.value
+
+
 class SearchUtils(object):
     LIKE_OPERATOR = "LIKE"
     ILIKE_OPERATOR = "ILIKE"
@@ -47,8 +63,8 @@ class SearchUtils(object):
         + list(_ALTERNATE_TAG_IDENTIFIERS)
         + list(_ALTERNATE_ATTRIBUTE_IDENTIFIERS)
     )
-    STRING_VALUE_TYPES = set([TokenType.Literal.String.Single])
-    NUMERIC_VALUE_TYPES = set([TokenType.Literal.Number.Integer, TokenType.Literal.Number.Float])
+    STRING_VALUE_TYPES = set([_search_parser.STRING])
+    NUMERIC_VALUE_TYPES = set([_search_parser.INTEGER, _search_parser.FLOAT])
     # Registered Models Constants
     ORDER_BY_KEY_TIMESTAMP = "timestamp"
     ORDER_BY_KEY_LAST_UPDATED_TIMESTAMP = "last_updated_timestamp"
@@ -64,6 +80,9 @@ class SearchUtils(object):
         [ORDER_BY_KEY_MODEL_NAME, ORDER_BY_KEY_TIMESTAMP]
     )
 
+    # Maximum number of distinct filter strings / clauses whose parsed and compiled forms are kept
+    _SEARCH_FILTER_CACHE_SIZE = 512
+
     filter_ops = {
         ">": operator.gt,
         ">=": operator.ge,
@@ -159,14 +178,14 @@ class SearchUtils(object):
     @classmethod
     def _get_value(cls, identifier_type, token):
         if identifier_type == cls._METRIC_IDENTIFIER:
-            if token.ttype not in cls.NUMERIC_VALUE_TYPES:
+            if token.kind not in cls.NUMERIC_VALUE_TYPES:
                 raise MlflowException(
                     "Expected numeric value type for metric. " "Found {}".format(token.value),
                     error_code=INVALID_PARAMETER_VALUE,
                 )
             return token.value
         elif identifier_type == cls._PARAM_IDENTIFIER or identifier_type == cls._TAG_IDENTIFIER:
-            if token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier):
+            if token.kind in cls.STRING_VALUE_TYPES or token.kind == _search_parser.IDENTIFIER:
                 return cls._strip_quotes(token.value, expect_quoted_value=True)
             raise MlflowException(
                 "Expected a quoted string value for "
@@ -175,7 +194,7 @@ class SearchUtils(object):
                 error_code=INVALID_PARAMETER_VALUE,
             )
         elif identifier_type == cls._ATTRIBUTE_IDENTIFIER:
-            if token.ttype in cls.STRING_VALUE_TYPES or isinstance(token, Identifier):
+            if token.kind in cls.STRING_VALUE_TYPES or token.kind == _search_parser.IDENTIFIER:
                 return cls._strip_quotes(token.value, expect_quoted_value=True)
             else:
                 raise MlflowException(
@@ -198,24 +217,16 @@ class SearchUtils(object):
                 "{}. Expected 3 tokens found {}".format(base_error_string, len(tokens)),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if not isinstance(tokens[0], Identifier):
+        if tokens[0].kind != _search_parser.IDENTIFIER:
             raise MlflowException(
                 "{}. Expected 'Identifier' found '{}'".format(base_error_string, str(tokens[0])),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if not isinstance(tokens[1], Token) and tokens[1].ttype != TokenType.Operator.Comparison:
+        if tokens[1].kind != _search_parser.COMPARISON_OPERATOR:
             raise MlflowException(
                 "{}. Expected comparison found '{}'".format(base_error_string, str(tokens[1])),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if not isinstance(tokens[2], Token) and (
-            tokens[2].ttype not in cls.STRING_VALUE_TYPES.union(cls.NUMERIC_VALUE_TYPES)
-            or isinstance(tokens[2], Identifier)
-        ):
-            raise MlflowException(
-                "{}. Expected value token found '{}'".format(base_error_string, str(tokens[2])),
-                error_code=INVALID_PARAMETER_VALUE,
-            )
 
     @classmethod
     def _get_comparison(cls, comparison):
@@ -228,11 +239,11 @@ class SearchUtils(object):
 
     @classmethod
     def _invalid_statement_token(cls, token):
-        if isinstance(token, Comparison):
+        if token.kind == _search_parser.COMPARISON:
             return False
         elif token.is_whitespace:
             return False
-        elif token.match(ttype=TokenType.Keyword, values=["AND"]):
+        elif token.is_keyword("AND"):
             return False
         else:
             return True
@@ -240,26 +251,32 @@ class SearchUtils(object):
     @classmethod
     def _process_statement(cls, statement):
         # check validity
-        invalids = list(filter(cls._invalid_statement_token, statement.tokens))
+        invalids = list(filter(cls._invalid_statement_token, statement))
         if len(invalids) > 0:
             invalid_clauses = ", ".join("'%s'" % token for token in invalids)
             raise MlflowException(
                 "Invalid clause(s) in filter string: %s" % invalid_clauses,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        return [cls._get_comparison(si) for si in statement.tokens if isinstance(si, Comparison)]
+        return [cls._get_comparison(si) for si in statement if si.kind == _search_parser.COMPARISON]
 
     @classmethod
     def parse_search_filter(cls, filter_string):
         if not filter_string:
             return []
+        # Hand out copies so that callers cannot modify the cached clauses
+        return [dict(clause) for clause in cls._parse_search_filter_cached(filter_string)]
+
+    @classmethod
+    @lru_cache(maxsize=_SEARCH_FILTER_CACHE_SIZE)
+    def _parse_search_filter_cached(cls, filter_string):
         try:
-            parsed = sqlparse.parse(filter_string)
+            parsed = _search_parser.parse(filter_string)
         except Exception:
             raise MlflowException(
                 "Error on parsing filter '%s'" % filter_string, error_code=INVALID_PARAMETER_VALUE
             )
-        if len(parsed) == 0 or not isinstance(parsed[0], Statement):
+        if len(parsed) == 0:
             raise MlflowException(
                 "Invalid filter '%s'. Could not be parsed." % filter_string,
                 error_code=INVALID_PARAMETER_VALUE,
@@ -270,7 +287,7 @@ class SearchUtils(object):
                 "Provide AND-ed expression list." % filter_string,
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        return SearchUtils._process_statement(parsed[0])
+        return tuple(SearchUtils._process_statement(parsed[0]))
 
     @classmethod
     def is_metric(cls, key_type, comparator):
@@ -320,83 +337,319 @@ class SearchUtils(object):
 
     @classmethod
     def _does_run_match_clause(cls, run, sed):
-        key_type = sed.get("type")
-        key = sed.get("key")
-        value = sed.get("value")
-        comparator = sed.get("comparator").upper()
+        return cls._compile_clause(sed)(run)
 
+    @classmethod
+    def _compile_clause(cls, sed):
+        """
+        Compile a single search clause returned by ``parse_search_filter`` into a predicate that
+        takes a run and returns whether the run satisfies the clause.
+        """
+        return cls._compile_clause_cached(
+            sed.get("type"), sed.get("key"), sed.get("comparator").upper(), sed.get("value")
+        )
+
+    @classmethod
+    @lru_cache(maxsize=_SEARCH_FILTER_CACHE_SIZE)
+    def _compile_clause_cached(cls, key_type, key, comparator, value):
         if cls.is_metric(key_type, comparator):
-            lhs = run.data.metrics.get(key, None)
             value = float(value)
+
+            def get_lhs(run):
+                return run.data.metrics.get(key, None)
+
         elif cls.is_param(key_type, comparator):
-            lhs = run.data.params.get(key, None)
+
+            def get_lhs(run):
+                return run.data.params.get(key, None)
+
         elif cls.is_tag(key_type, comparator):
-            lhs = run.data.tags.get(key, None)
+
+            def get_lhs(run):
+                return run.data.tags.get(key, None)
+
         elif cls.is_attribute(key_type, comparator):
-            lhs = getattr(run.info, key)
+
+            def get_lhs(run):
+                return getattr(run.info, key)
+
         else:
             raise MlflowException(
                 "Invalid search expression type '%s'" % key_type, error_code=INVALID_PARAMETER_VALUE
             )
-        if lhs is None:
-            return False
 
         if comparator in cls.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
-            # Change value from sql syntax to regex syntax
-            if comparator == "ILIKE":
-                value = value.lower()
-                lhs = lhs.lower()
-            if not value.startswith("%"):
-                value = "^" + value
-            if not value.endswith("%"):
-                value = value + "$"
-            value = value.replace("_", ".").replace("%", ".*")
-            return cls.filter_ops.get(comparator)(value, lhs)
-
-        elif comparator in cls.filter_ops.keys():
-            return cls.filter_ops.get(comparator)(lhs, value)
+            case_insensitive = comparator == "ILIKE"
+            pattern = cls._compile_like_pattern(value, case_insensitive)
+
+            def matches(run):
+                lhs = get_lhs(run)
+                if lhs is None:
+                    return False
+                if case_insensitive:
+                    lhs = lhs.lower()
+                return pattern.match(lhs) is not None
+
+        elif comparator in cls.filter_ops:
+            op = cls.filter_ops[comparator]
+
+            def matches(run):
+                lhs = get_lhs(run)
+                return lhs is not None and op(lhs, value)
+
         else:
-            return False
+
+            def matches(run):
+                return False
+
+        return matches
+
+    @classmethod
+    def _compile_like_pattern(cls, value, case_insensitive):
+        # Change value from sql syntax to regex syntax
+        if case_insensitive:
+            value = value.lower()
+        if not value.startswith("%"):
+            value = "^" + value
+        if not value.endswith("%"):
+            value = value + "$"
+        return re.compile(value.replace("_", ".").replace("%", ".*"))
+
+    @classmethod
+    def compile_search_filter(cls, filter_string):
+        """
+        Compile a search filter string into a predicate that takes a run and returns whether the
+        run matches every clause of the filter. Parsed filters and compiled clauses are cached, so
+        compiling the same filter string repeatedly is cheap.
+
+        :param filter_string: Filter query string, e.g. ``"metrics.acc > 0.9"``.
+        :return: A callable accepting a :py:class:`mlflow.entities.Run` and returning a bool.
+        """
+        if not filter_string:
+            return lambda run: True
+        return cls.compile_parsed_filter(cls._parse_search_filter_cached(filter_string))
+
+    @classmethod
+    def compile_parsed_filter(cls, parsed_filters):
+        """
+        Compile search filter clauses returned by ``parse_search_filter`` into a predicate that
+        takes a run and returns whether the run matches every clause.
+        """
+        predicates = [cls._compile_clause(clause) for clause in parsed_filters]
+        if len(predicates) == 1:
+            return predicates[0]
+        return lambda run: all(predicate(run) for predicate in predicates)
 
     @classmethod
     def filter(cls, runs, filter_string):
         """Filters a set of runs based on a search filter string."""
         if not filter_string:
             return runs
-        parsed = cls.parse_search_filter(filter_string)
-
-        def run_matches(run):
-            return all([cls._does_run_match_clause(run, s) for s in parsed])
+        run_matches = cls.compile_search_filter(filter_string)
+        return [run for run in runs if run_matches(run)]
 
+    @classmethod
+    def filter_parsed(cls, runs, parsed_filters, columnar=False):
+        """Filters a set of runs based on search filter clauses returned by
+        ``parse_search_filter``. If ``columnar`` is True, the clauses are evaluated with
+        ``filter_indices_columnar``, which is faster for large numbers of runs."""
+        if columnar:
+            return [runs[i] for i in cls.filter_indices_columnar(runs, parsed_filters)]
+        run_matches = cls.compile_parsed_filter(parsed_filters)
         return [run for run in runs if run_matches(run)]
 
+    @classmethod
+    def _build_search_frame(cls, runs, keys):
+        """
+        Build the columnar representation of ``runs`` used by the vectorized search functions.
+
+        :param runs: List of :py:class:`mlflow.entities.Run`.
+        :param keys: Iterable of ``(key_type, key)`` pairs of the run values to extract.
+        :return: A pair of DataFrames with one row per run and one column per ``(key_type, key)``
+                 pair. The first holds the values of the keys: floats for metrics, NaN when not
+                 logged, and categoricals with sorted categories for params, tags and attributes.
+                 The second holds whether each key was logged for each run.
+        """
+        import pandas as pd
+
+        infos = list(map(operator.attrgetter("info"), runs))
+        datas = list(map(operator.attrgetter("data"), runs))
+        values, logged = {}, {}
+        for key_type, key in keys:
+            if (key_type, key) in values:
+                continue
+            if key_type == cls._METRIC_IDENTIFIER:
+                column = [
+                    metrics.get(key) for metrics in map(operator.attrgetter("metrics"), datas)
+                ]
+                values[(key_type, key)] = np.array(column, dtype=np.float64)
+                logged[(key_type, key)] = np.not_equal(np.array(column, dtype=object), None)
+                continue
+            elif key_type == cls._PARAM_IDENTIFIER:
+                column = [params.get(key) for params in map(operator.attrgetter("params"), datas)]
+            elif key_type == cls._TAG_IDENTIFIER:
+                column = [tags.get(key) for tags in map(operator.attrgetter("tags"), datas)]
+            elif key_type == cls._ATTRIBUTE_IDENTIFIER:
+                column = list(map(operator.attrgetter(key), infos))
+            else:
+                raise MlflowException(
+                    "Invalid search expression type '%s'" % key_type,
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+            # Values that are not logged are encoded with the code -1
+            column = pd.Categorical(column)
+            values[(key_type, key)] = column
+            logged[(key_type, key)] = column.codes >= 0
+        index = pd.RangeIndex(len(runs))
+        return pd.DataFrame(values, index=index), pd.DataFrame(logged, index=index)
+
+    @classmethod
+    def filter_indices_columnar(cls, runs, parsed_filters):
+        """
+        Vectorized equivalent of ``filter_parsed``, which evaluates each search clause over the
+        values of all runs at once rather than one run at a time. Metric comparisons are evaluated
+        as numpy array operations, and string comparisons are evaluated once per distinct value.
+
+        :param runs: List of :py:class:`mlflow.entities.Run`.
+        :param parsed_filters: Search filter clauses returned by ``parse_search_filter``.
+        :return: Numpy array of the indices into ``runs`` of the matching runs, in increasing order.
+        """
+        clauses = [
+            (
+                clause.get("type"),
+                clause.get("key"),
+                clause.get("comparator").upper(),
+                clause["value"],
+            )
+            for clause in parsed_filters
+        ]
+        values, logged = cls._build_search_frame(
+            runs, [(key_type, key) for key_type, key, _, _ in clauses]
+        )
+        matches = np.ones(len(runs), dtype=bool)
+        for key_type, key, comparator, value in clauses:
+            column = values[(key_type, key)]
+            if cls.is_metric(key_type, comparator):
+                op = cls.filter_ops.get(comparator)
+                if op is None:
+                    matches[:] = False
+                    continue
+                matches &= logged[(key_type, key)].values & op(column.values, float(value))
+                continue
+            elif not (
+                cls.is_param(key_type, comparator)
+                or cls.is_tag(key_type, comparator)
+                or cls.is_attribute(key_type, comparator)
+            ):
+                raise MlflowException(
+                    "Invalid search expression type '%s'" % key_type,
+                    error_code=INVALID_PARAMETER_VALUE,
+                )
+
+            categories = column.cat.categories
+            if comparator in cls.CASE_INSENSITIVE_STRING_COMPARISON_OPERATORS:
+                case_insensitive = comparator == "ILIKE"
+                pattern = cls._compile_like_pattern(value, case_insensitive)
+                if case_insensitive:
+                    categories = categories.str.lower()
+                category_matches = [pattern.match(category) is not None for category in categories]
+            elif comparator in cls.filter_ops:
+                op = cls.filter_ops[comparator]
+                category_matches = [op(category, value) for category in categories]
+            else:
+                category_matches = [False] * len(categories)
+            # The trailing False is selected by the code -1 of the runs that did not log the key
+            category_matches = np.array(category_matches + [False], dtype=bool)
+            matches &= category_matches[column.cat.codes.values]
+        return np.flatnonzero(matches)
+
+    @classmethod
+    def sort_indices_columnar(cls, runs, order_by_list, limit=None):
+        """
+        Vectorized equivalent of ``sort``, which orders runs with ``numpy`` operations over
+        columns of sort keys rather than comparing runs one pair at a time. When ``limit`` is
+        specified, the runs that can be among the first ``limit`` runs are selected with a
+        partition on their first sort key before the complete sort keys of these runs are sorted.
+
+        :param runs: List of :py:class:`mlflow.entities.Run`.
+        :param order_by_list: List of order_by clauses, as accepted by ``sort``.
+        :param limit: Optional maximum number of indices to return.
+        :return: Numpy array of the indices into ``runs`` of the first ``limit`` runs (or of all
+                 the runs if ``limit`` is not specified) in sorted order.
+        """
+        order_bys = [cls.parse_order_by_for_search_runs(o) for o in (order_by_list or [])]
+        values, logged = cls._build_search_frame(
+            runs, [(key_type, key) for key_type, key, _ in order_bys]
+        )
+        infos = list(map(operator.attrgetter("info"), runs))
+        # The sort keys of each order_by clause, from the least to the most significant as
+        # expected by ``numpy.lexsort``
+        sort_keys = []
+        for key_type, key, ascending in reversed(order_bys):
+            column = values[(key_type, key)]
+            is_null_or_nan = ~logged[(key_type, key)].values
+            if key_type == cls._METRIC_IDENTIFIER:
+                is_null_or_nan |= np.isnan(column.values)
+                ranks = np.zeros(len(runs), dtype=np.int64)
+                if not is_null_or_nan.all():
+                    _, ranks[~is_null_or_nan] = np.unique(
+                        column.values[~is_null_or_nan], return_inverse=True
+                    )
+            else:
+                # Categories are sorted, so that the codes of the values are their ranks
+                ranks = column.cat.codes.values.astype(np.int64)
+            # Missing values and NaNs are all ranked equally
+            ranks[is_null_or_nan] = 0
+            sort_keys.append(ranks if ascending else -ranks)
+            sort_keys.append(is_null_or_nan)
+
+        candidates = np.arange(len(runs))
+        if limit is not None and 0 < limit < len(runs):
+            if sort_keys:
+                # Ranks are in [-len(runs), len(runs)], missing values and NaNs sort after them
+                first_key = sort_keys[-1] * (2 * len(runs) + 1) + sort_keys[-2]
+            else:
+                first_key = -np.fromiter(
+                    map(operator.attrgetter("start_time"), infos), np.int64, len(runs)
+                )
+            # Keep all the runs tied with the last run of the limit on the first key
+            limit_key = np.partition(first_key, limit - 1)[limit - 1]
+            candidates = np.flatnonzero(first_key <= limit_key)
+            sort_keys = [sort_key[candidates] for sort_key in sort_keys]
+        candidate_infos = [infos[i] for i in candidates]
+        # Runs are naturally ordered by start time descending, then by run id
+        start_times = np.fromiter(
+            map(operator.attrgetter("start_time"), candidate_infos), np.int64, len(candidates)
+        )
+        run_uuids = np.array(list(map(operator.attrgetter("run_uuid"), candidate_infos)), dtype=str)
+        order = np.lexsort([run_uuids, -start_times] + sort_keys)
+        return candidates[order[:limit]]
+
     @classmethod
     def _validate_order_by_and_generate_token(cls, order_by):
         try:
-            parsed = sqlparse.parse(order_by)
+            parsed = _search_parser.parse(order_by)
         except Exception:
             raise MlflowException(
                 "Error on parsing order_by clause '{}'".format(order_by),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if len(parsed) != 1 or not isinstance(parsed[0], Statement):
+        if len(parsed) != 1:
             raise MlflowException(
                 "Invalid order_by clause '{}'. Could not be parsed.".format(order_by),
                 error_code=INVALID_PARAMETER_VALUE,
             )
         statement = parsed[0]
-        if len(statement.tokens) == 1 and isinstance(statement[0], Identifier):
-            token_value = statement.tokens[0].value
-        elif len(statement.tokens) == 1 and statement.tokens[0].match(
-            ttype=TokenType.Keyword, values=[cls.ORDER_BY_KEY_TIMESTAMP]
-        ):
+        if len(statement) == 1 and statement[0].kind == _search_parser.IDENTIFIER:
+            token_value = statement[0].value
+        elif len(statement) == 1 and statement[0].is_keyword(cls.ORDER_BY_KEY_TIMESTAMP.upper()):
             token_value = cls.ORDER_BY_KEY_TIMESTAMP
         elif (
-            statement.tokens[0].match(ttype=TokenType.Keyword, values=[cls.ORDER_BY_KEY_TIMESTAMP])
-            and all([token.is_whitespace for token in statement.tokens[1:-1]])
-            and statement.tokens[-1].ttype == TokenType.Keyword.Order
+            statement[0].is_keyword(cls.ORDER_BY_KEY_TIMESTAMP.upper())
+            and all([token.is_whitespace for token in statement[1:-1]])
+            and statement[-1].kind == _search_parser.ORDER
         ):
-            token_value = cls.ORDER_BY_KEY_TIMESTAMP + " " + statement.tokens[-1].value
+            token_value = cls.ORDER_BY_KEY_TIMESTAMP + " " + statement[-1].value
         else:
             raise MlflowException(
                 "Invalid order_by clause '{}'. Could not be parsed.".format(order_by),
@@ -408,8 +661,12 @@ class SearchUtils(object):
     def _parse_order_by_string(cls, order_by):
         token_value = cls._validate_order_by_and_generate_token(order_by)
         is_ascending = True
-        tokens = shlex.split(token_value.replace("`", '"'))
-        if len(tokens) > 2:
+        try:
+            tokens = shlex.split(token_value.replace("`", '"'))
+        except ValueError:
+            # Unbalanced quotes
+            tokens = []
+        if len(tokens) > 2 or len(tokens) == 0:
             raise MlflowException(
                 "Invalid order_by clause '{}'. Could not be parsed.".format(order_by),
                 error_code=INVALID_PARAMETER_VALUE,
@@ -468,41 +725,75 @@ class SearchUtils(object):
             return (is_null_or_nan, sort_value)
         return (not is_null_or_nan, sort_value)
 
+    @classmethod
+    def _get_sort_key_func(cls, order_by_list):
+        """
+        Returns a function computing the sort key of a run for ``order_by_list``. Runs are ordered
+        by each order_by clause in turn, then by start time descending and by run id. Runs with a
+        missing or NaN value for a clause are ordered last for that clause, and after one another
+        by the following clauses.
+        """
+        order_bys = [cls.parse_order_by_for_search_runs(o) for o in (order_by_list or [])]
+
+        def sort_key(run):
+            key = []
+            for key_type, key_name, ascending in order_bys:
+                is_null_or_nan, sort_value = cls._get_value_for_sort(
+                    run, key_type, key_name, ascending=True
+                )
+                if is_null_or_nan:
+                    # Missing values and NaNs are all equivalent to each other
+                    sort_value = None
+                elif not ascending:
+                    sort_value = _ReversedSortValue(sort_value)
+                key.append((is_null_or_nan, sort_value))
+            key.append(-run.info.start_time)
+            key.append(run.info.run_uuid)
+            return tuple(key)
+
+        return sort_key
+
     @classmethod
     def sort(cls, runs, order_by_list):
         """Sorts a set of runs based on their natural ordering and an overriding set of order_bys.
         Runs are naturally ordered first by start time descending, then by run id for tie-breaking.
         """
-        runs = sorted(runs, key=lambda run: (-run.info.start_time, run.info.run_uuid))
-        if not order_by_list:
-            return runs
-        # NB: We rely on the stability of Python's sort function, so that we can apply
-        # the ordering conditions in reverse order.
-        for order_by_clause in reversed(order_by_list):
-            (key_type, key, ascending) = cls.parse_order_by_for_search_runs(order_by_clause)
-            # pylint: disable=cell-var-from-loop
-            runs = sorted(
-                runs,
-                key=lambda run: cls._get_value_for_sort(run, key_type, key, ascending),
-                reverse=not ascending,
+        return sorted(runs, key=cls._get_sort_key_func(order_by_list))
+
+    @classmethod
+    def sort_and_paginate(cls, runs, order_by_list, page_token, max_results, columnar=False):
+        """
+        Equivalent to calling ``sort`` followed by ``paginate``, but only orders the runs up to
+        the end of the requested page, using bounded heap selection instead of a full sort, or
+        ``sort_indices_columnar`` if ``columnar`` is True, which is faster for large numbers of
+        runs. Returns a pair containing the page of runs, followed by an optional next_page_token
+        if there are further results that need to be returned.
+        """
+        start_offset = cls.parse_start_offset_from_page_token(page_token)
+        final_offset = start_offset + max_results
+
+        if columnar:
+            top_runs = [
+                runs[i] for i in cls.sort_indices_columnar(runs, order_by_list, final_offset)
+            ]
+        else:
+            top_runs = heapq.nsmallest(
+                final_offset, runs, key=cls._get_sort_key_func(order_by_list)
             )
-        return runs
+        next_page_token = None
+        if final_offset < len(runs):
+            next_page_token = cls.create_page_token(final_offset)
+        return (top_runs[start_offset:], next_page_token)
 
     @classmethod
-    def parse_start_offset_from_page_token(cls, page_token):
+    def _parse_page_token(cls, page_token):
         # Note: the page_token is expected to be a base64-encoded JSON that looks like
-        # { "offset": xxx }. However, this format is not stable, so it should not be
-        # relied upon outside of this method.
-        if not page_token:
-            return 0
-
+        # { "offset": xxx }, optionally with a "sort_key" entry. However, this format is not
+        # stable, so it should not be relied upon outside of this class.
         try:
             decoded_token = base64.b64decode(page_token)
-        except TypeError:
-            raise MlflowException(
-                "Invalid page token, could not base64-decode", error_code=INVALID_PARAMETER_VALUE
-            )
-        except base64.binascii.Error:
+        except (TypeError, ValueError):
+            # ``binascii.Error`` is a ``ValueError``, as is the error raised for non-ASCII input.
             raise MlflowException(
                 "Invalid page token, could not base64-decode", error_code=INVALID_PARAMETER_VALUE
             )
@@ -514,7 +805,19 @@ class SearchUtils(object):
                 "Invalid page token, decoded value=%s" % decoded_token,
                 error_code=INVALID_PARAMETER_VALUE,
             )
+        if not isinstance(parsed_token, dict):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return parsed_token
+
+    @classmethod
+    def parse_start_offset_from_page_token(cls, page_token):
+        if not page_token:
+            return 0
 
+        parsed_token = cls._parse_page_token(page_token)
         offset_str = parsed_token.get("offset")
         if not offset_str:
             raise MlflowException(
@@ -524,7 +827,7 @@ class SearchUtils(object):
 
         try:
             offset = int(offset_str)
-        except ValueError:
+        except (TypeError, ValueError):
             raise MlflowException(
                 "Invalid page token, not stringable %s" % offset_str,
                 error_code=INVALID_PARAMETER_VALUE,
@@ -533,8 +836,36 @@ class SearchUtils(object):
         return offset
 
     @classmethod
-    def create_page_token(cls, offset):
-        return base64.b64encode(json.dumps({"offset": offset}).encode("utf-8"))
+    def parse_sort_key_from_page_token(cls, page_token):
+        """
+        Returns the sort key of the last entry of the previous page encoded into the page_token
+        (see ``create_page_token``), or ``None`` if the page_token does not contain a sort key.
+        """
+        if not page_token:
+            return None
+
+        parsed_token = cls._parse_page_token(page_token)
+        sort_key = parsed_token.get("sort_key")
+        if sort_key is not None and not isinstance(sort_key, list):
+            raise MlflowException(
+                "Invalid page token, parsed value=%s" % parsed_token,
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+        return sort_key
+
+    @classmethod
+    def create_page_token(cls, offset, sort_key=None):
+        """
+        :param offset: Offset of the first entry of the next page.
+        :param sort_key: Optional list of JSON-serializable sort key values of the last entry of
+                         the current page, allowing stores to resume the search with a keyset
+                         predicate. The offset is always included so that stores which only
+                         support offset-based pagination can consume the token.
+        """
+        token = {"offset": offset}
+        if sort_key is not None:
+            token["sort_key"] = sort_key
+        return base64.b64encode(json.dumps(token).encode("utf-8"))
 
     @classmethod
     def paginate(cls, runs, page_token, max_results):
@@ -570,7 +901,7 @@ class SearchUtils(object):
                 error_code=INVALID_PARAMETER_VALUE,
             )
         value_token = stripped_comparison[2]
-        if value_token.ttype not in cls.STRING_VALUE_TYPES:
+        if value_token.kind not in cls.STRING_VALUE_TYPES:
             raise MlflowException(
                 "Expected a quoted string value for attributes. "
                 "Got value {value}".format(value=value_token.value),
@@ -589,13 +920,13 @@ class SearchUtils(object):
             return []
         expected = "Expected search filter with single comparison operator. e.g. name='myModelName'"
         try:
-            parsed = sqlparse.parse(filter_string)
+            parsed = _search_parser.parse(filter_string)
         except Exception:
             raise MlflowException(
                 "Error while parsing filter '%s'. %s" % (filter_string, expected),
                 error_code=INVALID_PARAMETER_VALUE,
             )
-        if len(parsed) == 0 or not isinstance(parsed[0], Statement):
+        if len(parsed) == 0:
             raise MlflowException(
                 "Invalid filter '%s'. Could not be parsed. %s" % (filter_string, expected),
                 error_code=INVALID_PARAMETER_VALUE,
@@ -607,7 +938,7 @@ class SearchUtils(object):
                 error_code=INVALID_PARAMETER_VALUE,
             )
         statement = parsed[0]
-        invalids = list(filter(cls._invalid_statement_token, statement.tokens))
+        invalids = list(filter(cls._invalid_statement_token, statement))
         if len(invalids) > 0:
             invalid_clauses = ", ".join("'%s'" % token for token in invalids)
             raise MlflowException(
@@ -616,8 +947,8 @@ class SearchUtils(object):
             )
         return [
             cls._get_comparison_for_model_registry(si, valid_search_keys)
-            for si in statement.tokens
-            if isinstance(si, Comparison)
+            for si in statement
+            if si.kind == _search_parser.COMPARISON
         ]
 
     @classmethod
@@ -25,6 +25,8 @@ _BAD_CHARACTERS_MESSAGE = (
 MAX_PARAMS_TAGS_PER_BATCH = 100
 MAX_METRICS_PER_BATCH = 1000
 MAX_ENTITIES_PER_BATCH = 1000
+MAX_METRIC_SERIES_LENGTH_PER_REQUEST = 100000
+MAX_RUN_IDS_PER_REQUEST = 1000
 MAX_BATCH_LOG_REQUEST_SIZE = int(1e6)
 MAX_PARAM_VAL_LENGTH = 250
 MAX_TAG_VAL_LENGTH = 5000
@@ -91,6 +93,27 @@ def _validate_metric(key, value, timestamp, step):
         )
 
 
+def _validate_metric_series(key, values, steps, timestamps):
+    """
+    Check that a metric series with the specified key, and arrays of values, steps and timestamps
+    is valid and raise an exception if it isn't.
+    """
+    _validate_metric_name(key)
+    if values.ndim != 1 or steps.shape != values.shape or timestamps.shape != values.shape:
+        raise MlflowException(
+            "Got invalid series for metric '%s'. Values, steps and timestamps must be "
+            "one-dimensional arrays of the same length, got shapes %s, %s and %s."
+            % (key, values.shape, steps.shape, timestamps.shape),
+            INVALID_PARAMETER_VALUE,
+        )
+    if (timestamps < 0).any():
+        raise MlflowException(
+            "Got invalid timestamps for metric '%s'. Timestamps must be nonnegative longs "
+            "(64-bit integers)." % key,
+            INVALID_PARAMETER_VALUE,
+        )
+
+
 def _validate_param(key, value):
     """
     Check that a param with the specified key & value is valid and raise an exception if it
@@ -197,6 +220,17 @@ def _validate_batch_limit(entity_name, limit, length):
         raise MlflowException(error_msg, error_code=INVALID_PARAMETER_VALUE)
 
 
+def _validate_get_runs_limit(run_ids):
+    if len(run_ids) > MAX_RUN_IDS_PER_REQUEST:
+        raise MlflowException(
+            "A request can fetch at most {limit} runs. Got {count} run IDs. Please split up the "
+            "run IDs across multiple requests and try again.".format(
+                limit=MAX_RUN_IDS_PER_REQUEST, count=len(run_ids)
+            ),
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+
+
 def _validate_batch_log_limits(metrics, params, tags):
     """Validate that the provided batched logging arguments are within expected limits."""
     _validate_batch_limit(entity_name="metrics", limit=MAX_METRICS_PER_BATCH, length=len(metrics))
@@ -223,6 +257,26 @@ def _validate_batch_log_data(metrics, params, tags):
         _validate_tag(tag.key, tag.value)
 
 
+def _validate_metric_history_params(max_points, start_step, end_step):
+    """
+    Check that the optional downsampling arguments of ``get_metric_history`` are valid and raise an
+    exception if they aren't.
+    """
+    if max_points is not None and (not isinstance(max_points, numbers.Integral) or max_points <= 0):
+        raise MlflowException(
+            "Invalid value %s for parameter 'max_points' supplied. It must be a positive "
+            "integer." % max_points,
+            error_code=INVALID_PARAMETER_VALUE,
+        )
+    for name, step in [("start_step", start_step), ("end_step", end_step)]:
+        if step is not None and not isinstance(step, numbers.Integral):
+            raise MlflowException(
+                "Invalid value %s for parameter '%s' supplied. It must be an integer."
+                % (step, name),
+                error_code=INVALID_PARAMETER_VALUE,
+            )
+
+
 def _validate_batch_log_api_req(json_req):
     if len(json_req) > MAX_BATCH_LOG_REQUEST_SIZE:
         error_msg = (
@@ -50,7 +50,6 @@ setup(
         "querystring_parser",
         "docker>=4.0.0",
         "entrypoints",
-        "sqlparse",
         "sqlalchemy<=1.3.13",
         "gorilla",
         "prometheus-flask-exporter",
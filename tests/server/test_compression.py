@@ -0,0 +1,115 @@
+import gzip
+import json
+import zlib
+
+import mock
+import pytest
+from flask import Flask
+
+from mlflow.entities import Metric, Run, RunData, RunInfo
+from mlflow.protos.databricks_pb2 import INVALID_PARAMETER_VALUE, ErrorCode
+from mlflow.protos.service_pb2 import LogBatch, SearchRuns
+from mlflow.server import app
+from mlflow.server.compression import activate_compression
+from mlflow.store.entities.paged_list import PagedList
+from mlflow.utils.proto_json_utils import message_to_json
+
+
+@pytest.fixture()
+def mock_tracking_store():
+    with mock.patch("mlflow.server.handlers._get_tracking_store") as m:
+        mock_store = mock.MagicMock()
+        m.return_value = mock_store
+        yield mock_store
+
+
+def _decompress(data, encoding):
+    return gzip.decompress(data) if encoding == "gzip" else zlib.decompress(data)
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_large_responses_are_compressed(mock_tracking_store, encoding):
+    runs = [
+        Run(RunInfo("run%d" % i, "0", "user", "FINISHED", 1, 2, "active"), RunData([], [], []))
+        for i in range(1000)
+    ]
+    mock_tracking_store.search_runs.return_value = PagedList(runs, None)
+    with mock.patch("mlflow.server.handlers._STREAMING_CHUNK_SIZE", 1024), app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["0"]},
+            headers={"Accept-Encoding": encoding},
+        )
+        data = response.get_data()
+    assert response.headers["Content-Encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["Vary"]
+    expected = SearchRuns.Response(runs=[run.to_proto() for run in runs])
+    assert json.loads(_decompress(data, encoding)) == json.loads(message_to_json(expected))
+    assert len(data) < len(message_to_json(expected)) / 10
+
+
+def test_small_responses_are_not_compressed(mock_tracking_store):
+    mock_tracking_store.list_experiments.return_value = []
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/experiments/list", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+    assert json.loads(response.get_data()) == {}
+    assert response.headers["X-MLflow-Content-Encodings"] == "gzip, deflate"
+
+
+@pytest.mark.parametrize("min_size", [-1, 0, 1000, 2000])
+def test_compression_min_size(min_size):
+    test_app = Flask(__name__)
+    test_app.add_url_rule("/data", "data", lambda: "a" * 1000)
+    activate_compression(test_app, min_size)
+    with test_app.test_client() as c:
+        response = c.get("/data", headers={"Accept-Encoding": "deflate, gzip;q=0.5"})
+        uncompressed = c.get("/data")
+    if 0 <= min_size <= 1000:
+        assert response.headers["Content-Encoding"] == "deflate"
+        assert zlib.decompress(response.get_data()) == b"a" * 1000
+    else:
+        assert "Content-Encoding" not in response.headers
+        assert response.get_data() == b"a" * 1000
+    assert "Content-Encoding" not in uncompressed.headers
+    assert uncompressed.get_data() == b"a" * 1000
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+def test_compressed_request_bodies_are_decompressed(mock_tracking_store, encoding):
+    request_message = LogBatch(run_id="abc", metrics=[Metric("m", 0.5, 10, 1).to_proto()])
+    data = message_to_json(request_message).encode("utf-8")
+    data = gzip.compress(data) if encoding == "gzip" else zlib.compress(data)
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=data,
+            headers={"Content-Type": "application/json", "Content-Encoding": encoding},
+        )
+    assert response.status_code == 200
+    _, kwargs = mock_tracking_store.log_batch.call_args
+    assert kwargs["run_id"] == "abc"
+    assert [metric.to_proto() for metric in kwargs["metrics"]] == list(request_message.metrics)
+
+
+@pytest.mark.parametrize(
+    ("data", "encoding", "message"),
+    [
+        (b"not gzip", "gzip", "Failed to decompress the gzip request body"),
+        (gzip.compress(b"{}")[:-10], "gzip", "Failed to decompress the gzip request body"),
+        (gzip.compress(b"{}" * 100), "gzip", "Decompressed request bodies must be at most 100"),
+        (b"{}", "br", "Unsupported Content-Encoding 'br'"),
+    ],
+)
+def test_invalid_compressed_request_bodies(mock_tracking_store, data, encoding, message):
+    with mock.patch(
+        "mlflow.server.compression.MAX_DECOMPRESSED_REQUEST_SIZE", 100
+    ), app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch", data=data, headers={"Content-Encoding": encoding}
+        )
+    assert response.status_code == 400
+    json_response = json.loads(response.get_data())
+    assert json_response["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    assert message in json_response["message"]
+    mock_tracking_store.log_batch.assert_not_called()
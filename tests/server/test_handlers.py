@@ -2,11 +2,12 @@ import json
 import uuid
 
 import mock
+import numpy as np
 import pytest
 
 import os
 import mlflow
-from mlflow.entities import ViewType
+from mlflow.entities import Metric, Run, RunData, RunInfo, ViewType
 from mlflow.entities.model_registry import (
     RegisteredModel,
     ModelVersion,
@@ -20,7 +21,10 @@ from mlflow.server.handlers import (
     _create_experiment,
     _get_request_message,
     _search_runs,
+    _get_runs,
+    _get_metric_history,
     _log_batch,
+    _log_metric_series,
     catch_mlflow_exception,
     _create_registered_model,
     _update_registered_model,
@@ -44,7 +48,14 @@ from mlflow.server.handlers import (
 )
 from mlflow.server import BACKEND_STORE_URI_ENV_VAR, app
 from mlflow.store.entities.paged_list import PagedList
-from mlflow.protos.service_pb2 import CreateExperiment, SearchRuns
+from mlflow.protos.service_pb2 import (
+    CreateExperiment,
+    GetMetricHistory,
+    GetRuns,
+    LogBatch,
+    LogMetricSeries,
+    SearchRuns,
+)
 from mlflow.protos.model_registry_pb2 import (
     CreateRegisteredModel,
     UpdateRegisteredModel,
@@ -66,7 +77,7 @@ from mlflow.protos.model_registry_pb2 import (
     SetModelVersionTag,
     DeleteModelVersionTag,
 )
-from mlflow.utils.proto_json_utils import message_to_json
+from mlflow.utils.proto_json_utils import message_to_json, parse_dict
 from mlflow.utils.validation import MAX_BATCH_LOG_REQUEST_SIZE
 
 
@@ -189,6 +200,147 @@ def test_search_runs_default_view_type(mock_get_request_message, mock_tracking_s
     assert args[2] == ViewType.ACTIVE_ONLY
 
 
+def test_get_runs(mock_get_request_message, mock_tracking_store):
+    runs = [
+        Run(RunInfo(run_id, "0", "user", "FINISHED", 1, 2, "active"), RunData([], [], []))
+        for run_id in ["b", "a"]
+    ]
+    mock_get_request_message.return_value = GetRuns(run_ids=["b", "a"])
+    mock_tracking_store.get_runs.return_value = runs
+    response = _get_runs()
+    mock_tracking_store.get_runs.assert_called_once_with(["b", "a"])
+    actual = GetRuns.Response()
+    parse_dict(json.loads(response.get_data()), actual)
+    assert list(actual.runs) == [run.to_proto() for run in runs]
+
+    with mock.patch("mlflow.utils.validation.MAX_RUN_IDS_PER_REQUEST", 1):
+        response = _get_runs()
+    assert response.status_code == 400
+    json_response = json.loads(response.get_data())
+    assert json_response["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_get_metric_history_downsampling_params(mock_get_request_message, mock_tracking_store):
+    request = mock.MagicMock()
+    request.method = "GET"
+    request.query_string = b"run_id=abc&metric_key=m&max_points=10&start_step=5"
+    msg = _get_request_message(GetMetricHistory(), flask_request=request)
+    assert msg.max_points == 10
+    assert msg.start_step == 5
+    assert not msg.HasField("end_step")
+
+    mock_get_request_message.return_value = msg
+    mock_tracking_store.get_metric_history.return_value = []
+    _get_metric_history()
+    mock_tracking_store.get_metric_history.assert_called_once_with(
+        "abc", "m", max_points=10, start_step=5, end_step=None
+    )
+
+
+def test_log_metric_series(mock_get_request_message, mock_tracking_store):
+    mock_get_request_message.return_value = LogMetricSeries(
+        run_id="abc", key="m", values=[0.5, 1.5], steps=[1, 2], timestamps=[10, 11]
+    )
+    _log_metric_series()
+    kwargs = mock_tracking_store.log_metric_series.call_args[1]
+    assert kwargs["run_id"] == "abc"
+    assert kwargs["key"] == "m"
+    assert kwargs["values"].dtype == np.float64
+    assert kwargs["values"].tolist() == [0.5, 1.5]
+    assert kwargs["steps"].tolist() == [1, 2]
+    assert kwargs["timestamps"].tolist() == [10, 11]
+
+    with mock.patch("mlflow.server.handlers.MAX_METRIC_SERIES_LENGTH_PER_REQUEST", 1):
+        response = _log_metric_series()
+    assert response.status_code == 400
+    json_response = json.loads(response.get_data())
+    assert json_response["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_protobuf_request_and_response(mock_tracking_store):
+    request_message = LogBatch(run_id="abc", metrics=[Metric("m", 0.5, 10, 1).to_proto()])
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=request_message.SerializeToString(),
+            headers={"Content-Type": "application/x-protobuf", "Accept": "application/x-protobuf"},
+        )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-protobuf"
+    assert "application/x-protobuf" in response.headers["X-MLflow-Content-Types"]
+    LogBatch.Response().ParseFromString(response.get_data())
+    _, kwargs = mock_tracking_store.log_batch.call_args
+    assert kwargs["run_id"] == "abc"
+    assert [metric.to_proto() for metric in kwargs["metrics"]] == list(request_message.metrics)
+
+
+@pytest.mark.parametrize("accept", [None, "*/*", "application/json"])
+def test_json_response_by_default(mock_tracking_store, accept):
+    mock_tracking_store.list_experiments.return_value = []
+    headers = {"Accept": accept} if accept else {}
+    with app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/experiments/list", headers=headers)
+    assert response.status_code == 200
+    assert response.mimetype == "application/json"
+    assert json.loads(response.get_data()) == {}
+    assert "application/x-protobuf" in response.headers["X-MLflow-Content-Types"]
+
+
+@pytest.mark.parametrize("num_runs", [0, 1, 1000])
+@pytest.mark.parametrize("page_token", [None, "token"])
+def test_search_runs_streams_response(mock_tracking_store, num_runs, page_token):
+    runs = [
+        Run(RunInfo("run%d" % i, "0", "user", "FINISHED", 1, 2, "active"), RunData([], [], []))
+        for i in range(num_runs)
+    ]
+    expected = SearchRuns.Response(runs=[run.to_proto() for run in runs])
+    if page_token:
+        expected.next_page_token = page_token
+    mock_tracking_store.search_runs.return_value = PagedList(runs, page_token)
+
+    with mock.patch("mlflow.server.handlers._STREAMING_CHUNK_SIZE", 1024), app.test_client() as c:
+        response = c.post("/api/2.0/mlflow/runs/search", json={"experiment_ids": ["0"]})
+        assert response.is_streamed
+        assert json.loads(response.get_data()) == json.loads(message_to_json(expected))
+
+        response = c.post(
+            "/api/2.0/mlflow/runs/search",
+            json={"experiment_ids": ["0"]},
+            headers={"Accept": "application/x-protobuf"},
+        )
+        assert response.mimetype == "application/x-protobuf"
+        actual = SearchRuns.Response()
+        actual.ParseFromString(response.get_data())
+        assert actual == expected
+
+
+def test_get_metric_history_streams_response(mock_tracking_store):
+    metrics = [Metric("m", 0.5 * i, i, i) for i in range(100)]
+    mock_tracking_store.get_metric_history.return_value = metrics
+    with mock.patch("mlflow.server.handlers._STREAMING_CHUNK_SIZE", 1024), app.test_client() as c:
+        response = c.get("/api/2.0/mlflow/metrics/get-history?run_id=abc&metric_key=m")
+        chunks = list(response.response)
+    assert response.mimetype == "application/json"
+    assert "application/x-protobuf" in response.headers["X-MLflow-Content-Types"]
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2048 for chunk in chunks)
+    actual = GetMetricHistory.Response()
+    parse_dict(json.loads(b"".join(chunks)), actual)
+    assert list(actual.metrics) == [metric.to_proto() for metric in metrics]
+
+
+def test_malformed_protobuf_request(mock_tracking_store):
+    with app.test_client() as c:
+        response = c.post(
+            "/api/2.0/mlflow/runs/log-batch",
+            data=b"\xff\xff",
+            headers={"Content-Type": "application/x-protobuf"},
+        )
+    assert response.status_code == 400
+    assert json.loads(response.get_data())["error_code"] == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    mock_tracking_store.log_batch.assert_not_called()
+
+
 def test_log_batch_api_req(mock_get_request_json):
     mock_get_request_json.return_value = "a" * (MAX_BATCH_LOG_REQUEST_SIZE + 1)
     response = _log_batch()
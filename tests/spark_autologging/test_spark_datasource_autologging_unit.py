@@ -1,3 +1,5 @@
+import threading
+
 import mock
 
 import pytest
@@ -43,6 +45,20 @@ def test_subscriber_methods():
     assert PythonSubscriber().replId() != subscriber.replId()
 
 
+@pytest.mark.large
+def test_subscriber_notify_sets_tag_on_run_started_by_another_thread():
+    with mock.patch("mlflow._spark_autologging._get_repl_id"):
+        subscriber = PythonSubscriber()
+    # Py4J calls the subscriber on a thread of its callback server, not on the thread of the run
+    with mlflow.start_run() as run, mock.patch(
+        "mlflow._spark_autologging._set_run_tag_async"
+    ) as set_run_tag_mock:
+        thread = threading.Thread(target=subscriber._notify, args=("path", "1", "delta"))
+        thread.start()
+        thread.join()
+    set_run_tag_mock.assert_called_once_with(run.info.run_id, "path", "1", "delta")
+
+
 @pytest.mark.large
 def test_enabling_autologging_throws_for_wrong_spark_version(
     spark_session, mock_get_current_listener
@@ -9,8 +9,10 @@ import tempfile
 import time
 import unittest
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 import mock
+import numpy as np
 import pytest
 
 from mlflow.entities import (
@@ -25,8 +27,15 @@ from mlflow.entities import (
 )
 from mlflow.exceptions import MlflowException, MissingConfigException
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
-from mlflow.store.tracking.file_store import FileStore
-from mlflow.utils.file_utils import write_yaml, read_yaml, path_to_local_file_uri, TempDir
+from mlflow.store.tracking.file_store import FileStore, MLFLOW_FILESTORE_RUN_LOADER_POOL_SIZE
+from mlflow.utils.file_utils import (
+    append_to,
+    write_yaml,
+    read_yaml,
+    path_to_local_file_uri,
+    TempDir,
+)
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.protos.databricks_pb2 import (
     ErrorCode,
     RESOURCE_DOES_NOT_EXIST,
@@ -361,6 +370,108 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         with self.assertRaises(MlflowException):
             fs.get_all_params(run_id)
 
+    def test_run_index_is_rebuilt_and_used_for_run_lookups(self):
+        fs = FileStore(self.test_root)
+        # The test store was created without an index, which is built on the first lookup
+        assert not os.path.exists(fs.run_index_file)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        assert fs.get_run(run_id).info.experiment_id == exp_id
+        assert os.path.exists(fs.run_index_file)
+
+        new_run_id = fs.create_run(exp_id, "user", 0, []).info.run_id
+        other_fs = FileStore(self.test_root)
+        with mock.patch.object(FileStore, "_scan_run_root") as scan_mock:
+            for store in [fs, other_fs]:
+                assert store.get_run(run_id).info.experiment_id == exp_id
+                assert store.get_run(new_run_id).info.experiment_id == exp_id
+            scan_mock.assert_not_called()
+
+        # Runs of deleted experiments are still found
+        fs.delete_experiment(exp_id)
+        assert other_fs.get_run(new_run_id).info.experiment_id == exp_id
+        fs.restore_experiment(exp_id)
+        assert other_fs.get_run(new_run_id).info.experiment_id == exp_id
+
+        fs._hard_delete_run(new_run_id)
+        with mock.patch.object(FileStore, "_scan_run_root") as scan_mock:
+            with pytest.raises(MlflowException) as e:
+                other_fs.get_run(new_run_id)
+            assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+            scan_mock.assert_not_called()
+
+    def test_run_index_falls_back_to_scanning_experiments(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        fs.get_run(run_id)
+        # Simulate a run created by a client that did not update the index
+        open(fs.run_index_file, "w").close()
+        for store in [fs, FileStore(self.test_root)]:
+            assert store.get_run(run_id).info.experiment_id == exp_id
+        with mock.patch.object(FileStore, "_scan_run_root") as scan_mock:
+            assert FileStore(self.test_root).get_run(run_id).info.experiment_id == exp_id
+            scan_mock.assert_not_called()
+
+    def test_run_index_is_shared_by_stores_with_the_same_root_directory(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        fs.get_run(run_id)
+        new_run_id = fs.create_run(exp_id, "user", 0, []).info.run_id
+        with mock.patch.object(FileStore, "_refresh_run_index") as refresh_mock:
+            for run_id in [run_id, new_run_id]:
+                assert FileStore(self.test_root).get_run(run_id).info.experiment_id == exp_id
+            refresh_mock.assert_not_called()
+
+        # Runs created by other processes are found in the index file
+        with mock.patch("mlflow.store.tracking.file_store._run_indexes", {}):
+            other_run_id = FileStore(self.test_root).create_run(exp_id, "user", 0, []).info.run_id
+        with mock.patch.object(FileStore, "_scan_run_root") as scan_mock:
+            assert FileStore(self.test_root).get_run(other_run_id).info.experiment_id == exp_id
+            scan_mock.assert_not_called()
+
+    def test_run_index_is_kept_in_memory_if_it_cannot_be_written(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        with mock.patch("mlflow.store.tracking.file_store.os.replace", side_effect=OSError):
+            assert fs.get_run(run_id).info.experiment_id == exp_id
+        assert not os.path.exists(fs.run_index_file)
+        with mock.patch.object(FileStore, "_get_active_experiments") as list_mock:
+            for _ in range(3):
+                assert fs.get_run(run_id).info.experiment_id == exp_id
+            list_mock.assert_not_called()
+
+    def test_run_index_file_is_compacted(self):
+        fs = FileStore(self.test_root)
+        exp_id = self.experiments[0]
+        run_id = self.exp_data[exp_id]["runs"][0]
+        fs.get_run(run_id)
+        deleted_run_ids = [fs.create_run(exp_id, "user", 0, []).info.run_id for _ in range(20)]
+        for deleted_run_id in deleted_run_ids:
+            fs._hard_delete_run(deleted_run_id)
+        with open(fs.run_index_file) as f:
+            num_lines = len(f.readlines())
+        # A new process reads the whole index file and rewrites it without the deleted runs
+        with mock.patch("mlflow.store.tracking.file_store._run_indexes", {}), mock.patch(
+            "mlflow.store.tracking.file_store._RUN_INDEX_COMPACTION_MIN_STALE_ENTRIES", 0
+        ):
+            other_fs = FileStore(self.test_root)
+            other_fs.get_run(run_id)
+            with open(fs.run_index_file) as f:
+                lines = f.read().splitlines()
+            assert len(lines) == num_lines - 2 * len(deleted_run_ids)
+            assert all(line.split(" ")[0] not in deleted_run_ids for line in lines)
+            for deleted_run_id in deleted_run_ids:
+                with pytest.raises(MlflowException):
+                    other_fs.get_run(deleted_run_id)
+        # Stores using the index read before the file was rewritten read the new file
+        new_run_id = other_fs.create_run(exp_id, "user", 0, []).info.run_id
+        with mock.patch.object(FileStore, "_scan_run_root") as scan_mock:
+            assert fs.get_run(new_run_id).info.experiment_id == exp_id
+            scan_mock.assert_not_called()
+
     def test_get_deleted_runs(self):
         fs = FileStore(self.test_root)
         exp_id = self.experiments[0]
@@ -476,6 +587,38 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         with safe_edit_yaml(root_dir, "meta.yaml", self._experiment_id_edit_func):
             self._verify_run(fs, run_id)
 
+    def test_get_runs(self):
+        fs = FileStore(self.test_root)
+        run_ids = [
+            run_id for exp_id in self.experiments for run_id in self.exp_data[exp_id]["runs"]
+        ]
+        requested_run_ids = run_ids[::-1] + run_ids[:1]
+        runs = fs.get_runs(requested_run_ids)
+        assert [run.info.run_id for run in runs] == requested_run_ids
+        for run in runs:
+            expected_run = fs.get_run(run.info.run_id)
+            assert run.info == expected_run.info
+            assert run.data.metrics == expected_run.data.metrics
+            assert run.data.params == expected_run.data.params
+            assert run.data.tags == expected_run.data.tags
+        assert fs.get_runs([]) == []
+
+        # Runs created by other processes are looked up with a single index refresh
+        exp_id = self.experiments[0]
+        with mock.patch("mlflow.store.tracking.file_store._run_indexes", {}):
+            other_fs = FileStore(self.test_root)
+            new_run_ids = [other_fs.create_run(exp_id, "user", 0, []).info.run_id for _ in range(3)]
+        with mock.patch.object(
+            fs, "_refresh_run_index", wraps=fs._refresh_run_index
+        ) as refresh_mock:
+            runs = fs.get_runs(new_run_ids)
+        refresh_mock.assert_called_once()
+        assert [run.info.run_id for run in runs] == new_run_ids
+
+        with pytest.raises(MlflowException, match="Runs with ids=a, b not found") as e:
+            fs.get_runs([run_ids[0], "b", "a"])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     def test_list_run_infos(self):
         fs = FileStore(self.test_root)
         for exp_id in self.experiments:
@@ -523,6 +666,37 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         assert metric_obj.timestamp == 50
         assert metric_obj.value == 20
 
+    def test_latest_metric_value_is_cached_and_invalidated_on_external_writes(self):
+        fs = FileStore(self.test_root)
+        run = self._create_run(fs)
+        run_id = run.info.run_id
+        for step, value in [(2 ** 60 + 1, 1.0), (2 ** 60, 2.0), (0, 3.0)]:
+            fs.log_metric(run_id, Metric("m", value, 10, step))
+        with mock.patch.object(FileStore, "_compute_latest_metric") as compute_mock:
+            metric = fs.get_all_metrics(run_id)[0]
+            compute_mock.assert_not_called()
+        assert (metric.step, metric.value) == (2 ** 60 + 1, 1.0)
+
+        # Metrics appended without going through the store invalidate the cached value
+        metric_path = fs._get_metric_path(run.info.experiment_id, run_id, "m")
+        with open(metric_path, "a") as f:
+            f.write("20 4.0 %d\n" % (2 ** 60 + 1))
+        metric = fs.get_all_metrics(run_id)[0]
+        assert (metric.step, metric.timestamp, metric.value) == (2 ** 60 + 1, 20, 4.0)
+        with mock.patch.object(FileStore, "_compute_latest_metric") as compute_mock:
+            assert fs.get_run(run_id).data.metrics == {"m": 4.0}
+            compute_mock.assert_not_called()
+
+    def test_compute_latest_metric_compares_large_steps_exactly(self):
+        fs = FileStore(self.test_root)
+        run = self._create_run(fs)
+        metric_path = fs._get_metric_path(run.info.experiment_id, run.info.run_id, "m")
+        # Both steps round to the same float, the larger step must win despite its older timestamp
+        with open(metric_path, "w") as f:
+            f.write("50 1.0 %d\n100 2.0 %d\n" % (2 ** 53 + 1, 2 ** 53))
+        metric = FileStore._compute_latest_metric(os.path.dirname(metric_path), "m")
+        assert (metric.step, metric.timestamp, metric.value) == (2 ** 53 + 1, 50, 1.0)
+
     def test_get_all_metrics(self):
         fs = FileStore(self.test_root)
         for exp_id in self.experiments:
@@ -552,6 +726,36 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
                         self.assertEqual(metric.key, metric_name)
                         self.assertEqual(metric.value, metric_value)
 
+    def test_get_metric_history_with_step_range_and_max_points(self):
+        fs = FileStore(self.test_root)
+        run_id = fs.create_run(FileStore.DEFAULT_EXPERIMENT_ID, "user", 0, []).info.run_id
+        key = "test"
+        # Log the metrics in reverse order, followed by a second value at step 10 that is logged
+        # later and must not be picked by downsampling
+        metrics = [Metric(key, float(step), 100 + step, step) for step in reversed(range(100))]
+        metrics.append(Metric(key, -1.0, 500, 10))
+        fs.log_batch(run_id, metrics=metrics, params=[], tags=[])
+
+        def steps_and_values(history):
+            return [(m.step, m.value) for m in history]
+
+        assert len(fs.get_metric_history(run_id, key)) == 101
+        actual = fs.get_metric_history(run_id, key, start_step=95, end_step=97)
+        assert steps_and_values(actual) == [(97, 97.0), (96, 96.0), (95, 95.0)]
+
+        actual = fs.get_metric_history(run_id, key, max_points=10)
+        assert steps_and_values(actual) == [(step, float(step)) for step in range(0, 100, 10)]
+        actual = fs.get_metric_history(run_id, key, max_points=3, start_step=50)
+        assert steps_and_values(actual) == [(50, 50.0), (67, 67.0), (84, 84.0)]
+        actual = fs.get_metric_history(run_id, key, max_points=4, start_step=9, end_step=11)
+        assert steps_and_values(actual) == [(9, 9.0), (10, 10.0), (10, -1.0), (11, 11.0)]
+        assert fs.get_metric_history(run_id, key, max_points=5, start_step=200) == []
+
+        for max_points in [0, -1, 1.5]:
+            with pytest.raises(MlflowException, match="max_points") as e:
+                fs.get_metric_history(run_id, key, max_points=max_points)
+            assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
     def _search(
         self,
         fs,
@@ -901,6 +1105,96 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
             if rid != bad_run_id:
                 fs.get_run(rid)
 
+    def test_search_runs_only_reads_run_data_of_matching_runs(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("lazy search")
+        run_ids = []
+        for i in range(10):
+            run_id = fs.create_run(exp_id, "user", i, []).info.run_id
+            fs.log_batch(
+                run_id,
+                metrics=[Metric("m1", i, 0, 0), Metric("m2", i, 0, 0)],
+                params=[Param("p", "even" if i % 2 == 0 else "odd")],
+                tags=[RunTag("t", str(i))],
+            )
+            run_ids.append(run_id)
+
+        with mock.patch.object(
+            FileStore, "_get_metric_from_file", wraps=FileStore._get_metric_from_file
+        ) as metric_mock, mock.patch.object(
+            FileStore, "_get_param_from_file", wraps=FileStore._get_param_from_file
+        ) as param_mock:
+            runs = fs.search_runs(
+                [exp_id],
+                "attributes.status = 'RUNNING' and params.p = 'even' and metrics.m1 >= 4",
+                ViewType.ALL,
+                max_results=2,
+                order_by=["metrics.m1 DESC"],
+            )
+            assert [run.info.run_id for run in runs] == [run_ids[8], run_ids[6]]
+            assert runs[0].data.metrics == {"m1": 8, "m2": 8}
+            assert runs[0].data.tags == {"t": "8"}
+            # "p" is read for every run, "m1" for the 5 even runs, all data of the returned runs
+            assert param_mock.call_count == 10 + 2
+            assert metric_mock.call_count == 5 + 2 * 2
+
+            metric_mock.reset_mock()
+            param_mock.reset_mock()
+            runs = fs.search_runs([exp_id], "", ViewType.ALL, max_results=3)
+            assert [run.info.run_id for run in runs] == run_ids[:-4:-1]
+            assert param_mock.call_count == 3
+            assert metric_mock.call_count == 3 * 2
+
+    def test_search_runs_with_concurrent_run_loader(self):
+        fs = FileStore(self.test_root)
+        expected_runs = fs.search_runs(self.experiments, None, ViewType.ALL)
+        # A malformed run is skipped when loading runs concurrently as well
+        bad_run_id = self.exp_data[self.experiments[0]]["runs"][0]
+        os.remove(os.path.join(self.test_root, self.experiments[0], bad_run_id, "meta.yaml"))
+        expected_runs = [run for run in expected_runs if run.info.run_id != bad_run_id]
+        with mock.patch.dict(os.environ, {MLFLOW_FILESTORE_RUN_LOADER_POOL_SIZE: "4"}):
+            fs = FileStore(self.test_root)
+        with mock.patch(
+            "mlflow.store.tracking.file_store.ThreadPoolExecutor", wraps=ThreadPoolExecutor
+        ) as pool_mock:
+            runs = fs.search_runs(self.experiments, None, ViewType.ALL)
+            assert pool_mock.call_count > 0
+        assert [run.to_dictionary() for run in runs] == [
+            run.to_dictionary() for run in expected_runs
+        ]
+
+    def test_search_runs_with_columnar_evaluation(self):
+        fs = FileStore(self.test_root)
+        exp_id = fs.create_experiment("columnar search")
+        for i in range(10):
+            run_id = fs.create_run(exp_id, "user", i % 3, []).info.run_id
+            fs.log_batch(
+                run_id,
+                metrics=[Metric("m", i % 4, 0, 0)] if i % 5 else [],
+                params=[Param("p", "even" if i % 2 == 0 else "odd")],
+                tags=[],
+            )
+        filter_strings = ["", "params.p LIKE 'e%' and metrics.m >= 1", "attributes.status != 'x'"]
+        order_bys = [[], ["metrics.m DESC"], ["params.p", "metrics.m"]]
+        for filter_string in filter_strings:
+            for order_by in order_bys:
+                expected_runs = fs.search_runs(
+                    [exp_id], filter_string, ViewType.ALL, max_results=4, order_by=order_by
+                )
+                with mock.patch(
+                    "mlflow.store.tracking.file_store._COLUMNAR_SEARCH_MIN_RUNS", 0
+                ), mock.patch.object(
+                    SearchUtils, "sort_indices_columnar", wraps=SearchUtils.sort_indices_columnar
+                ) as sort_mock:
+                    runs = fs.search_runs(
+                        [exp_id], filter_string, ViewType.ALL, max_results=4, order_by=order_by
+                    )
+                    assert sort_mock.call_count == 1
+                assert [run.info.run_id for run in runs] == [
+                    run.info.run_id for run in expected_runs
+                ]
+                assert runs.token == expected_runs.token
+
     def test_mismatching_experiment_id(self):
         fs = FileStore(self.test_root)
         exp_0 = fs.get_experiment(FileStore.DEFAULT_EXPERIMENT_ID)
@@ -1058,6 +1352,40 @@ class TestFileStore(unittest.TestCase, AbstractStoreTest):
         fs.log_batch(run.info.run_id, metrics=[], params=[], tags=tags)
         self._verify_logged(fs, run.info.run_id, metrics=[], params=[], tags=[tags[-1]])
 
+    def test_log_metric_series(self):
+        fs = FileStore(self.test_root)
+        run_id = self._create_run(fs).info.run_id
+        fs.log_metric(run_id, Metric("m", 5.0, 1, 3))
+        values = np.array([0.5, np.nan, np.inf, 2.0])
+        steps = np.array([0, 1, 2, 3])
+        timestamps = np.array([10, 11, 12, 13])
+        with mock.patch(
+            "mlflow.store.tracking.file_store.append_to", wraps=append_to
+        ) as append_to_mock:
+            fs.log_metric_series(run_id, "m", values, steps, timestamps)
+        append_to_mock.assert_called_once()
+
+        history = sorted(fs.get_metric_history(run_id, "m"), key=lambda m: (m.step, m.timestamp))
+        assert [(m.step, m.timestamp) for m in history] == [
+            (0, 10),
+            (1, 11),
+            (2, 12),
+            (3, 1),
+            (3, 13),
+        ]
+        np.testing.assert_array_equal([m.value for m in history], [0.5, np.nan, np.inf, 5.0, 2.0])
+        latest_metric = fs.get_run(run_id).data.metrics["m"]
+        assert latest_metric == 2.0
+        # The cached latest value matches the value computed from the metric file
+        run_dir = fs._get_run_dir(FileStore.DEFAULT_EXPERIMENT_ID, run_id)
+        computed = FileStore._compute_latest_metric(os.path.join(run_dir, "metrics"), "m")
+        assert (computed.step, computed.timestamp, computed.value) == (3, 13, 2.0)
+
+        fs.log_metric_series(run_id, "m", np.array([]), np.array([]), np.array([]))
+        assert len(fs.get_metric_history(run_id, "m")) == 5
+        with pytest.raises(MlflowException, match="same length"):
+            fs.log_metric_series(run_id, "m", values, steps[:2], timestamps)
+
     def test_log_batch_accepts_empty_payload(self):
         fs = FileStore(self.test_root)
         run = self._create_run(fs)
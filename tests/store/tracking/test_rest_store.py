@@ -1,7 +1,9 @@
 import json
 import unittest
+from contextlib import contextmanager
 
 import mock
+import numpy as np
 import pytest
 import six
 
@@ -22,8 +24,10 @@ from mlflow.protos.service_pb2 import (
     CreateRun,
     DeleteExperiment,
     DeleteRun,
+    GetRuns,
     LogBatch,
     LogMetric,
+    LogMetricSeries,
     LogParam,
     RestoreExperiment,
     RestoreRun,
@@ -48,6 +52,15 @@ from mlflow.utils.proto_json_utils import message_to_json
 from mlflow.utils.rest_utils import MlflowHostCreds, _DEFAULT_HEADERS
 
 
+@contextmanager
+def _mock_http_request():
+    """Patch ``http_request`` to return successful responses with an empty JSON body."""
+    with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        mock_http.return_value.status_code = 200
+        mock_http.return_value.text = "{}"
+        yield mock_http
+
+
 class MyCoolException(Exception):
     pass
 
@@ -58,7 +71,7 @@ class CustomErrorHandlingRestStore(RestStore):
 
 
 class TestRestStore(object):
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_successful_http_request(self, request):
         def mock_request(**kwargs):
             # Filter out None arguments
@@ -70,7 +83,7 @@ class TestRestStore(object):
                 "headers": _DEFAULT_HEADERS,
                 "verify": True,
             }
-            response = mock.MagicMock
+            response = mock.MagicMock()
             response.status_code = 200
             response.text = '{"experiments": [{"name": "Exp!", "lifecycle_stage": "active"}]}'
             return response
@@ -81,9 +94,9 @@ class TestRestStore(object):
         experiments = store.list_experiments()
         assert experiments[0].name == "Exp!"
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request(self, request):
-        response = mock.MagicMock
+        response = mock.MagicMock()
         response.status_code = 404
         response.text = '{"error_code": "RESOURCE_DOES_NOT_EXIST", "message": "No experiment"}'
         request.return_value = response
@@ -93,9 +106,9 @@ class TestRestStore(object):
             store.list_experiments()
         assert "RESOURCE_DOES_NOT_EXIST: No experiment" in str(cm.value)
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_failed_http_request_custom_handler(self, request):
-        response = mock.MagicMock
+        response = mock.MagicMock()
         response.status_code = 404
         response.text = '{"error_code": "RESOURCE_DOES_NOT_EXIST", "message": "No experiment"}'
         request.return_value = response
@@ -104,7 +117,7 @@ class TestRestStore(object):
         with pytest.raises(MyCoolException):
             store.list_experiments()
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_response_with_unknown_fields(self, request):
         experiment_json = {
             "experiment_id": "1",
@@ -114,7 +127,7 @@ class TestRestStore(object):
             "OMG_WHAT_IS_THIS_FIELD": "Hooly cow",
         }
 
-        response = mock.MagicMock
+        response = mock.MagicMock()
         response.status_code = 200
         experiments = {"experiments": [experiment_json]}
         response.text = json.dumps(experiments)
@@ -140,9 +153,9 @@ class TestRestStore(object):
     def _verify_requests(self, http_request, host_creds, endpoint, method, json_body):
         http_request.assert_any_call(**(self._args(host_creds, endpoint, method, json_body)))
 
-    @mock.patch("requests.request")
+    @mock.patch("requests.Session.request")
     def test_requestor(self, request):
-        response = mock.MagicMock
+        response = mock.MagicMock()
         response.status_code = 200
         response.text = "{}"
         request.return_value = response
@@ -160,13 +173,16 @@ class TestRestStore(object):
             "mlflow.tracking.context.default_context._get_source_type",
             return_value=SourceType.LOCAL,
         )
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http, mock.patch(
+        source_version_patch = mock.patch(
+            "mlflow.tracking.context.git_context.GitRunContext.in_context", return_value=False
+        )
+        with _mock_http_request() as mock_http, mock.patch(
             "mlflow.tracking._tracking_service.utils._get_store", return_value=store
         ), mock.patch(
             "mlflow.tracking.context.default_context._get_user", return_value=user_name
         ), mock.patch(
             "time.time", return_value=13579
-        ), source_name_patch, source_type_patch:
+        ), source_name_patch, source_type_patch, source_version_patch:
             with mlflow.start_run(experiment_id="43"):
                 cr_body = message_to_json(
                     CreateRun(
@@ -194,40 +210,40 @@ class TestRestStore(object):
                 )
                 assert expected_kwargs == actual_kwargs
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.log_param("some_uuid", Param("k1", "v1"))
             body = message_to_json(
                 LogParam(run_uuid="some_uuid", run_id="some_uuid", key="k1", value="v1")
             )
             self._verify_requests(mock_http, creds, "runs/log-parameter", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.set_experiment_tag("some_id", ExperimentTag("t1", "abcd" * 1000))
             body = message_to_json(
                 SetExperimentTag(experiment_id="some_id", key="t1", value="abcd" * 1000)
             )
             self._verify_requests(mock_http, creds, "experiments/set-experiment-tag", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.set_tag("some_uuid", RunTag("t1", "abcd" * 1000))
             body = message_to_json(
                 SetTag(run_uuid="some_uuid", run_id="some_uuid", key="t1", value="abcd" * 1000)
             )
             self._verify_requests(mock_http, creds, "runs/set-tag", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.delete_tag("some_uuid", "t1")
             body = message_to_json(DeleteTag(run_id="some_uuid", key="t1"))
             self._verify_requests(mock_http, creds, "runs/delete-tag", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.log_metric("u2", Metric("m1", 0.87, 12345, 3))
             body = message_to_json(
                 LogMetric(run_uuid="u2", run_id="u2", key="m1", value=0.87, timestamp=12345, step=3)
             )
             self._verify_requests(mock_http, creds, "runs/log-metric", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             metrics = [
                 Metric("m1", 0.87, 12345, 0),
                 Metric("m2", 0.49, 12345, -1),
@@ -244,19 +260,19 @@ class TestRestStore(object):
             )
             self._verify_requests(mock_http, creds, "runs/log-batch", "POST", body)
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.delete_run("u25")
             self._verify_requests(
                 mock_http, creds, "runs/delete", "POST", message_to_json(DeleteRun(run_id="u25"))
             )
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.restore_run("u76")
             self._verify_requests(
                 mock_http, creds, "runs/restore", "POST", message_to_json(RestoreRun(run_id="u76"))
             )
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.delete_experiment("0")
             self._verify_requests(
                 mock_http,
@@ -266,7 +282,7 @@ class TestRestStore(object):
                 message_to_json(DeleteExperiment(experiment_id="0")),
             )
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             store.restore_experiment("0")
             self._verify_requests(
                 mock_http,
@@ -277,8 +293,14 @@ class TestRestStore(object):
             )
 
         with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
-            response = mock.MagicMock
-            response.text = '{"runs": ["1a", "2b", "3c"], "next_page_token": "67890fghij"}'
+            response = mock.MagicMock()
+            response.status_code = 200
+            response.text = json.dumps(
+                {
+                    "runs": [{"info": {"run_id": run_id}} for run_id in ["1a", "2b", "3c"]],
+                    "next_page_token": "67890fghij",
+                }
+            )
             mock_http.return_value = response
             result = store.search_runs(
                 ["0", "1"],
@@ -300,9 +322,10 @@ class TestRestStore(object):
             self._verify_requests(
                 mock_http, creds, "runs/search", "POST", message_to_json(expected_message)
             )
+            assert [run.info.run_id for run in result] == ["1a", "2b", "3c"]
             assert result.token == "67890fghij"
 
-        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
+        with _mock_http_request() as mock_http:
             run_id = "run_id"
             m = Model(artifact_path="model/path", run_id="run_id", flavors={"tf": "flavor body"})
             result = store.record_logged_model("run_id", m)
@@ -311,12 +334,52 @@ class TestRestStore(object):
                 mock_http, creds, "runs/log-model", "POST", message_to_json(expected_message)
             )
 
+    def test_log_metric_series(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        values = np.array([0.5, 1.5, 2.5])
+        steps = np.array([0, 1, 2])
+        timestamps = np.array([10, 11, 12])
+        with _mock_http_request() as mock_http, mock.patch(
+            "mlflow.store.tracking.rest_store.MAX_METRIC_SERIES_LENGTH_PER_REQUEST", 2
+        ):
+            store.log_metric_series("u2", "m", values, steps, timestamps)
+            assert mock_http.call_count == 2
+            for chunk in [slice(0, 2), slice(2, 3)]:
+                body = message_to_json(
+                    LogMetricSeries(
+                        run_id="u2",
+                        key="m",
+                        values=values[chunk].tolist(),
+                        steps=steps[chunk].tolist(),
+                        timestamps=timestamps[chunk].tolist(),
+                    )
+                )
+                self._verify_requests(mock_http, creds, "runs/log-metric-series", "POST", body)
+
+    def test_get_runs(self):
+        creds = MlflowHostCreds("https://hello")
+        store = RestStore(lambda: creds)
+        response = GetRuns.Response()
+        response.runs.add().info.run_id = "u1"
+        with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http, mock.patch(
+            "mlflow.store.tracking.rest_store.MAX_RUN_IDS_PER_REQUEST", 2
+        ):
+            mock_http.return_value.status_code = 200
+            mock_http.return_value.text = message_to_json(response)
+            runs = store.get_runs(["u1", "u2", "u3"])
+            assert mock_http.call_count == 2
+            for run_ids in [["u1", "u2"], ["u3"]]:
+                body = message_to_json(GetRuns(run_ids=run_ids))
+                self._verify_requests(mock_http, creds, "runs/get-batch", "POST", body)
+        assert [run.info.run_id for run in runs] == ["u1", "u1"]
+
     @pytest.mark.parametrize("store_class", [RestStore, DatabricksRestStore])
     def test_get_experiment_by_name(self, store_class):
         creds = MlflowHostCreds("https://hello")
         store = store_class(lambda: creds)
         with mock.patch("mlflow.utils.rest_utils.http_request") as mock_http:
-            response = mock.MagicMock
+            response = mock.MagicMock()
             response.status_code = 200
             experiment = Experiment(
                 experiment_id="123",
@@ -343,7 +406,7 @@ class TestRestStore(object):
             assert result.lifecycle_stage == experiment.lifecycle_stage
             # Test GetExperimentByName against nonexistent experiment
             mock_http.reset_mock()
-            nonexistent_exp_response = mock.MagicMock
+            nonexistent_exp_response = mock.MagicMock()
             nonexistent_exp_response.status_code = 404
             nonexistent_exp_response.text = MlflowException(
                 "Exp doesn't exist!", RESOURCE_DOES_NOT_EXIST
@@ -363,7 +426,7 @@ class TestRestStore(object):
             # Test REST client behavior against a mocked old server, which has handler for
             # ListExperiments but not GetExperimentByName
             mock_http.reset_mock()
-            list_exp_response = mock.MagicMock
+            list_exp_response = mock.MagicMock()
             list_exp_response.text = json.dumps(
                 {"experiments": [json.loads(message_to_json(experiment.to_proto()))]}
             )
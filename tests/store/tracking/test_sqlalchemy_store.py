@@ -1,5 +1,7 @@
 import os
+import random
 import shutil
+import string
 import six
 import tempfile
 import unittest
@@ -13,6 +15,7 @@ import time
 import mlflow
 import uuid
 import json
+import numpy as np
 import pandas as pd
 
 import mlflow.db
@@ -38,6 +41,7 @@ from mlflow.exceptions import MlflowException
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore, _get_orderby_clauses
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
+from mlflow.utils.search_utils import SearchUtils
 from mlflow.utils.uri import extract_db_type_from_uri
 from tests.resources.db.initial_models import Base as InitialBase
 from tests.integration.utils import invoke_cli_runner
@@ -643,6 +647,39 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         assert metric_obj.timestamp == 50
         assert metric_obj.value == 20
 
+    def test_log_metric_latest_metrics_without_upsert_support(self):
+        # Verify that the fallback used for databases without conditional upserts (e.g. MSSQL)
+        # selects the same latest metric values as the upsert statement
+        experiment_id = self._experiment_factory("latest_metrics_fallback")
+        run_ids = [
+            self._run_factory(self._get_run_configs(experiment_id)).info.run_id for _ in range(2)
+        ]
+        tuples_to_log = [(0, 100, 1000), (3, 40, 100), (3, 50, 10), (3, 50, 20), (-3, 900, 900)]
+        with mock.patch.object(
+            SqlAlchemyStore, "_get_latest_metrics_upsert_statement", return_value=None
+        ):
+            for step, timestamp, value in tuples_to_log:
+                self.store.log_metric(run_ids[0], Metric("m", value, timestamp, step))
+        for step, timestamp, value in tuples_to_log:
+            self.store.log_metric(run_ids[1], Metric("m", value, timestamp, step))
+
+        metric_objs = [self.store.get_run(run_id).data._metric_objs for run_id in run_ids]
+        for (metric_obj,) in metric_objs:
+            assert (metric_obj.step, metric_obj.timestamp, metric_obj.value) == (3, 50, 20)
+
+    def test_get_latest_metrics_upsert_statement(self):
+        from sqlalchemy.dialects import mysql, postgresql
+
+        for db_type, dialect, expected_clause in [
+            ("postgresql", postgresql.dialect(), "ON CONFLICT (key, run_uuid) DO UPDATE"),
+            ("mysql", mysql.dialect(), "ON DUPLICATE KEY UPDATE"),
+        ]:
+            with mock.patch.object(self.store, "db_type", db_type):
+                statement = self.store._get_latest_metrics_upsert_statement()
+            assert expected_clause in str(statement.compile(dialect=dialect))
+        with mock.patch.object(self.store, "db_type", MSSQL):
+            assert self.store._get_latest_metrics_upsert_statement() is None
+
     def test_log_null_metric(self):
         run = self._run_factory()
 
@@ -767,6 +804,16 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         run = self.store.get_run(run.info.run_id)
         self.assertTrue(tkey in run.data.tags and run.data.tags[tkey] == new_val)
 
+    def test_set_tag_with_long_random_value_can_be_searched(self):
+        experiment_id = self._experiment_factory("long_tag_value")
+        run_id = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
+        # Random values do not compress, so they exceed the index entry size limits of databases
+        # that would reject them if tag values were index keys
+        tval = "".join(random.choice(string.ascii_letters + string.digits) for _ in range(5000))
+        self.store.set_tag(run_id, entities.RunTag("long_tag", tval))
+        assert self.store.get_run(run_id).data.tags["long_tag"] == tval
+        assert self._search(experiment_id, "tags.long_tag = '%s'" % tval) == [run_id]
+
     def test_delete_tag(self):
         run = self._run_factory()
         k0, v0 = "tag0", "val0"
@@ -821,6 +868,34 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             [(m.key, m.value, m.timestamp) for m in actual],
         )
 
+    def test_get_metric_history_with_step_range_and_max_points(self):
+        run_id = self._run_factory().info.run_id
+        key = "test"
+        metrics = [Metric(key, float(step), 100 + step, step) for step in range(100)]
+        # A second value at step 10 that is logged later and must not be picked by downsampling
+        metrics.append(Metric(key, -1.0, 500, 10))
+        self.store.log_batch(run_id, metrics=metrics, params=[], tags=[])
+
+        def steps_and_values(history):
+            return [(m.step, m.value) for m in history]
+
+        assert len(self.store.get_metric_history(run_id, key)) == 101
+        actual = self.store.get_metric_history(run_id, key, start_step=95, end_step=97)
+        assert sorted(steps_and_values(actual)) == [(95, 95.0), (96, 96.0), (97, 97.0)]
+
+        actual = self.store.get_metric_history(run_id, key, max_points=10)
+        assert steps_and_values(actual) == [(step, float(step)) for step in range(0, 100, 10)]
+        actual = self.store.get_metric_history(run_id, key, max_points=3, start_step=50)
+        assert steps_and_values(actual) == [(50, 50.0), (67, 67.0), (84, 84.0)]
+        actual = self.store.get_metric_history(run_id, key, max_points=4, start_step=9, end_step=11)
+        assert steps_and_values(actual) == [(9, 9.0), (10, 10.0), (10, -1.0), (11, 11.0)]
+        assert self.store.get_metric_history(run_id, key, max_points=5, start_step=200) == []
+
+        for max_points in [0, -1, 1.5]:
+            with pytest.raises(MlflowException, match="max_points") as e:
+                self.store.get_metric_history(run_id, key, max_points=max_points)
+            assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
     def test_list_run_infos(self):
         experiment_id = self._experiment_factory("test_exp")
         r1 = self._run_factory(config=self._get_run_configs(experiment_id)).info.run_id
@@ -1495,6 +1570,69 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         assert [r.info.run_id for r in result] == runs[8:]
         assert result.token is None
 
+    def test_search_runs_keyset_pagination(self):
+        experiment_id = self.store.create_experiment("keyset_pagination")
+        metric_values = ["nan", None, "inf", "-inf", "-1000", "0", "0", "1000", None, "5"]
+        for i, metric_value in enumerate(metric_values):
+            run_id = self.store.create_run(
+                experiment_id,
+                user_id="user",
+                start_time=i % 3,
+                tags=[entities.RunTag("t", str(i % 4))] if i % 5 else [],
+            ).info.run_id
+            if metric_value is not None:
+                self.store.log_metric(run_id, entities.Metric("x", float(metric_value), 1, 0))
+            if i % 2:
+                self.store.log_param(run_id, entities.Param("p", str(i % 3)))
+
+        for order_by in [
+            None,
+            ["metrics.x asc"],
+            ["metrics.x desc"],
+            ["params.p asc", "metrics.x desc"],
+            ["tags.t desc", "attributes.start_time asc"],
+            ["attributes.end_time desc", "params.p desc", "tags.t asc"],
+        ]:
+            expected = [
+                r.info.run_id
+                for r in self.store.search_runs([experiment_id], None, ViewType.ALL, 100, order_by)
+            ]
+            for max_results in [1, 3, 4]:
+                run_ids = []
+                result = self.store.search_runs(
+                    [experiment_id], None, ViewType.ALL, max_results, order_by
+                )
+                run_ids.extend(r.info.run_id for r in result)
+                while result.token:
+                    assert SearchUtils.parse_sort_key_from_page_token(result.token) is not None
+                    result = self.store.search_runs(
+                        [experiment_id], None, ViewType.ALL, max_results, order_by, result.token
+                    )
+                    run_ids.extend(r.info.run_id for r in result)
+                assert run_ids == expected, order_by
+
+    def test_search_runs_offset_page_token(self):
+        # Page tokens that only encode an offset remain supported
+        experiment_id = self.store.create_experiment("offset_pagination")
+        run_ids = [
+            self.store.create_run(experiment_id, "user", start_time=i, tags=[]).info.run_id
+            for i in range(5)
+        ]
+        result = self.store.search_runs(
+            [experiment_id], None, ViewType.ALL, 2, None, SearchUtils.create_page_token(3)
+        )
+        assert [r.info.run_id for r in result] == list(reversed(run_ids))[3:]
+
+    def test_search_runs_keyset_page_token_with_mismatched_order_by(self):
+        experiment_id = self.store.create_experiment("mismatched_page_token")
+        for i in range(3):
+            self.store.create_run(experiment_id, "user", start_time=i, tags=[])
+        result = self.store.search_runs([experiment_id], None, ViewType.ALL, 1, ["params.p"])
+        with self.assertRaises(MlflowException) as e:
+            self.store.search_runs([experiment_id], None, ViewType.ALL, 1, None, result.token)
+        assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+        assert "Invalid page token" in e.exception.message
+
     def test_log_batch(self):
         experiment_id = self._experiment_factory("log_batch")
         run_id = self._run_factory(self._get_run_configs(experiment_id)).info.run_id
@@ -1548,7 +1686,8 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
         self._verify_logged(self.store, run.info.run_id, metrics=[], params=[param], tags=[])
 
     def test_log_batch_param_overwrite_disallowed_single_req(self):
-        # Test that attempting to overwrite a param via log_batch results in an exception
+        # Test that attempting to overwrite a param via log_batch results in an exception and that
+        # no partial data is logged
         run = self._run_factory()
         pkey = "common-key"
         param0 = entities.Param(pkey, "orig-val")
@@ -1561,7 +1700,52 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             )
         self.assertIn("Changing param values is not allowed. Param with key=", e.exception.message)
         assert e.exception.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
-        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[param0], tags=[])
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
+
+    def test_log_batch_is_atomic(self):
+        # Test that a failure while logging one entity type rolls back the entities of every type
+        # that were written earlier in the same log_batch call
+        run = self._run_factory()
+        param = entities.Param("p-key", "p-val")
+        metric = entities.Metric("metric-key", 3.0, 12345, 0)
+        tag = entities.RunTag("tag-key", "tag-val")
+        with mock.patch(
+            "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore._set_tags",
+            side_effect=Exception("Some internal error"),
+        ):
+            with self.assertRaises(MlflowException) as e:
+                self.store.log_batch(run.info.run_id, metrics=[metric], params=[param], tags=[tag])
+        assert e.exception.error_code == ErrorCode.Name(INTERNAL_ERROR)
+        self._verify_logged(self.store, run.info.run_id, metrics=[], params=[], tags=[])
+        assert self.store.get_run(run.info.run_id).data.metrics == {}
+
+    def test_log_batch_updates_latest_metrics(self):
+        run = self._run_factory()
+        self.store.log_metric(run.info.run_id, Metric("m1", 5.0, 1, 3))
+        metrics = [
+            Metric("m1", 1.0, 1, 1),
+            Metric("m1", 2.0, 2, 4),
+            Metric("m1", 0.5, 2, 4),
+            Metric("m2", float("nan"), 0, 0),
+            Metric("m3", float("inf"), 0, 0),
+        ]
+        self.store.log_batch(run.info.run_id, metrics=metrics, params=[], tags=[])
+        run_metrics = self.store.get_run(run.info.run_id).data.metrics
+        assert run_metrics["m1"] == 2.0
+        assert math.isnan(run_metrics["m2"])
+        assert run_metrics["m3"] == 1.7976931348623157e308
+
+    def test_log_batch_skips_previously_logged_metrics(self):
+        run = self._run_factory()
+        metric0 = Metric(key="metric-key", value=1, timestamp=2, step=0)
+        metric1 = Metric(key="metric-key", value=2, timestamp=3, step=1)
+        self.store.log_metric(run.info.run_id, metric0)
+        self.store.log_batch(
+            run.info.run_id, params=[], metrics=[metric0, metric1, metric1], tags=[]
+        )
+        self._verify_logged(
+            self.store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[]
+        )
 
     def test_log_batch_accepts_empty_payload(self):
         run = self._run_factory()
@@ -1577,9 +1761,9 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             raise Exception("Some internal error")
 
         package = "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
-        with mock.patch(package + ".log_metric") as metric_mock, mock.patch(
-            package + ".log_param"
-        ) as param_mock, mock.patch(package + ".set_tag") as tags_mock:
+        with mock.patch(package + "._log_metrics") as metric_mock, mock.patch(
+            package + "._log_params"
+        ) as param_mock, mock.patch(package + "._set_tags") as tags_mock:
             metric_mock.side_effect = _raise_exception_fn
             param_mock.side_effect = _raise_exception_fn
             tags_mock.side_effect = _raise_exception_fn
@@ -1656,6 +1840,66 @@ class TestSqlAlchemyStoreSqlite(unittest.TestCase, AbstractStoreTest):
             self.store, run.info.run_id, params=[], metrics=[metric0, metric1], tags=[]
         )
 
+    def test_log_metric_series(self):
+        run = self._run_factory()
+        run_id = run.info.run_id
+        self.store.log_metric(run_id, Metric("m", 5.0, 1, 3))
+        values = np.array([0.5, np.nan, np.inf, 2.0, 0.5])
+        steps = np.array([0, 1, 2, 3, 0])
+        timestamps = np.array([10, 11, 12, 13, 10])
+        self.store.log_metric_series(run_id, "m", values, steps, timestamps)
+        # Logging the same entries again is a no-op, consistent with ``log_metric``
+        self.store.log_metric_series(run_id, "m", values[:2], steps[:2], timestamps[:2])
+
+        history = sorted(
+            self.store.get_metric_history(run_id, "m"), key=lambda m: (m.step, m.timestamp)
+        )
+        assert [(m.step, m.timestamp) for m in history] == [
+            (0, 10),
+            (1, 11),
+            (2, 12),
+            (3, 1),
+            (3, 13),
+        ]
+        assert history[0].value == 0.5
+        assert math.isnan(history[1].value)
+        assert history[2].value == 1.7976931348623157e308
+        assert self.store.get_run(run_id).data.metrics["m"] == 2.0
+
+        with pytest.raises(MlflowException, match="same length"):
+            self.store.log_metric_series(run_id, "m", values, steps[:2], timestamps)
+        self.store.delete_run(run_id)
+        with pytest.raises(MlflowException, match="must be in the 'active' state"):
+            self.store.log_metric_series(run_id, "m", values, steps, timestamps)
+
+    def test_get_runs(self):
+        experiment_id = self._experiment_factory("test_get_runs")
+        run_ids = [
+            self._run_factory(self._get_run_configs(experiment_id)).info.run_id for _ in range(5)
+        ]
+        for i, run_id in enumerate(run_ids):
+            self.store.log_batch(
+                run_id, metrics=[Metric("m", i, 1, 0)], params=[Param("p", str(i))], tags=[]
+            )
+        self.store.delete_run(run_ids[0])
+        requested_run_ids = run_ids[::-1] + run_ids[:1]
+
+        with mock.patch("mlflow.store.tracking.sqlalchemy_store._MAX_RUN_IDS_PER_QUERY", 2):
+            runs = self.store.get_runs(requested_run_ids)
+        assert [run.info.run_id for run in runs] == requested_run_ids
+        for run in runs:
+            expected_run = self.store.get_run(run.info.run_id)
+            assert run.info == expected_run.info
+            assert run.data.metrics == expected_run.data.metrics
+            assert run.data.params == expected_run.data.params
+            assert run.data.tags == expected_run.data.tags
+        assert runs[-1].info.lifecycle_stage == entities.LifecycleStage.DELETED
+        assert self.store.get_runs([]) == []
+
+        with pytest.raises(MlflowException, match="Runs with ids=a, b not found") as e:
+            self.store.get_runs([run_ids[0], "b", "a"])
+        assert e.value.error_code == ErrorCode.Name(RESOURCE_DOES_NOT_EXIST)
+
     def test_upgrade_cli_idempotence(self):
         # Repeatedly run `mlflow db upgrade` against our database, verifying that the command
         # succeeds and that the DB has the latest schema
@@ -1866,6 +2110,22 @@ def test_sqlalchemy_store_behaves_as_expected_with_inmemory_sqlite_db():
     assert param.key in fetched_run.data.params
 
 
+@pytest.mark.parametrize(
+    ("dialect_name", "expected_ddl"),
+    [
+        ("mssql", "CREATE INDEX index_tags_key_value ON tags ([key]) INCLUDE (value)"),
+        ("mysql", "CREATE INDEX index_tags_key_value ON tags (`key`, value(255))"),
+        ("postgresql", "CREATE INDEX index_tags_key_value ON tags (key)"),
+        ("sqlite", 'CREATE INDEX index_tags_key_value ON tags ("key", value)'),
+    ],
+)
+def test_tags_key_value_index_matches_migration(dialect_name, expected_ddl):
+    (index,) = models.SqlTag.__table__.indexes
+    dialect = sqlalchemy.dialects.registry.load(dialect_name)()
+    ddl = sqlalchemy.schema.CreateIndex(index).compile(dialect=dialect)
+    assert str(ddl) == expected_ddl
+
+
 class TestSqlAlchemyStoreSqliteMigratedDB(TestSqlAlchemyStoreSqlite):
     """
     Test case where user has an existing DB with schema generated before MLflow 1.0,
@@ -1,3 +1,4 @@
+import click
 from click.testing import CliRunner
 from mock import mock
 import numpy as np
@@ -13,7 +14,7 @@ import subprocess
 from six.moves.urllib.request import url2pathname
 from six.moves.urllib.parse import urlparse, unquote
 
-from mlflow.cli import run, server, ui
+from mlflow.cli import _LAZY_SUBCOMMANDS, cli, run, server, ui
 from mlflow.server import handlers
 from mlflow import experiments
 from mlflow.store.tracking.sqlalchemy_store import SqlAlchemyStore
@@ -22,25 +23,53 @@ from mlflow.exceptions import MlflowException
 from mlflow.entities import ViewType
 
 
+@pytest.mark.parametrize("name", sorted(_LAZY_SUBCOMMANDS))
+def test_lazy_subcommands_short_help_matches_help(name):
+    import_path, short_help = _LAZY_SUBCOMMANDS[name]
+    with click.Context(cli) as ctx:
+        command = cli.get_command(ctx, name)
+    assert command.name == name
+    assert "{}:{}".format(command.callback.__module__, command.callback.__name__) == import_path
+    for limit in [45, 200]:
+        expected = command.get_short_help_str(limit)
+        assert click.Command(name, help=short_help).get_short_help_str(limit) == expected
+
+
+def test_cli_help_lists_all_commands():
+    result = CliRunner().invoke(cli, ["--help"])
+    assert result.exit_code == 0
+    for name in list(_LAZY_SUBCOMMANDS) + ["gc", "run", "server", "ui"]:
+        assert "\n  {} ".format(name) in result.output
+
+
 def test_server_static_prefix_validation():
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         CliRunner().invoke(server)
         run_server_mock.assert_called_once()
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         CliRunner().invoke(server, ["--static-prefix", "/mlflow"])
         run_server_mock.assert_called_once()
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         result = CliRunner().invoke(server, ["--static-prefix", "mlflow/"])
         assert "--static-prefix must begin with a '/'." in result.output
         run_server_mock.assert_not_called()
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         result = CliRunner().invoke(server, ["--static-prefix", "/mlflow/"])
         assert "--static-prefix should not end with a '/'." in result.output
         run_server_mock.assert_not_called()
 
 
+def test_server_compression_min_size():
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
+        CliRunner().invoke(server)
+        assert run_server_mock.call_args[0][-1] is None
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
+        CliRunner().invoke(server, ["--compression-min-size", "-1"])
+        assert run_server_mock.call_args[0][-1] == -1
+
+
 def test_server_default_artifact_root_validation():
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         result = CliRunner().invoke(server, ["--backend-store-uri", "sqlite:///my.db"])
         assert result.output.startswith("Option 'default-artifact-root' is required")
         run_server_mock.assert_not_called()
@@ -49,7 +78,7 @@ def test_server_default_artifact_root_validation():
 @pytest.mark.parametrize("command", [server, ui])
 def test_tracking_uri_validation_failure(command):
     handlers._tracking_store = None
-    with mock.patch("mlflow.cli._run_server") as run_server_mock:
+    with mock.patch("mlflow.server._run_server") as run_server_mock:
         # SQLAlchemy expects postgresql:// not postgres://
         CliRunner().invoke(
             command,
@@ -67,7 +96,7 @@ def test_tracking_uri_validation_failure(command):
 def test_tracking_uri_validation_sql_driver_uris(command):
     handlers._tracking_store = None
     handlers._model_registry_store = None
-    with mock.patch("mlflow.cli._run_server") as run_server_mock, mock.patch(
+    with mock.patch("mlflow.server._run_server") as run_server_mock, mock.patch(
         "mlflow.store.tracking.sqlalchemy_store.SqlAlchemyStore"
     ) as tracking_store_mock, mock.patch(
         "mlflow.store.model_registry.sqlalchemy_store.SqlAlchemyStore"
@@ -89,28 +118,28 @@ def test_tracking_uri_validation_sql_driver_uris(command):
 
 
 def test_mlflow_run():
-    with mock.patch("mlflow.cli.projects") as mock_projects:
+    with mock.patch("mlflow.projects.run") as mock_run:
         result = CliRunner().invoke(run)
-        mock_projects.run.assert_not_called()
+        mock_run.assert_not_called()
         assert "Missing argument 'URI'" in result.output
 
-    with mock.patch("mlflow.cli.projects") as mock_projects:
+    with mock.patch("mlflow.projects.run") as mock_run:
         CliRunner().invoke(run, ["project_uri"])
-        mock_projects.run.assert_called_once()
+        mock_run.assert_called_once()
 
-    with mock.patch("mlflow.cli.projects") as mock_projects:
+    with mock.patch("mlflow.projects.run") as mock_run:
         CliRunner().invoke(run, ["--experiment-id", "5", "project_uri"])
-        mock_projects.run.assert_called_once()
+        mock_run.assert_called_once()
 
-    with mock.patch("mlflow.cli.projects") as mock_projects:
+    with mock.patch("mlflow.projects.run") as mock_run:
         CliRunner().invoke(run, ["--experiment-name", "random name", "project_uri"])
-        mock_projects.run.assert_called_once()
+        mock_run.assert_called_once()
 
-    with mock.patch("mlflow.cli.projects") as mock_projects:
+    with mock.patch("mlflow.projects.run") as mock_run:
         result = CliRunner().invoke(
             run, ["--experiment-id", "51", "--experiment-name", "name blah", "uri"]
         )
-        mock_projects.run.assert_not_called()
+        mock_run.assert_not_called()
         assert "Specify only one of 'experiment-name' or 'experiment-id' options." in result.output
 
 
@@ -0,0 +1,104 @@
+import subprocess
+import sys
+
+import pytest
+
+import mlflow
+
+pytestmark = pytest.mark.skipif(
+    sys.version_info < (3, 7), reason="Lazy submodule imports require Python 3.7 or later"
+)
+
+# Modules that are slow to import and are not needed by the tracking API
+_SLOW_MODULES = [
+    "databricks_cli",
+    "distutils",
+    "flask",
+    "IPython",
+    "mlflow.models",
+    "mlflow.projects",
+    "pandas",
+    "sqlalchemy",
+]
+
+# Modules that are slow to import and are not needed by the common CLI commands
+_SLOW_CLI_MODULES = _SLOW_MODULES + [
+    "docker",
+    "mlflow.azureml",
+    "mlflow.deployments",
+    "mlflow.sagemaker",
+    "mlflow.server",
+]
+
+
+def _run_with_importtime(*args):
+    """
+    Run python with the given arguments and ``-X importtime`` in a new interpreter, and return a
+    dict mapping the imported modules to their cumulative import time in microseconds.
+    """
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime"] + list(args),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    import_times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        import_times[module.strip()] = int(cumulative)
+    return import_times
+
+
+def _get_imported_modules(import_times, modules):
+    return [
+        name
+        for name in modules
+        if any(module == name or module.startswith(name + ".") for module in import_times)
+    ]
+
+
+def test_import_mlflow_does_not_import_flavors_or_slow_modules():
+    import_times = _run_with_importtime("-c", "import mlflow")
+    assert "mlflow" in import_times
+    flavors = [name for name in mlflow._LAZY_SUBMODULES if "mlflow." + name in import_times]
+    assert flavors == []
+    slow_modules = _get_imported_modules(import_times, _SLOW_MODULES)
+    assert slow_modules == [], "import mlflow took {:.3f}s".format(import_times["mlflow"] / 1e6)
+
+
+def test_lazy_submodules_are_imported_on_attribute_access():
+    code = (
+        "import sys, mlflow\n"
+        "assert 'mlflow.sklearn' not in sys.modules\n"
+        "assert mlflow.sklearn is sys.modules['mlflow.sklearn']\n"
+        "assert mlflow.run is sys.modules['mlflow.projects'].run\n"
+        "assert 'pyfunc' in dir(mlflow)\n"
+        "assert mlflow.models.Model is sys.modules['mlflow.models'].Model\n"
+        "assert callable(mlflow.models.signature.infer_signature)\n"
+        "assert mlflow.types.Schema is sys.modules['mlflow.types'].Schema\n"
+    )
+    subprocess.check_call([sys.executable, "-c", code])
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_flavor'"):
+        mlflow.not_a_flavor  # pylint: disable=pointless-statement
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--help"],
+        ["runs", "--help"],
+        ["experiments", "--help"],
+        ["artifacts", "--help"],
+        ["server", "--help"],
+        ["ui", "--help"],
+    ],
+)
+def test_cli_commands_do_not_import_slow_modules(args):
+    import_times = _run_with_importtime("-m", "mlflow.cli", *args)
+    slow_modules = _get_imported_modules(import_times, _SLOW_CLI_MODULES)
+    assert slow_modules == [], "mlflow {} imported modules for {:.3f}s".format(
+        " ".join(args), sum(import_times[name] for name in import_times if "." not in name) / 1e6
+    )
@@ -12,6 +12,7 @@ from mlflow.tracking.registry import UnsupportedModelRegistryStoreURIException
 from mlflow.tracking._tracking_service.registry import TrackingStoreRegistry
 from mlflow.tracking._tracking_service.utils import (
     _get_store,
+    _reset_sqlalchemy_stores,
     _resolve_tracking_uri,
     _TRACKING_INSECURE_TLS_ENV_VAR,
     _TRACKING_PASSWORD_ENV_VAR,
@@ -155,6 +156,22 @@ def test_get_store_sqlalchemy_store_with_artifact_uri(tmp_wkdir, db_type):
     mock_create_engine.assert_called_once_with(uri, pool_pre_ping=True)
 
 
+def test_get_store_reuses_sqlalchemy_stores(tmpdir):
+    uri = "sqlite:///" + tmpdir.join("mlflow.db").strpath
+    artifact_uri = tmpdir.join("artifacts").strpath
+    env = {_TRACKING_URI_ENV_VAR: uri}
+    with mock.patch.dict(os.environ, env):
+        store = _get_store(artifact_uri=artifact_uri)
+        assert isinstance(store, SqlAlchemyStore)
+        assert _get_store(artifact_uri=artifact_uri) is store
+        other_store = _get_store(artifact_uri=tmpdir.join("other_artifacts").strpath)
+        assert other_store is not store
+        assert other_store.db_uri == uri
+        # Forked processes do not reuse the stores of their parent process
+        _reset_sqlalchemy_stores()
+        assert _get_store(artifact_uri=artifact_uri) is not store
+
+
 def test_get_store_databricks():
     env = {
         _TRACKING_URI_ENV_VAR: "databricks",
@@ -87,8 +87,13 @@ def test_registry_instance_loads_entrypoints():
         # entrypoint given by the mocked extrypoints.get_group_all
         reload(mlflow.tracking.context.registry)
 
-    assert MockRunContext in _currently_registered_run_context_provider_classes()
-    mock_get_group_all.assert_called_once_with("mlflow.run_context_provider")
+    try:
+        assert MockRunContext in _currently_registered_run_context_provider_classes()
+        mock_get_group_all.assert_called_once_with("mlflow.run_context_provider")
+    finally:
+        # Restore the registered providers, which are used to resolve the tags of runs created
+        # by other tests
+        reload(mlflow.tracking.context.registry)
 
 
 @pytest.mark.large
@@ -0,0 +1,100 @@
+import threading
+
+import pytest
+
+from mlflow.entities import Metric, Param, RunTag
+from mlflow.tracking._async_logging_queue import AsyncLoggingQueue
+
+
+class _RecordingLogBatch(object):
+    def __init__(self, error_run_ids=()):
+        self.batches = []
+        self.error_run_ids = error_run_ids
+        self.lock = threading.Lock()
+
+    def __call__(self, destination, run_id, metrics, params, tags):
+        with self.lock:
+            self.batches.append((destination, run_id, metrics, params, tags))
+        if run_id in self.error_run_ids:
+            raise ValueError("Failed to log to run %s" % run_id)
+
+
+def test_queue_splits_batches_at_size_limits():
+    log_batch = _RecordingLogBatch()
+    queue = AsyncLoggingQueue(log_batch)
+    metrics = [Metric("m", i, 0, i) for i in range(2500)]
+    params = [Param("p%d" % i, str(i)) for i in range(150)]
+    queue.log("uri", "run", metrics=metrics, params=params)
+    queue.flush()
+
+    for _, _, batch_metrics, batch_params, batch_tags in log_batch.batches:
+        assert len(batch_metrics) <= 1000
+        assert len(batch_params) <= 100
+        assert len(batch_metrics) + len(batch_params) + len(batch_tags) <= 1000
+    assert [m for batch in log_batch.batches for m in batch[2]] == metrics
+    assert [p for batch in log_batch.batches for p in batch[3]] == params
+
+
+def test_queue_keeps_logging_order_across_runs_and_duplicate_keys():
+    log_batch = _RecordingLogBatch()
+    queue = AsyncLoggingQueue(log_batch)
+    queue.log("uri", "run1", tags=[RunTag("t", "1")])
+    queue.log("uri", "run1", tags=[RunTag("t", "2")])
+    queue.log("uri", "run2", params=[Param("p", "1")])
+    queue.log("other_uri", "run2", params=[Param("p", "2")])
+    queue.flush()
+
+    logged = [
+        (destination, run_id, [(e.key, e.value) for e in params + tags])
+        for destination, run_id, _, params, tags in log_batch.batches
+    ]
+    assert logged == [
+        ("uri", "run1", [("t", "1")]),
+        ("uri", "run1", [("t", "2")]),
+        ("uri", "run2", [("p", "1")]),
+        ("other_uri", "run2", [("p", "2")]),
+    ]
+
+
+def test_queue_raises_errors_on_flush():
+    log_batch = _RecordingLogBatch(error_run_ids=["bad_run"])
+    queue = AsyncLoggingQueue(log_batch)
+    queue.log("uri", "bad_run", metrics=[Metric("m", 1, 0, 0)])
+    queue.log("uri", "good_run", metrics=[Metric("m", 1, 0, 0)])
+    with pytest.raises(ValueError, match="bad_run"):
+        queue.flush()
+    assert [batch[1] for batch in log_batch.batches] == ["bad_run", "good_run"]
+    # Errors are raised only once
+    queue.flush()
+
+
+def test_queue_flushes_and_raises_errors_of_a_single_run():
+    log_batch = _RecordingLogBatch(error_run_ids=["bad_run"])
+    queue = AsyncLoggingQueue(log_batch)
+    queue.log("uri", "bad_run", metrics=[Metric("m", 1, 0, 0)])
+    queue.log("uri", "good_run", metrics=[Metric("m", 1, 0, 0)])
+    queue.flush("good_run")
+    assert "good_run" in [batch[1] for batch in log_batch.batches]
+    with pytest.raises(ValueError, match="bad_run"):
+        queue.flush("bad_run")
+    queue.flush("bad_run")
+
+
+def test_queue_flush_does_not_wait_for_entries_queued_after_the_call():
+    stop = threading.Event()
+
+    def log_batch(destination, run_id, metrics, params, tags):
+        # pylint: disable=unused-argument
+        # Keep queueing entries, like another thread logging continuously
+        if not stop.is_set():
+            queue.log("uri", "other_run", metrics=metrics)
+
+    queue = AsyncLoggingQueue(log_batch)
+    queue.log("uri", "run", metrics=[Metric("m", 1, 0, 0)])
+    for run_id in ["run", None]:
+        thread = threading.Thread(target=queue.flush, args=(run_id,))
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+    stop.set()
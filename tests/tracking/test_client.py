@@ -1,10 +1,11 @@
 import mock
+import numpy as np
 import pytest
 
 from mlflow.entities import SourceType, ViewType, RunTag, Run, RunInfo
 from mlflow.entities.model_registry import ModelVersion, ModelVersionTag
 from mlflow.exceptions import MlflowException
-from mlflow.protos.databricks_pb2 import ErrorCode, FEATURE_DISABLED
+from mlflow.protos.databricks_pb2 import ErrorCode, FEATURE_DISABLED, INVALID_PARAMETER_VALUE
 from mlflow.store.tracking import SEARCH_MAX_RESULTS_DEFAULT
 from mlflow.tracking import set_registry_uri, MlflowClient
 from mlflow.utils.file_utils import TempDir
@@ -176,6 +177,42 @@ def test_client_search_runs_page_token(mock_store):
     )
 
 
+def test_client_get_runs(mock_store):
+    client = MlflowClient()
+    assert client.get_runs([]) == []
+    mock_store.get_runs.assert_not_called()
+    assert client.get_runs(iter(["a", "b"])) == mock_store.get_runs.return_value
+    mock_store.get_runs.assert_called_once_with(["a", "b"])
+    with pytest.raises(MlflowException) as e:
+        client.get_runs(["a", "../b"])
+    assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+
+
+def test_client_log_metric_series_defaults(mock_store, mock_time):
+    MlflowClient().log_metric_series("run", "m", [1, 2.5, 3])
+    run_id, key, values, steps, timestamps = mock_store.log_metric_series.call_args[0]
+    assert (run_id, key) == ("run", "m")
+    assert values.dtype == np.float64 and values.tolist() == [1.0, 2.5, 3.0]
+    assert steps.dtype == np.int64 and steps.tolist() == [0, 1, 2]
+    assert timestamps.dtype == np.int64 and timestamps.tolist() == [int(mock_time * 1000)] * 3
+
+
+def test_client_log_metric_series_validation(mock_store):
+    client = MlflowClient()
+    client.log_metric_series("run", "m", np.array([]))
+    mock_store.log_metric_series.assert_not_called()
+    for values, steps, timestamps in [
+        (["a", "b"], None, None),
+        ([1.0, 2.0], [1], None),
+        ([1.0, 2.0], None, [1, -1]),
+        ([[1.0, 2.0]], None, None),
+    ]:
+        with pytest.raises(MlflowException) as e:
+            client.log_metric_series("run", "m", values, steps, timestamps)
+        assert e.value.error_code == ErrorCode.Name(INVALID_PARAMETER_VALUE)
+    mock_store.log_metric_series.assert_not_called()
+
+
 def test_client_registry_operations_raise_exception_with_unsupported_registry_store():
     """
     This test case ensures that Model Registry operations invoked on the `MlflowClient`
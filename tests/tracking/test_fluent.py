@@ -1,7 +1,12 @@
+import asyncio
 import os
 import random
+import threading
+import time
 import uuid
 import inspect
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
 import mock
 import numpy as np
@@ -32,6 +37,7 @@ from mlflow.tracking.fluent import (
     _RUN_ID_ENV_VAR,
     _get_experiment_id,
     _get_experiment_id_from_env,
+    _get_latest_active_run,
     _paginate,
     search_runs,
     set_experiment,
@@ -40,6 +46,7 @@ from mlflow.tracking.fluent import (
 )
 from mlflow.utils import mlflow_tags
 from mlflow.utils.file_utils import TempDir
+from mlflow.utils.search_utils import SearchUtils
 
 # pylint: disable=unused-argument
 
@@ -238,9 +245,19 @@ def test_get_experiment_by_name():
         assert experiment.experiment_id == exp_id
 
 
+@contextmanager
+def active_run_stack(runs):
+    previous_runs = mlflow.tracking.fluent._active_run_stack.get()
+    mlflow.tracking.fluent._active_run_stack.set(tuple(runs))
+    try:
+        yield
+    finally:
+        mlflow.tracking.fluent._active_run_stack.set(previous_runs)
+
+
 @pytest.fixture
 def empty_active_run_stack():
-    with mock.patch("mlflow.tracking.fluent._active_run_stack", []):
+    with active_run_stack([]):
         yield
 
 
@@ -346,7 +363,7 @@ def test_start_run_with_parent():
     mock_experiment_id = mock.Mock()
     mock_source_name = mock.Mock()
 
-    active_run_stack_patch = mock.patch("mlflow.tracking.fluent._active_run_stack", [parent_run])
+    active_run_stack_patch = active_run_stack([parent_run])
 
     databricks_notebook_patch = mock.patch(
         "mlflow.tracking.fluent.is_in_databricks_notebook", return_value=False
@@ -377,7 +394,7 @@ def test_start_run_with_parent():
 
 
 def test_start_run_with_parent_non_nested():
-    with mock.patch("mlflow.tracking.fluent._active_run_stack", [mock.Mock()]):
+    with active_run_stack([mock.Mock()]):
         with pytest.raises(Exception):
             start_run()
 
@@ -505,6 +522,38 @@ def test_search_runs_data():
         pd.testing.assert_frame_equal(pdf, expected_df, check_like=True, check_frame_type=False)
 
 
+def test_search_runs_selected_columns():
+    runs = [
+        create_run(
+            metrics=[Metric("mse", 0.2, 0, 0), Metric("loss", 1.2, 0, 5)],
+            params=[Param("param", "value")],
+            tags=[RunTag("tag", "value")],
+            run_id="abc",
+        ),
+        create_run(metrics=[Metric("mse", 0.6, 0, 0)], params=[Param("k", "v")], run_id="def"),
+    ]
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=runs):
+        pdf = search_runs(columns=["metrics.loss", "run_id", "params.param", "tags.missing"])
+        expected_df = pd.DataFrame(
+            {
+                "metrics.loss": [1.2, np.nan],
+                "run_id": ["abc", "def"],
+                "params.param": ["value", None],
+                "tags.missing": [None, None],
+            }
+        )
+        pd.testing.assert_frame_equal(pdf, expected_df, check_frame_type=False)
+
+
+@pytest.mark.parametrize("column", ["rmse", "metric.rmse", "metrics.", "start"])
+def test_search_runs_invalid_columns(column):
+    with mock.patch("mlflow.tracking.fluent._paginate", return_value=[]) as paginate_mock:
+        with pytest.raises(MlflowException) as e:
+            search_runs(experiment_ids=["0"], columns=["run_id", column])
+        assert "Invalid column '{}'".format(column) in e.value.message
+        paginate_mock.assert_not_called()
+
+
 def test_search_runs_no_arguments():
     """
     When no experiment ID is specified, it should try to get the implicit one.
@@ -640,6 +689,93 @@ def test_paginate_gt_maxresults_onepage():
     assert len(paginated_runs) == 10
 
 
+def _offset_token_paginated_fn(results, make_page_token, delay=0):
+    in_flight = []
+    max_in_flight = [0]
+    lock = threading.Lock()
+
+    def paginated_fn(num_to_get, page_token):
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        with lock:
+            in_flight.append(offset)
+            max_in_flight[0] = max(max_in_flight[0], len(in_flight))
+        time.sleep(delay)
+        with lock:
+            in_flight.remove(offset)
+        final_offset = offset + num_to_get
+        next_page_token = make_page_token(final_offset) if final_offset < len(results) else None
+        return PagedList(results[offset:final_offset], next_page_token)
+
+    return mock.Mock(side_effect=paginated_fn), max_in_flight
+
+
+@pytest.mark.parametrize(
+    "make_page_token",
+    [
+        SearchUtils.create_page_token,
+        lambda offset: SearchUtils.create_page_token(offset, [offset, "run_id"]),
+    ],
+)
+@pytest.mark.parametrize("max_results", [1, 35, 95, 1000])
+def test_paginate_fetches_pages_concurrently_with_offset_tokens(make_page_token, max_results):
+    results = list(range(95))
+    mocked_fn, max_in_flight = _offset_token_paginated_fn(results, make_page_token, delay=0.01)
+
+    paginated_results = _paginate(mocked_fn, 10, max_results, max_concurrent_pages=4)
+    assert paginated_results == results[:max_results]
+    if max_results > 30:
+        assert max_in_flight[0] > 1
+    assert max_in_flight[0] <= 4
+    # The first page after a received token is requested with that token
+    assert (
+        mocked_fn.call_args_list[:2]
+        == [mock.call(min(10, max_results), None), mock.call(10, make_page_token(10)),][
+            : 1 if max_results <= 10 else 2
+        ]
+    )
+    # Pages past the end of the results may have been requested, but no page twice
+    offsets = [
+        SearchUtils.parse_start_offset_from_page_token(c[0][1]) for c in mocked_fn.call_args_list
+    ]
+    assert len(offsets) == len(set(offsets))
+
+
+@pytest.mark.parametrize("token_format", ["token-%d", "\u00e9%d00"])
+def test_paginate_follows_opaque_page_tokens_one_at_a_time(token_format):
+    results = list(range(25))
+    tokens = [token_format % i for i in range(3)]
+
+    def paginated_fn(num_to_get, page_token):
+        page = 0 if page_token is None else tokens.index(page_token) + 1
+        page_results = results[page * 10 : page * 10 + num_to_get]
+        return PagedList(page_results, tokens[page] if (page + 1) * 10 < len(results) else None)
+
+    mocked_fn = mock.Mock(side_effect=paginated_fn)
+    paginated_results = _paginate(mocked_fn, 10, 100, max_concurrent_pages=4)
+    assert paginated_results == results
+    assert mocked_fn.call_args_list == [
+        mock.call(10, None),
+        mock.call(10, tokens[0]),
+        mock.call(10, tokens[1]),
+    ]
+
+
+def test_paginate_falls_back_to_page_tokens_if_offsets_do_not_match():
+    results = list(range(40))
+
+    # Pages of 5 results with offset tokens, although 10 results are requested per page
+    def paginated_fn(num_to_get, page_token):
+        offset = SearchUtils.parse_start_offset_from_page_token(page_token)
+        final_offset = offset + 5
+        next_page_token = (
+            SearchUtils.create_page_token(final_offset) if final_offset < len(results) else None
+        )
+        return PagedList(results[offset:final_offset], next_page_token)
+
+    paginated_results = _paginate(paginated_fn, 10, 100, max_concurrent_pages=4)
+    assert paginated_results == results
+
+
 def test_delete_tag():
     """
     Confirm that fluent API delete tags actually works
@@ -657,3 +793,195 @@ def test_delete_tag():
     with pytest.raises(MlflowException):
         mlflow.delete_tag("b")
     mlflow.end_run()
+
+
+def test_async_logging_batches_entities_and_flushes_on_end_run():
+    with mock.patch.object(
+        MlflowClient, "log_batch", autospec=True, side_effect=MlflowClient.log_batch
+    ) as log_batch_mock:
+        with mlflow.start_run(async_logging=True) as active_run:
+            for step in range(1500):
+                mlflow.log_metric("loss", step, step=step)
+            mlflow.log_params({"a": 1, "b": 2})
+            mlflow.set_tag("t", "1")
+            mlflow.set_tag("t", "2")
+        run_id = active_run.info.run_id
+
+    assert log_batch_mock.call_count >= 3
+    for call in log_batch_mock.call_args_list:
+        kwargs = call[1]
+        assert len(kwargs["metrics"]) + len(kwargs["params"]) + len(kwargs["tags"]) <= 1000
+    run = MlflowClient().get_run(run_id)
+    assert run.info.status == "FINISHED"
+    assert run.data.params == {"a": "1", "b": "2"}
+    assert run.data.tags["t"] == "2"
+    history = MlflowClient().get_metric_history(run_id, "loss")
+    assert sorted(m.step for m in history) == list(range(1500))
+
+
+def test_async_logging_reuses_clients():
+    with mlflow.start_run(async_logging=True):
+        mlflow.flush()
+        with mock.patch(
+            "mlflow.tracking.fluent.MlflowClient", wraps=MlflowClient
+        ) as client_mock, mock.patch.dict("mlflow.tracking.fluent._async_logging_clients", {}):
+            for step in range(3):
+                mlflow.log_metric("loss", step, step=step)
+                mlflow.flush()
+        client_mock.assert_called_once_with(mlflow.get_tracking_uri())
+
+
+def test_async_logging_is_enabled_by_environment_variable():
+    with mock.patch.dict(os.environ, {"MLFLOW_ASYNC_LOGGING": "true"}):
+        with mlflow.start_run() as active_run:
+            assert active_run._async_logging
+    with mlflow.start_run(async_logging=False) as active_run:
+        assert not active_run._async_logging
+
+
+def test_async_logging_validates_entities_when_logging():
+    with mlflow.start_run(async_logging=True):
+        with pytest.raises(MlflowException):
+            mlflow.log_metric("loss", "not a number")
+        with pytest.raises(MlflowException):
+            mlflow.log_param("../invalid", 1)
+
+
+def test_async_logging_raises_errors_on_flush():
+    with mlflow.start_run(async_logging=True) as active_run:
+        mlflow.log_param("p", "x" * 1000)
+        with pytest.raises(MlflowException):
+            mlflow.flush()
+        mlflow.flush()
+        mlflow.log_metric("m", 1)
+        mlflow.set_tag("a", "b")
+        mlflow.delete_tag("a")
+    run = MlflowClient().get_run(active_run.info.run_id)
+    assert run.data.metrics == {"m": 1}
+    assert "a" not in run.data.tags
+
+
+def test_async_logging_end_run_only_flushes_its_own_run():
+    run_ids = []
+
+    def log_to_run():
+        with mlflow.start_run(async_logging=True) as active_run:
+            run_ids.append(active_run.info.run_id)
+            mlflow.log_param("p", "x")
+
+    with pytest.raises(MlflowException):
+        with mlflow.start_run(async_logging=True) as failed_run:
+            mlflow.log_param("p", "x" * 1000)
+            # The entries of this run are sent first, and their error is not raised when the run
+            # of the other thread ends
+            thread = threading.Thread(target=log_to_run)
+            thread.start()
+            thread.join()
+            run = MlflowClient().get_run(run_ids[0])
+            assert run.info.status == "FINISHED"
+            assert run.data.params == {"p": "x"}
+    assert MlflowClient().get_run(failed_run.info.run_id).info.status == "FAILED"
+
+
+def _log_trial(trial):
+    with mlflow.start_run() as run:
+        mlflow.log_param("trial", trial)
+        for step in range(5):
+            mlflow.log_metric("loss", trial * step, step=step)
+            time.sleep(random.random() * 0.001)
+        with mlflow.start_run(nested=True) as child_run:
+            mlflow.set_tag("trial", trial)
+        assert mlflow.active_run().info.run_id == run.info.run_id
+        mlflow.set_tag("trial", trial)
+    assert mlflow.active_run() is None
+    return run.info.run_id, child_run.info.run_id
+
+
+def _assert_trials_logged(trial_run_ids):
+    client = MlflowClient()
+    for trial, (run_id, child_run_id) in enumerate(trial_run_ids):
+        run = client.get_run(run_id)
+        assert run.info.status == "FINISHED"
+        assert run.data.params == {"trial": str(trial)}
+        assert run.data.metrics == {"loss": trial * 4}
+        assert run.data.tags["trial"] == str(trial)
+        history = client.get_metric_history(run_id, "loss")
+        assert sorted(m.step for m in history) == list(range(5))
+        child_run = client.get_run(child_run_id)
+        assert child_run.data.tags["trial"] == str(trial)
+        assert child_run.data.tags[mlflow_tags.MLFLOW_PARENT_RUN_ID] == run_id
+
+
+@pytest.mark.parametrize("store_type", ["file", "sqlite"])
+def test_concurrent_runs_in_threads(store_type, tmpdir):
+    if store_type == "file":
+        mlflow.set_tracking_uri(tmpdir.join("mlruns_fs").strpath)
+    # The sqlite tracking URI is set by the ``tracking_uri_mock`` fixture
+    num_trials = 64
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        trial_run_ids = list(executor.map(_log_trial, range(num_trials)))
+    assert len({run_id for run_ids in trial_run_ids for run_id in run_ids}) == 2 * num_trials
+    _assert_trials_logged(trial_run_ids)
+    assert mlflow.active_run() is None
+
+
+def test_runs_are_not_shared_with_other_threads():
+    with mlflow.start_run() as run:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(mlflow.active_run).result() is None
+            trial_run_ids = executor.submit(_log_trial, 0).result()
+        assert mlflow.active_run().info.run_id == run.info.run_id
+    _assert_trials_logged([trial_run_ids])
+
+
+def test_active_runs_of_all_threads_are_ended_at_exit():
+    def start_runs():
+        parent_run = mlflow.start_run()
+        child_run = mlflow.start_run(nested=True)
+        return parent_run.info.run_id, child_run.info.run_id
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        run_ids = list(executor.submit(start_runs).result())
+    run_ids.append(mlflow.start_run().info.run_id)
+    client = MlflowClient()
+    assert [client.get_run(run_id).info.status for run_id in run_ids] == ["RUNNING"] * 3
+
+    mlflow.tracking.fluent._end_active_runs()
+    assert [client.get_run(run_id).info.status for run_id in run_ids] == ["FINISHED"] * 3
+    assert mlflow.active_run() is None
+    assert mlflow.tracking.fluent._active_runs == {}
+
+
+def test_get_latest_active_run_returns_runs_started_by_other_threads():
+    assert _get_latest_active_run() is None
+    with mlflow.start_run() as run:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(_get_latest_active_run).result() is run
+            with mlflow.start_run(nested=True) as child_run:
+                assert executor.submit(_get_latest_active_run).result() is child_run
+            assert executor.submit(_get_latest_active_run).result() is run
+    assert _get_latest_active_run() is None
+
+
+@pytest.mark.skipif(
+    mlflow.tracking.fluent.ContextVar is None, reason="asyncio tasks require contextvars"
+)
+def test_concurrent_runs_in_asyncio_tasks():
+    async def log_trial(trial):
+        with mlflow.start_run() as run:
+            mlflow.log_param("trial", trial)
+            for step in range(5):
+                mlflow.log_metric("loss", trial * step, step=step)
+                await asyncio.sleep(0)
+            with mlflow.start_run(nested=True) as child_run:
+                await asyncio.sleep(0)
+                mlflow.set_tag("trial", trial)
+            mlflow.set_tag("trial", trial)
+        return run.info.run_id, child_run.info.run_id
+
+    async def log_trials():
+        return await asyncio.gather(*[log_trial(trial) for trial in range(16)])
+
+    trial_run_ids = asyncio.new_event_loop().run_until_complete(log_trials())
+    _assert_trials_logged(trial_run_ids)
+    assert mlflow.active_run() is None
@@ -7,6 +7,7 @@ import mock
 import os
 import sys
 import posixpath
+import numpy as np
 import pytest
 from six.moves import urllib
 import shutil
@@ -278,6 +279,43 @@ def test_log_metrics_params_tags(mlflow_client, backend_store_uri):
     assert metric1.step == 0
 
 
+def test_get_metric_history_with_step_range_and_max_points(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("Metric History Downsampling")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    metrics = [Metric("metric", float(step), 100 + step, step) for step in range(100)]
+    mlflow_client.log_batch(run_id, metrics=metrics)
+    assert len(mlflow_client.get_metric_history(run_id, "metric")) == 100
+    metric_history = mlflow_client.get_metric_history(run_id, "metric", start_step=10, end_step=15)
+    assert sorted(m.step for m in metric_history) == list(range(10, 16))
+    metric_history = mlflow_client.get_metric_history(run_id, "metric", max_points=4, start_step=20)
+    assert [m.step for m in metric_history] == [20, 40, 60, 80]
+
+
+def test_get_runs(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("Get Runs")
+    run_ids = [mlflow_client.create_run(experiment_id).info.run_id for _ in range(3)]
+    for i, run_id in enumerate(run_ids):
+        mlflow_client.log_batch(run_id, metrics=[Metric("m", i, 1, 0)], params=[Param("p", "v")])
+    runs = mlflow_client.get_runs(run_ids[::-1])
+    assert [run.info.run_id for run in runs] == run_ids[::-1]
+    assert [run.data.metrics for run in runs] == [{"m": 2.0}, {"m": 1.0}, {"m": 0.0}]
+    assert all(run.data.params == {"p": "v"} for run in runs)
+    with pytest.raises(MlflowException, match="not found"):
+        mlflow_client.get_runs([run_ids[0], "a" * 32])
+
+
+def test_log_metric_series(mlflow_client):
+    experiment_id = mlflow_client.create_experiment("Log Metric Series")
+    run_id = mlflow_client.create_run(experiment_id).info.run_id
+    values = np.linspace(0, 1, 2500)
+    mlflow_client.log_metric_series(run_id, "metric", values, timestamps=[100] * 2500)
+    metric_history = mlflow_client.get_metric_history(run_id, "metric")
+    assert sorted((m.step, m.value, m.timestamp) for m in metric_history) == [
+        (step, value, 100) for step, value in enumerate(values.tolist())
+    ]
+    assert mlflow_client.get_run(run_id).data.metrics["metric"] == 1.0
+
+
 def test_set_experiment_tag(mlflow_client, backend_store_uri):
     experiment_id = mlflow_client.create_experiment("SetExperimentTagTest")
     mlflow_client.set_experiment_tag(experiment_id, "dataset", "imagenet1K")
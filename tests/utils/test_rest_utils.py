@@ -1,10 +1,14 @@
 #!/usr/bin/env python
 
+import gzip
+import json
+
 import mock
 import numpy
 import pytest
 
 from mlflow.exceptions import MlflowException, RestException
+from mlflow.utils import rest_utils
 from mlflow.pyfunc.scoring_server import NumpyEncoder
 from mlflow.utils.rest_utils import (
     http_request,
@@ -13,12 +17,12 @@ from mlflow.utils.rest_utils import (
     _DEFAULT_HEADERS,
     call_endpoint,
 )
-from mlflow.protos.service_pb2 import GetRun
+from mlflow.protos.service_pb2 import GetRun, SetTag
 from tests import helper_functions
 
 
 def test_well_formed_json_error_response():
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         response_mock = mock.MagicMock()
         response_mock.status_code = 400
@@ -39,7 +43,7 @@ def test_well_formed_json_error_response():
     ],
 )
 def test_malformed_json_error_response(response_mock):
-    with mock.patch("requests.request") as request_mock:
+    with mock.patch("requests.Session.request") as request_mock:
         host_only = MlflowHostCreds("http://my-host")
         request_mock.return_value = response_mock
 
@@ -48,7 +52,7 @@ def test_malformed_json_error_response(response_mock):
             call_endpoint(host_only, "/my/endpoint", "GET", "", response_proto)
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_hostonly(request):
     host_only = MlflowHostCreds("http://my-host")
     response = mock.MagicMock()
@@ -60,7 +64,7 @@ def test_http_request_hostonly(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_cleans_hostname(request):
     # Add a trailing slash, should be removed.
     host_only = MlflowHostCreds("http://my-host/")
@@ -73,7 +77,7 @@ def test_http_request_cleans_hostname(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_basic_auth(request):
     host_only = MlflowHostCreds("http://my-host", username="user", password="pass")
     response = mock.MagicMock()
@@ -87,7 +91,7 @@ def test_http_request_with_basic_auth(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_token(request):
     host_only = MlflowHostCreds("http://my-host", token="my-token")
     response = mock.MagicMock()
@@ -101,7 +105,7 @@ def test_http_request_with_token(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_with_insecure(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -113,7 +117,7 @@ def test_http_request_with_insecure(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_client_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", client_cert_path="/some/path")
     response = mock.MagicMock()
@@ -125,7 +129,7 @@ def test_http_request_client_cert_path(request):
     )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_server_cert_path(request):
     host_only = MlflowHostCreds("http://my-host", server_cert_path="/some/path")
     response = mock.MagicMock()
@@ -144,7 +148,7 @@ def test_ignore_tls_verification_not_server_cert_path():
         )
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_429_retries(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
 
@@ -152,6 +156,7 @@ def test_429_retries(request):
         def __init__(self, status_code):
             self.status_code = status_code
             self.text = "mocked text"
+            self.headers = {}
 
     request.side_effect = [MockedResponse(x) for x in (429, 200)]
     assert http_request(host_only, "/my/endpoint", max_rate_limit_interval=0).status_code == 429
@@ -174,7 +179,7 @@ def test_429_retries(request):
     assert http_request(host_only, "/my/endpoint", retries=2).status_code == 200
 
 
-@mock.patch("requests.request")
+@mock.patch("requests.Session.request")
 def test_http_request_wrapper(request):
     host_only = MlflowHostCreds("http://my-host", ignore_tls_verification=True)
     response = mock.MagicMock()
@@ -197,6 +202,154 @@ def test_http_request_wrapper(request):
         http_request_safe(host_only, "/my/endpoint")
 
 
+@pytest.fixture
+def reset_sessions():
+    rest_utils._reset_sessions()
+    yield
+    rest_utils._reset_sessions()
+
+
+def test_http_request_reuses_session_per_host_and_credentials(reset_sessions):
+    session = rest_utils._get_session(MlflowHostCreds("http://my-host", token="a"))
+    assert rest_utils._get_session(MlflowHostCreds("http://my-host/", token="a")) is session
+    assert rest_utils._get_session(MlflowHostCreds("http://my-host", token="b")) is not session
+    assert rest_utils._get_session(MlflowHostCreds("http://other-host", token="a")) is not session
+
+    with mock.patch("requests.Session.request") as request:
+        request.return_value = mock.MagicMock(status_code=200)
+        http_request(MlflowHostCreds("http://my-host", token="a"), "/my/endpoint")
+        http_request(MlflowHostCreds("http://my-host", token="a"), "/my/endpoint")
+    assert rest_utils._get_session(MlflowHostCreds("http://my-host", token="a")) is session
+    assert len(rest_utils._sessions) == 3
+
+
+def test_sessions_are_not_shared_with_forked_processes(reset_sessions):
+    host_creds = MlflowHostCreds("http://my-host")
+    session = rest_utils._get_session(host_creds)
+    with mock.patch("os.getpid", return_value=rest_utils._sessions_pid + 1):
+        assert rest_utils._get_session(host_creds) is not session
+
+
+def test_session_configuration(reset_sessions):
+    session = rest_utils._get_session(MlflowHostCreds("http://my-host"))
+    adapter = session.get_adapter("http://my-host")
+    assert adapter._pool_maxsize == rest_utils._DEFAULT_HTTP_POOL_MAXSIZE
+    assert adapter.max_retries.total == rest_utils._DEFAULT_HTTP_REQUEST_MAX_RETRIES
+    assert session.headers["Connection"] == "keep-alive"
+
+    env = {
+        rest_utils.MLFLOW_HTTP_POOL_MAXSIZE: "32",
+        rest_utils.MLFLOW_HTTP_KEEP_ALIVE: "false",
+        rest_utils.MLFLOW_HTTP_REQUEST_MAX_RETRIES: "5",
+        rest_utils.MLFLOW_HTTP_REQUEST_BACKOFF_FACTOR: "2",
+    }
+    with mock.patch.dict("os.environ", env):
+        session = rest_utils._get_session(MlflowHostCreds("https://my-other-host"))
+    adapter = session.get_adapter("https://my-other-host")
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.connect == 5
+    assert adapter.max_retries.backoff_factor == 2
+    assert session.headers["Connection"] == "close"
+
+
+def test_call_endpoint_uses_protobuf_when_server_supports_it():
+    host_creds = MlflowHostCreds("http://my-protobuf-host")
+    request_proto = SetTag(run_id="run", key="key", value="value")
+    response_proto = GetRun.Response()
+    response_proto.run.info.run_id = "run"
+    json_response = mock.MagicMock(status_code=200, text='{"run": {"info": {"run_id": "run"}}}')
+    json_response.headers = {
+        "Content-Type": "application/json",
+        rest_utils.CONTENT_TYPES_HEADER: "application/json, application/x-protobuf",
+    }
+    protobuf_response = mock.MagicMock(status_code=200, content=response_proto.SerializeToString())
+    protobuf_response.headers = {"Content-Type": rest_utils.PROTOBUF_CONTENT_TYPE}
+    try:
+        with mock.patch("mlflow.utils.rest_utils.http_request") as http_request_mock:
+            http_request_mock.return_value = json_response
+            # Requests are sent as JSON until the server advertises support for protobuf
+            response = call_endpoint(
+                host_creds, "/my/endpoint", "POST", request_proto, GetRun.Response()
+            )
+            assert response == response_proto
+            assert http_request_mock.call_args[1]["json"] == {
+                "run_id": "run",
+                "key": "key",
+                "value": "value",
+            }
+
+            http_request_mock.return_value = protobuf_response
+            response = call_endpoint(
+                host_creds, "/my/endpoint", "POST", request_proto, GetRun.Response()
+            )
+            assert response == response_proto
+            kwargs = http_request_mock.call_args[1]
+            assert kwargs["data"] == request_proto.SerializeToString()
+            assert kwargs["extra_headers"] == {
+                "Accept": rest_utils.PROTOBUF_CONTENT_TYPE,
+                "Content-Type": rest_utils.PROTOBUF_CONTENT_TYPE,
+            }
+
+            # GET requests send their parameters in the query string
+            call_endpoint(host_creds, "/my/endpoint", "GET", request_proto, GetRun.Response())
+            kwargs = http_request_mock.call_args[1]
+            assert kwargs["params"] == {"run_id": "run", "key": "key", "value": "value"}
+            assert kwargs["extra_headers"] == {"Accept": rest_utils.PROTOBUF_CONTENT_TYPE}
+    finally:
+        rest_utils._protobuf_hosts.discard("http://my-protobuf-host")
+
+
+def test_call_endpoint_uses_json_when_server_does_not_support_protobuf():
+    host_creds = MlflowHostCreds("http://my-json-host")
+    response = mock.MagicMock(status_code=200, text="{}")
+    response.headers = {"Content-Type": "application/json"}
+    with mock.patch("mlflow.utils.rest_utils.http_request", return_value=response) as request_mock:
+        for _ in range(2):
+            call_endpoint(
+                host_creds, "/my/endpoint", "POST", SetTag(run_id="run"), GetRun.Response()
+            )
+            request_mock.assert_called_with(
+                host_creds=host_creds,
+                endpoint="/my/endpoint",
+                method="POST",
+                json={"run_id": "run"},
+            )
+
+
+@mock.patch("requests.Session.request")
+def test_http_request_compresses_large_bodies_when_server_supports_it(request):
+    host_creds = MlflowHostCreds("http://my-gzip-host")
+    response = mock.MagicMock(status_code=200)
+    response.headers = {rest_utils.CONTENT_ENCODINGS_HEADER: "gzip, deflate"}
+    request.return_value = response
+    body = {"key": "a" * rest_utils._REQUEST_COMPRESSION_MIN_SIZE}
+    try:
+        # Bodies are sent uncompressed until the server advertises support for gzip
+        http_request(host_creds, "/my/endpoint", method="POST", json=body)
+        assert request.call_args[1]["json"] == body
+        assert "Content-Encoding" not in request.call_args[1]["headers"]
+
+        http_request(host_creds, "/my/endpoint", method="POST", json=body)
+        kwargs = request.call_args[1]
+        assert "json" not in kwargs
+        assert json.loads(gzip.decompress(kwargs["data"]).decode("utf-8")) == body
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert kwargs["headers"]["Content-Type"] == "application/json"
+
+        data = b"a" * rest_utils._REQUEST_COMPRESSION_MIN_SIZE
+        http_request(host_creds, "/my/endpoint", method="POST", data=data)
+        assert gzip.decompress(request.call_args[1]["data"]) == data
+
+        # Small bodies are sent uncompressed
+        http_request(host_creds, "/my/endpoint", method="POST", json={"key": "a"})
+        kwargs = request.call_args[1]
+        assert kwargs["json"] == {"key": "a"}
+        assert "Content-Encoding" not in kwargs["headers"]
+    finally:
+        rest_utils._gzip_hosts.discard("http://my-gzip-host")
+
+
 def test_numpy_encoder():
     test_number = numpy.int64(42)
     ne = NumpyEncoder()
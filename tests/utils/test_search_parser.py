@@ -0,0 +1,915 @@
+"""
+Conformance tests for the search grammar parser. The expected results and error messages were
+recorded from the previous ``sqlparse`` based implementation of ``SearchUtils``.
+"""
+import pytest
+
+from mlflow.exceptions import MlflowException
+from mlflow.utils import _search_parser
+from mlflow.utils.search_utils import SearchUtils
+
+
+def _assert_parse_result(parse, string, expected):
+    if isinstance(expected, str):
+        with pytest.raises(MlflowException) as e:
+            parse(string)
+        assert e.value.message == expected
+    else:
+        assert parse(string) == expected
+
+
+@pytest.mark.parametrize(
+    "filter_string, expected",
+    [
+        (
+            "\tparams.a\t=\t'x'",
+            [{"comparator": "=", "key": "a", "type": "parameter", "value": "x"}],
+        ),
+        (" ", []),
+        ("   ", []),
+        ("(metrics.a > 1)", "Invalid clause(s) in filter string: '(metrics.a > 1)'"),
+        ("/* c */ metrics.a > 1", "Invalid clause(s) in filter string: '/* c */ '"),
+        ("1 > metrics.a", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        ("1=1", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        ("1==2", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        ("AND metrics.a > 1", [{"comparator": ">", "key": "a", "type": "metric", "value": "1"}]),
+        ("metrics.`a b` > 1", [{"comparator": ">", "key": "a b", "type": "metric", "value": "1"}]),
+        ("metrics.a", "Invalid clause(s) in filter string: 'metrics.a'"),
+        ("metrics.a 1", "Invalid clause(s) in filter string: 'metrics.a', '1'"),
+        (
+            "metrics.a = 1 = 2",
+            "Invalid comparison clause. Expected 'Identifier' found 'metrics.a = 1'",
+        ),
+        ("metrics.a = = 1", "Invalid clause(s) in filter string: 'metrics.a', '=', '=', '1'"),
+        ("metrics.a > $1", "Expected numeric value type for metric. Found $1"),
+        ("metrics.a > *", "Invalid clause(s) in filter string: 'metrics.a', '>', '*'"),
+        ("metrics.a > 1 -- x", "Invalid clause(s) in filter string: '-- x'"),
+        (
+            "metrics.a > 1 ;;",
+            (
+                "Search filter contained multiple expression 'metrics.a > 1 ;;'. Provide "
+                "AND-ed expression list."
+            ),
+        ),
+        ("metrics.a > 1 AND", [{"comparator": ">", "key": "a", "type": "metric", "value": "1"}]),
+        (
+            "metrics.a > 1 AND (params.b = 'x')",
+            "Invalid clause(s) in filter string: '(params.b = 'x')'",
+        ),
+        ("metrics.a > 1 OR metrics.b < 2", "Invalid clause(s) in filter string: 'OR'"),
+        ("metrics.a > 1 abc", "Invalid clause(s) in filter string: 'metrics.a > 1 abc'"),
+        (
+            "metrics.a > 1 and metrics.b < 2",
+            [
+                {"comparator": ">", "key": "a", "type": "metric", "value": "1"},
+                {"comparator": "<", "key": "b", "type": "metric", "value": "2"},
+            ],
+        ),
+        (
+            "metrics.a > 1, metrics.b > 2",
+            "Invalid clause(s) in filter string: 'metrics.a > 1, metrics.b > 2'",
+        ),
+        ("metrics.a > 1;", "Invalid clause(s) in filter string: ';'"),
+        ("metrics.a > 1; ", "Invalid clause(s) in filter string: ';'"),
+        ("metrics.a > ?", "Expected numeric value type for metric. Found ?"),
+        ("metrics.a > @x", "Invalid clause(s) in filter string: 'metrics.a', '>', '@', 'x'"),
+        (
+            "metrics.a.b.c > 1",
+            [{"comparator": ">", "key": "a.b.c", "type": "metric", "value": "1"}],
+        ),
+        ("metrics.a>1 and not metrics.b<2", "Invalid clause(s) in filter string: 'not'"),
+        (
+            "metrics.a>1;\n",
+            (
+                "Search filter contained multiple expression 'metrics.a>1;\n'. Provide "
+                "AND-ed expression list."
+            ),
+        ),
+        (
+            "metrics.a>1; metrics.b>2",
+            (
+                "Search filter contained multiple expression 'metrics.a>1; metrics.b>2'. "
+                "Provide AND-ed expression list."
+            ),
+        ),
+        ("metrics.ä > 1", [{"comparator": ">", "key": "ä", "type": "metric", "value": "1"}]),
+        (
+            "name != 'x'",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            'name = "x"',
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name = 'x'",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name = 'x' AND version = '1'",
+            "Invalid clause(s) in filter string: 'version', '=', ''1''",
+        ),
+        (
+            "name = 1",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name = x",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name ILIKE '%x%'",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name LIKE '%x%'",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name='x'",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "params.\"my-key\" = 'a'",
+            [{"comparator": "=", "key": "my-key", "type": "parameter", "value": "a"}],
+        ),
+        (
+            "params.a = 'x'\n AND params.b = 'y'",
+            [
+                {"comparator": "=", "key": "a", "type": "parameter", "value": "x"},
+                {"comparator": "=", "key": "b", "type": "parameter", "value": "y"},
+            ],
+        ),
+        (
+            "params.a = 'x' AND AND params.b = 'y'",
+            [
+                {"comparator": "=", "key": "a", "type": "parameter", "value": "x"},
+                {"comparator": "=", "key": "b", "type": "parameter", "value": "y"},
+            ],
+        ),
+        (
+            "params.a = 'x' AND tags.b LIKE '%y%' AND metrics.c >= 1.0",
+            [
+                {"comparator": "=", "key": "a", "type": "parameter", "value": "x"},
+                {"comparator": "LIKE", "key": "b", "type": "tag", "value": "%y%"},
+                {"comparator": ">=", "key": "c", "type": "metric", "value": "1.0"},
+            ],
+        ),
+        (
+            "params.a = 'x' and",
+            [{"comparator": "=", "key": "a", "type": "parameter", "value": "x"}],
+        ),
+        (
+            "params.a IN ('a', 'b')",
+            "Invalid clause(s) in filter string: 'params.a', 'IN', '('a', 'b')'",
+        ),
+        (
+            "params.my-key = 'a'",
+            "Invalid clause(s) in filter string: 'params.my', '-', 'key', '=', ''a''",
+        ),
+        (
+            "run_id = 'abc'",
+            (
+                "Invalid identifier 'run_id'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "source_path = 'a/b'",
+            (
+                "Invalid identifier 'source_path'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ('tags."a".b = "x"', [{"comparator": "=", "key": '"a".b', "type": "tag", "value": "x"}]),
+        ('"name" < 0x1F', "Invalid clause(s) in filter string: '\"name\"', '<', '0x1F'"),
+        (
+            '"name"<>(1)',
+            (
+                "Invalid identifier '\"name\"'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "`metrics`.`acc`>=-2",
+            [{"comparator": ">=", "key": "acc", "type": "metric", "value": "-2"}],
+        ),
+        (
+            "`name`=='a'",
+            (
+                "Invalid identifier '`name`'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("`name`=true", "Invalid clause(s) in filter string: '`name`', '=', 'true'"),
+        (
+            "`params`.m = 1.5",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value 1.5",
+        ),
+        (
+            "`params`.m~('a', 'b')",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value ('a', 'b')",
+        ),
+        (
+            "acc < -2",
+            (
+                "Invalid identifier 'acc'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "acc > abc",
+            (
+                "Invalid identifier 'acc'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("acc IN -2", "Invalid clause(s) in filter string: 'acc', 'IN', '-2'"),
+        ("attr.statuslike''", "Invalid clause(s) in filter string: 'attr.statuslike', ''''"),
+        ("attr.statuslikeNULL", "Invalid clause(s) in filter string: 'attr.statuslikeNULL'"),
+        (
+            "attribute.artifact_uri <= 0x1F",
+            "Invalid clause(s) in filter string: 'attribute.artifact_uri', '<=', '0x1F'",
+        ),
+        (
+            "attribute.artifact_uri ILIKE 1 + 2",
+            "Expected a quoted string value for attributes. Got value 1 + 2",
+        ),
+        (
+            "attributes.status = abc",
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value abc. Use either single or double quotes."
+            ),
+        ),
+        ("attributes.status>=(1)", "Expected a quoted string value for attributes. Got value (1)"),
+        ("foo.acc IS 'a'", "Invalid clause(s) in filter string: 'foo.acc', 'IS', ''a''"),
+        (
+            "foo.acc like 1.5",
+            (
+                "Invalid entity type 'foo'. Valid values are ['metric', 'parameter', "
+                "'tag', 'attribute']"
+            ),
+        ),
+        ("metric.1a == 5.", [{"comparator": "==", "key": "1a", "type": "metric", "value": "5."}]),
+        ('metric.1a ilike "a"', 'Expected numeric value type for metric. Found "a"'),
+        ('metric.1a>"a"', 'Expected numeric value type for metric. Found "a"'),
+        ("metric.acc < .5", [{"comparator": "<", "key": "acc", "type": "metric", "value": ".5"}]),
+        ("metric.acc <> 1 + 2", "Expected numeric value type for metric. Found 1 + 2"),
+        (
+            "metrics . acc != NULL",
+            (
+                "Invalid entity type 'metrics '. Valid values are ['metric', 'parameter', "
+                "'tag', 'attribute']"
+            ),
+        ),
+        (
+            "metrics . acclike'%a_'",
+            "Invalid clause(s) in filter string: 'metrics . acclike', ''%a_''",
+        ),
+        (
+            "metrics. >= -1.5E-3",
+            [{"comparator": ">=", "key": "", "type": "metric", "value": "-1.5E-3"}],
+        ),
+        ("metrics. ~ 1e3", [{"comparator": "~", "key": "", "type": "metric", "value": "1e3"}]),
+        ('metrics.NOT LIKE"a"', 'Expected numeric value type for metric. Found "a"'),
+        ("metrics._x == NULL", "Expected numeric value type for metric. Found NULL"),
+        ("metrics._x IN abc", "Invalid clause(s) in filter string: 'metrics._x', 'IN', 'abc'"),
+        ("metrics.`a.b` > '", "Invalid clause(s) in filter string: 'metrics.`a.b`', '>', '''"),
+        ("metrics.`a.b` LIKE abc", "Expected numeric value type for metric. Found abc"),
+        ("metrics.a_b!=true", "Invalid clause(s) in filter string: 'metrics.a_b', '!=', 'true'"),
+        (
+            "metrics.acc <> .5",
+            [{"comparator": "<>", "key": "acc", "type": "metric", "value": ".5"}],
+        ),
+        ("metrics.acc LIKE abc", "Expected numeric value type for metric. Found abc"),
+        ("metrics.like'a'", "Invalid clause(s) in filter string: 'metrics.like', ''a''"),
+        (
+            "metrics.timestamp<5.",
+            [{"comparator": "<", "key": "timestamp", "type": "metric", "value": "5."}],
+        ),
+        (
+            "metrics.timestampilike-1.5E-3",
+            "Invalid clause(s) in filter string: 'metrics.timestampilike', '-1.5E-3'",
+        ),
+        (
+            "name <> 1 + 2",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "param.m = 1.5",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value 1.5",
+        ),
+        ("param.m IS 5.", "Invalid clause(s) in filter string: 'param.m', 'IS', '5.'"),
+        (
+            "param.m LIKE 'a''b'",
+            [{"comparator": "LIKE", "key": "m", "type": "parameter", "value": "a''b"}],
+        ),
+        (
+            "param.m>=1.5",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value 1.5",
+        ),
+        (
+            'params."m.x" < select',
+            "Invalid clause(s) in filter string: 'params.\"m.x\"', '<', 'select'",
+        ),
+        (
+            "params.\"m.x\"<'%a_'",
+            [{"comparator": "<", "key": "m.x", "type": "parameter", "value": "%a_"}],
+        ),
+        (
+            "params.\"m.x\"IS'%a_'",
+            "Invalid clause(s) in filter string: 'params.\"m.x\"', 'IS', ''%a_''",
+        ),
+        (
+            "params.key >= abc",
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value abc. Use either single or double quotes."
+            ),
+        ),
+        (
+            "params.key>=(1)",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value (1)",
+        ),
+        (
+            "params.model == (1)",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value (1)",
+        ),
+        (
+            "params.model ilike 'a",
+            "Invalid clause(s) in filter string: 'params.model', 'ilike', ''', 'a'",
+        ),
+        (
+            "params.model<=1 + 2",
+            "Expected a quoted string value for parameter (e.g. 'my-value'). Got value 1 + 2",
+        ),
+        (
+            "params.modelNOT LIKE('a', 'b')",
+            "Invalid clause(s) in filter string: 'params.modelNOT', 'LIKE('a', 'b')'",
+        ),
+        (
+            "params.select > metrics.b",
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value metrics.b. Use either single or double quotes."
+            ),
+        ),
+        (
+            "params.selectNOT LIKE0x1F",
+            "Invalid clause(s) in filter string: 'params.selectNOT LIKE0x1F'",
+        ),
+        (
+            "run.status=abc",
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value abc. Use either single or double quotes."
+            ),
+        ),
+        (
+            "run_id <= '%a_'",
+            (
+                "Invalid identifier 'run_id'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "run_id <> -2",
+            (
+                "Invalid identifier 'run_id'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "run_id NOT LIKE 'a''b'",
+            (
+                "Invalid identifier 'run_id'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("run_id==select", "Invalid clause(s) in filter string: 'run_id', '==', 'select'"),
+        (
+            "source_path IS -1.5E-3",
+            "Invalid clause(s) in filter string: 'source_path', 'IS', '-1.5E-3'",
+        ),
+        (
+            "tag.`my tag`!='a''b'",
+            [{"comparator": "!=", "key": "my tag", "type": "tag", "value": "a''b"}],
+        ),
+        (
+            'tags."a b" == metrics.b',
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value metrics.b. Use either single or double quotes."
+            ),
+        ),
+        (
+            "tags.t != 1e3",
+            "Expected a quoted string value for tag (e.g. 'my-value'). Got value 1e3",
+        ),
+        (
+            "tags.t <= abc",
+            (
+                "Parameter value is either not quoted or unidentified quote types used for "
+                "string value abc. Use either single or double quotes."
+            ),
+        ),
+        ("tags.t IN 5.", "Invalid clause(s) in filter string: 'tags.t', 'IN', '5.'"),
+        ("tags.t>1.5", "Expected a quoted string value for tag (e.g. 'my-value'). Got value 1.5"),
+        ("timestamp = .5", "Invalid clause(s) in filter string: 'timestamp', '=', '.5'"),
+        ("timestamp == '%a_'", "Invalid clause(s) in filter string: 'timestamp', '==', ''%a_''"),
+        ("version >= true", "Invalid clause(s) in filter string: 'version', '>=', 'true'"),
+        (
+            "version IS metrics.b",
+            "Invalid clause(s) in filter string: 'version', 'IS', 'metrics.b'",
+        ),
+    ],
+)
+def test_search_filter_conformance(filter_string, expected):
+    _assert_parse_result(SearchUtils.parse_search_filter, filter_string, expected)
+
+
+# Malformed filters mixing comparisons, aliases, comments and unbalanced parenthesis, for which
+# the invalid clauses are reported as sqlparse grouped them
+@pytest.mark.parametrize(
+    "filter_string, expected",
+    [
+        (
+            "metrics.acc IN 1 metrics.acc_2 LIKE .5",
+            (
+                "Invalid clause(s) in filter string: 'metrics.acc', 'IN', '1 metrics.acc_2', "
+                "'LIKE', '.5'"
+            ),
+        ),
+        ("(=tags", "Invalid clause(s) in filter string: '(', '=', 'tags'"),
+        (
+            "acc acc params.model metrics.acc_2 .5",
+            "Invalid clause(s) in filter string: 'acc acc', 'params.model metrics.acc_2', '.5'",
+        ),
+        ("tags.t ? name", "Invalid clause(s) in filter string: 'tags.t', '?', 'name'"),
+        ("metrics NOT NULL", "Invalid clause(s) in filter string: 'metrics', 'NOT NULL'"),
+        ("1 * acc", "Invalid clause(s) in filter string: '1 * acc'"),
+        (
+            "attribute.artifact_uri/* c */tags.t",
+            "Invalid clause(s) in filter string: 'attribute.artifact_uri/* c */', 'tags.t'",
+        ),
+        (
+            "tags.t<>0x1fANDnameIS1",
+            "Invalid clause(s) in filter string: 'tags.t', '<>', '0x1fANDnameIS1'",
+        ),
+        ("tags.t<>(1,(", "Invalid clause(s) in filter string: 'tags.t', '<>', '(', '1', ',', '('"),
+        (
+            "abc tags.`a b` + NULL",
+            "Invalid clause(s) in filter string: 'abc tags.`a b`', '+', 'NULL'",
+        ),
+        (
+            ";/* c */",
+            (
+                "Search filter contained multiple expression ';/* c */'. Provide AND-ed "
+                "expression list."
+            ),
+        ),
+        ("tags.t . . --", "Invalid clause(s) in filter string: 'tags.t . .', '--'"),
+        (
+            "params.`p` ('a') . AND tags.t <= -1",
+            "Invalid clause(s) in filter string: 'params.`p` ('a')', '.'",
+        ),
+        ('"b" DESC asc', "Invalid clause(s) in filter string: '\"b\" DESC asc'"),
+        (
+            "metrics.a > 1 /* c */ AND metrics.b < 2",
+            "Invalid comparison clause. Expected 3 tokens found 4",
+        ),
+        (
+            "metrics.a IS NOT NULL",
+            "Invalid clause(s) in filter string: 'metrics.a', 'IS', 'NOT NULL'",
+        ),
+    ],
+)
+def test_search_filter_conformance_for_malformed_filters(filter_string, expected):
+    _assert_parse_result(SearchUtils.parse_search_filter, filter_string, expected)
+
+
+@pytest.mark.parametrize(
+    "filter_string, expected",
+    [
+        (" ", []),
+        ("   ", []),
+        (
+            "(metrics.a > 1)",
+            (
+                "Invalid clause(s) in filter string: '(metrics.a > 1)'. Expected search "
+                "filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "/* c */ metrics.a > 1",
+            (
+                "Invalid clause(s) in filter string: '/* c */ '. Expected search filter "
+                "with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        ("1 > metrics.a", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        ("1=1", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        ("1==2", "Invalid comparison clause. Expected 'Identifier' found '1'"),
+        (
+            "metrics.a",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a'. Expected search filter "
+                "with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a 1",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a', '1'. Expected search "
+                "filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a = 1 = 2",
+            "Invalid comparison clause. Expected 'Identifier' found 'metrics.a = 1'",
+        ),
+        (
+            "metrics.a = = 1",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a', '=', '=', '1'. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > *",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a', '>', '*'. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1 -- x",
+            (
+                "Invalid clause(s) in filter string: '-- x'. Expected search filter with "
+                "single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1 ;;",
+            (
+                "Search filter 'metrics.a > 1 ;;' contains multiple expressions. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName' "
+            ),
+        ),
+        (
+            "metrics.a > 1 AND (params.b = 'x')",
+            (
+                "Invalid clause(s) in filter string: '(params.b = 'x')'. Expected search "
+                "filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1 OR metrics.b < 2",
+            (
+                "Invalid clause(s) in filter string: 'OR'. Expected search filter with "
+                "single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1 abc",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a > 1 abc'. Expected search "
+                "filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1, metrics.b > 2",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a > 1, metrics.b > 2'. "
+                "Expected search filter with single comparison operator. e.g. "
+                "name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1;",
+            (
+                "Invalid clause(s) in filter string: ';'. Expected search filter with "
+                "single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > 1; ",
+            (
+                "Invalid clause(s) in filter string: ';'. Expected search filter with "
+                "single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a > @x",
+            (
+                "Invalid clause(s) in filter string: 'metrics.a', '>', '@', 'x'. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a>1 and not metrics.b<2",
+            (
+                "Invalid clause(s) in filter string: 'not'. Expected search filter with "
+                "single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        (
+            "metrics.a>1;\n",
+            (
+                "Search filter 'metrics.a>1;\n' contains multiple expressions. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName' "
+            ),
+        ),
+        (
+            "metrics.a>1; metrics.b>2",
+            (
+                "Search filter 'metrics.a>1; metrics.b>2' contains multiple expressions. "
+                "Expected search filter with single comparison operator. e.g. "
+                "name='myModelName' "
+            ),
+        ),
+        ("name != 'x'", [{"comparator": "!=", "key": "name", "value": "x"}]),
+        ('name = "x"', 'Expected a quoted string value for attributes. Got value "x"'),
+        ("name = 'x'", [{"comparator": "=", "key": "name", "value": "x"}]),
+        (
+            "name = 'x' AND version = '1'",
+            (
+                "Invalid clause(s) in filter string: 'version', '=', ''1''. Expected "
+                "search filter with single comparison operator. e.g. name='myModelName'"
+            ),
+        ),
+        ("name = 1", "Expected a quoted string value for attributes. Got value 1"),
+        ("name = x", "Expected a quoted string value for attributes. Got value x"),
+        ("name ILIKE '%x%'", [{"comparator": "ILIKE", "key": "name", "value": "%x%"}]),
+        ("name LIKE '%x%'", [{"comparator": "LIKE", "key": "name", "value": "%x%"}]),
+        ("name='x'", [{"comparator": "=", "key": "name", "value": "x"}]),
+        (
+            "params.a IN ('a', 'b')",
+            (
+                "Invalid clause(s) in filter string: 'params.a', 'IN', '('a', 'b')'. "
+                "Expected search filter with single comparison operator. e.g. "
+                "name='myModelName'"
+            ),
+        ),
+        (
+            "params.my-key = 'a'",
+            (
+                "Invalid clause(s) in filter string: 'params.my', '-', 'key', '=', ''a''. "
+                "Expected search filter with single comparison operator. e.g. "
+                "name='myModelName'"
+            ),
+        ),
+        ("run_id = 'abc'", [{"comparator": "=", "key": "run_id", "value": "abc"}]),
+        ("source_path = 'a/b'", [{"comparator": "=", "key": "source_path", "value": "a/b"}]),
+    ],
+)
+def test_model_version_filter_conformance(filter_string, expected):
+    _assert_parse_result(SearchUtils.parse_filter_for_model_versions, filter_string, expected)
+
+
+@pytest.mark.parametrize(
+    "order_by, expected",
+    [
+        (" metrics.acc", "Invalid order_by clause ' metrics.acc'. Could not be parsed."),
+        (
+            '"name" ASC',
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("(metrics.acc)", "Invalid order_by clause '(metrics.acc)'. Could not be parsed."),
+        ("1", "Invalid order_by clause '1'. Could not be parsed."),
+        (
+            "1 DESC",
+            (
+                "Invalid identifier '1'. Columns should be specified as 'attribute.<key>', "
+                "'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("DESC", "Invalid order_by clause 'DESC'. Could not be parsed."),
+        (
+            "`name` DESC",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("attr.status ASC", ("attribute", "status", True)),
+        ("attribute.end_time desc", ("attribute", "end_time", False)),
+        ("attributes.start_time", ("attribute", "start_time", True)),
+        (
+            "foo.bar",
+            (
+                "Invalid entity type 'foo'. Valid values are ['metric', 'parameter', "
+                "'tag', 'attribute']"
+            ),
+        ),
+        (
+            "last_updated_timestamp",
+            (
+                "Invalid identifier 'last_updated_timestamp'. Columns should be specified "
+                "as 'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "last_updated_timestamp DESC",
+            (
+                "Invalid identifier 'last_updated_timestamp'. Columns should be specified "
+                "as 'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "metrics",
+            (
+                "Invalid identifier 'metrics'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("metrics.", ("metric", "", True)),
+        ("metrics.a > 1", "Invalid order_by clause 'metrics.a > 1'. Could not be parsed."),
+        ("metrics.acc", ("metric", "acc", True)),
+        ("metrics.acc ", "Invalid order_by clause 'metrics.acc '. Could not be parsed."),
+        ("metrics.acc  DESC", ("metric", "acc", False)),
+        ("metrics.acc ACS", "Invalid ordering key in order_by clause 'metrics.acc ACS'."),
+        ("metrics.acc ASC", ("metric", "acc", True)),
+        ("metrics.acc DESC", ("metric", "acc", False)),
+        (
+            "metrics.acc DESC ASC",
+            "Invalid order_by clause 'metrics.acc DESC ASC'. Could not be parsed.",
+        ),
+        (
+            "metrics.acc DESC foo",
+            "Invalid order_by clause 'metrics.acc DESC foo'. Could not be parsed.",
+        ),
+        (
+            "metrics.acc DESC, x",
+            "Invalid order_by clause 'metrics.acc DESC, x'. Could not be parsed.",
+        ),
+        ("metrics.acc decs", "Invalid ordering key in order_by clause 'metrics.acc decs'."),
+        ("metrics.acc desc", ("metric", "acc", False)),
+        ("metrics.acc;", "Invalid order_by clause 'metrics.acc;'. Could not be parsed."),
+        ("metrics.acc; x", "Invalid order_by clause 'metrics.acc; x'. Could not be parsed."),
+        (
+            "name",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "name DESC",
+            (
+                "Invalid identifier 'name'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("name aCs", "Invalid ordering key in order_by clause 'name aCs'."),
+        ('params."a b"', ("parameter", "a b", True)),
+        ("params.`a b` DESC", ("parameter", "a b", False)),
+        ("run.artifact_uri", ("attribute", "artifact_uri", True)),
+        ("tag.`x`.y", ("tag", "`x`.y", True)),
+        ("tags.t asc", ("tag", "t", True)),
+        (
+            "timestamp",
+            (
+                "Invalid identifier 'timestamp'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "timestamp   asc",
+            (
+                "Invalid identifier 'timestamp'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        (
+            "timestamp DESC",
+            (
+                "Invalid identifier 'timestamp'. Columns should be specified as "
+                "'attribute.<key>', 'metric.<key>', 'tag.<key>', or 'param.'."
+            ),
+        ),
+        ("timestamp foo", "Invalid order_by clause 'timestamp foo'. Could not be parsed."),
+        ("timestamp, name", "Invalid order_by clause 'timestamp, name'. Could not be parsed."),
+        (
+            "tags.t=1e3ANDnameNOTNULLANDparams.`p`LIKENULL",
+            (
+                "Invalid order_by clause 'tags.t=1e3ANDnameNOTNULLANDparams.`p`LIKENULL'. "
+                "Could not be parsed."
+            ),
+        ),
+    ],
+)
+def test_order_by_for_search_runs_conformance(order_by, expected):
+    _assert_parse_result(SearchUtils.parse_order_by_for_search_runs, order_by, expected)
+
+
+@pytest.mark.parametrize(
+    "order_by, expected",
+    [
+        (" metrics.acc", "Invalid order_by clause ' metrics.acc'. Could not be parsed."),
+        ('"name" ASC', ("name", True)),
+        ("(metrics.acc)", "Invalid order_by clause '(metrics.acc)'. Could not be parsed."),
+        ("1", "Invalid order_by clause '1'. Could not be parsed."),
+        ("DESC", "Invalid order_by clause 'DESC'. Could not be parsed."),
+        ("`name` DESC", ("name", False)),
+        ("last_updated_timestamp", ("last_updated_timestamp", True)),
+        ("last_updated_timestamp DESC", ("last_updated_timestamp", False)),
+        ("metrics.a > 1", "Invalid order_by clause 'metrics.a > 1'. Could not be parsed."),
+        ("metrics.acc ", "Invalid order_by clause 'metrics.acc '. Could not be parsed."),
+        ("metrics.acc ACS", "Invalid ordering key in order_by clause 'metrics.acc ACS'."),
+        (
+            "metrics.acc DESC ASC",
+            "Invalid order_by clause 'metrics.acc DESC ASC'. Could not be parsed.",
+        ),
+        (
+            "metrics.acc DESC foo",
+            "Invalid order_by clause 'metrics.acc DESC foo'. Could not be parsed.",
+        ),
+        (
+            "metrics.acc DESC, x",
+            "Invalid order_by clause 'metrics.acc DESC, x'. Could not be parsed.",
+        ),
+        ("metrics.acc decs", "Invalid ordering key in order_by clause 'metrics.acc decs'."),
+        ("metrics.acc;", "Invalid order_by clause 'metrics.acc;'. Could not be parsed."),
+        ("metrics.acc; x", "Invalid order_by clause 'metrics.acc; x'. Could not be parsed."),
+        ("name", ("name", True)),
+        ("name DESC", ("name", False)),
+        ("name aCs", "Invalid ordering key in order_by clause 'name aCs'."),
+        ("timestamp", ("timestamp", True)),
+        ("timestamp   asc", ("timestamp", True)),
+        ("timestamp DESC", ("timestamp", False)),
+        ("timestamp foo", "Invalid order_by clause 'timestamp foo'. Could not be parsed."),
+        ("timestamp, name", "Invalid order_by clause 'timestamp, name'. Could not be parsed."),
+    ],
+)
+def test_order_by_for_search_registered_models_conformance(order_by, expected):
+    _assert_parse_result(
+        SearchUtils.parse_order_by_for_search_registered_models, order_by, expected
+    )
+
+
+def test_tokenize_preserves_source_text():
+    text = "metrics.`a b` >= -1.5e3 AND\n\tparams.\"p\" ILIKE '%x''y%' -- comment"
+    tokens = _search_parser.tokenize(text)
+    assert "".join(token.value for token in tokens) == text
+    assert [token.kind for token in tokens if not token.is_whitespace] == [
+        _search_parser.NAME,
+        _search_parser.PUNCTUATION,
+        _search_parser.NAME,
+        _search_parser.COMPARISON_OPERATOR,
+        _search_parser.FLOAT,
+        _search_parser.KEYWORD,
+        _search_parser.NAME,
+        _search_parser.PUNCTUATION,
+        _search_parser.SYMBOL,
+        _search_parser.COMPARISON_OPERATOR,
+        _search_parser.STRING,
+        _search_parser.COMMENT,
+    ]
+
+
+def test_parse_groups_comparisons_and_splits_statements():
+    statements = _search_parser.parse("metrics.a > 1 and params.b = 'x'; tags.c = 'y'")
+    assert [
+        [(token.kind, token.value) for token in statement if not token.is_whitespace]
+        for statement in statements
+    ] == [
+        [
+            (_search_parser.COMPARISON, "metrics.a > 1"),
+            (_search_parser.KEYWORD, "and"),
+            (_search_parser.COMPARISON, "params.b = 'x'"),
+            (_search_parser.PUNCTUATION, ";"),
+        ],
+        [(_search_parser.COMPARISON, "tags.c = 'y'")],
+    ]
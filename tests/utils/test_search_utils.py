@@ -301,6 +301,60 @@ def test_correct_filtering(filter_string, matching_runs):
     assert set(filtered_runs) == set([runs[i] for i in matching_runs])
 
 
+def test_parse_search_filter_returns_copies_of_cached_clauses():
+    filter_string = "params.my_param = 'A' AND metrics.key1 > 1"
+    parsed = SearchUtils.parse_search_filter(filter_string)
+    parsed[0]["value"] = "B"
+    parsed.append({"comparator": "=", "key": "x", "type": "tag", "value": "y"})
+    assert SearchUtils.parse_search_filter(filter_string) == [
+        {"type": "parameter", "key": "my_param", "comparator": "=", "value": "A"},
+        {"type": "metric", "key": "key1", "comparator": ">", "value": "1"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "filter_string, matching_runs",
+    [
+        ("params.my_param LIKE 'A%'", [0, 1]),
+        ("params.my_param LIKE '%B'", []),
+        ("params.my_param ILIKE '%B'", [1]),
+        ("params.my_param ILIKE 'a_c'", [0]),
+        ("tags.tag1 LIKE '%'", [1]),
+        ("metrics.key1 < 10 AND params.my_param LIKE 'A%'", [0]),
+        ("attributes.status ILIKE 'fail%'", [0]),
+    ],
+)
+def test_compiled_search_filter(filter_string, matching_runs):
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid=run_id,
+                run_id=run_id,
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(status),
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[Metric("key1", metric_value, 1, 0)],
+                params=[Param("my_param", param_value)],
+                tags=tags,
+            ),
+        )
+        for run_id, status, metric_value, param_value, tags in [
+            ("hi", RunStatus.FAILED, 1, "ABC", []),
+            ("hi2", RunStatus.FINISHED, 20, "Ab", [RunTag("tag1", "C")]),
+        ]
+    ]
+    run_matches = SearchUtils.compile_search_filter(filter_string)
+    assert [run for run in runs if run_matches(run)] == [runs[i] for i in matching_runs]
+    # The compiled predicate is cached and can be reused across calls
+    assert SearchUtils.compile_search_filter(filter_string)(runs[0]) == (0 in matching_runs)
+    assert SearchUtils.filter(runs, filter_string) == [runs[i] for i in matching_runs]
+
+
 @pytest.mark.parametrize(
     "order_bys, matching_runs",
     [
@@ -544,6 +598,128 @@ def test_pagination(page_token, max_results, matching_runs, expected_next_page_t
     assert decoded_next_page_token == expected_next_page_token
 
 
+@pytest.mark.parametrize(
+    "order_bys",
+    [
+        [],
+        ["metrics.x asc"],
+        ["metrics.x desc"],
+        ["params.p desc", "metrics.x"],
+        ["attributes.start_time asc", "metrics.x desc"],
+        ["metrics.x desc", "params.p asc"],
+    ],
+)
+@pytest.mark.parametrize("max_results", [1, 4, 7, 100])
+@pytest.mark.parametrize("columnar", [False, True])
+def test_sort_and_paginate_matches_sort_then_paginate(order_bys, max_results, columnar):
+    metric_values = [float("nan"), None, float("inf"), float("-inf"), 0.0, 1.0, 1.0, -2.5]
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid=str(i),
+                run_id=str(i),
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(RunStatus.FINISHED),
+                start_time=i % 3,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(
+                metrics=[Metric("x", x, 1, 0)] if x is not None else [],
+                params=[Param("p", str(i % 2))] if i % 4 else [],
+            ),
+        )
+        for i, x in enumerate(metric_values)
+    ]
+
+    sorted_runs = SearchUtils.sort(runs, order_bys)
+    page_token = None
+    pages = []
+    while True:
+        expected_page, expected_token = SearchUtils.paginate(sorted_runs, page_token, max_results)
+        page, next_page_token = SearchUtils.sort_and_paginate(
+            runs, order_bys, page_token, max_results, columnar=columnar
+        )
+        assert [r.info.run_id for r in page] == [r.info.run_id for r in expected_page]
+        assert next_page_token == expected_token
+        pages.extend(page)
+        page_token = next_page_token
+        if page_token is None:
+            break
+    assert [r.info.run_id for r in pages] == [r.info.run_id for r in sorted_runs]
+
+
+def test_sort_orders_missing_and_nan_values_last():
+    metric_values = [None, 1.0, float("nan"), None, float("-inf"), float("nan")]
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid=str(i),
+                run_id=str(i),
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(RunStatus.FINISHED),
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+            ),
+            run_data=RunData(metrics=[Metric("x", x, 1, 0)] if x is not None else []),
+        )
+        for i, x in enumerate(metric_values)
+    ]
+    sorted_runs_asc, _ = SearchUtils.sort_and_paginate(runs, ["metrics.x asc"], None, 10)
+    sorted_runs_desc, _ = SearchUtils.sort_and_paginate(runs, ["metrics.x desc"], None, 10)
+    # Missing values and NaNs are ordered last, by run id
+    assert [r.info.run_id for r in sorted_runs_asc] == ["4", "1", "0", "2", "3", "5"]
+    assert [r.info.run_id for r in sorted_runs_desc] == ["1", "4", "0", "2", "3", "5"]
+
+
+@pytest.mark.parametrize(
+    "filter_string",
+    [
+        "metrics.x > 0",
+        "metrics.x != 1",
+        "metrics.x <= 1 and params.p = '1a'",
+        "params.p != '0'",
+        "params.p LIKE '1%'",
+        "params.p ILIKE '%A%'",
+        "tags.t = 'B'",
+        "tags.t ILIKE 'b'",
+        "attributes.status = 'FINISHED' and tags.t LIKE '_'",
+        "attributes.artifact_uri LIKE 's3://%'",
+    ],
+)
+def test_filter_indices_columnar_matches_filter(filter_string):
+    metric_values = [float("nan"), None, float("inf"), float("-inf"), 0.0, 1.0, 1.0, -2.5]
+    runs = [
+        Run(
+            run_info=RunInfo(
+                run_uuid=str(i),
+                run_id=str(i),
+                experiment_id=0,
+                user_id="user-id",
+                status=RunStatus.to_string(RunStatus.FINISHED if i % 3 else RunStatus.FAILED),
+                start_time=0,
+                end_time=1,
+                lifecycle_stage=LifecycleStage.ACTIVE,
+                artifact_uri="s3://bucket/" if i % 2 else "/tmp/",
+            ),
+            run_data=RunData(
+                metrics=[Metric("x", x, 1, 0)] if x is not None else [],
+                params=[Param("p", str(i % 2) + "a")] if i % 4 else [],
+                tags=[RunTag("t", "b" if i % 3 else "B")] if i != 5 else [],
+            ),
+        )
+        for i, x in enumerate(metric_values)
+    ]
+    parsed_filters = SearchUtils.parse_search_filter(filter_string)
+    expected_runs = SearchUtils.filter_parsed(runs, parsed_filters)
+    indices = SearchUtils.filter_indices_columnar(runs, parsed_filters)
+    assert [runs[i] for i in indices] == expected_runs
+    assert SearchUtils.filter_parsed(runs, parsed_filters, columnar=True) == expected_runs
+
+
 @pytest.mark.parametrize(
     "page_token, error_message",
     [
@@ -558,3 +734,32 @@ def test_invalid_page_tokens(page_token, error_message):
     with pytest.raises(MlflowException) as e:
         SearchUtils.paginate([], page_token, 1)
     assert error_message in e.value.message
+
+
+@pytest.mark.parametrize(
+    "offset, sort_key", [(1, None), (100, [0, "abc", None, 1.5]), (3, [1, -1.7976931348623157e308])]
+)
+def test_page_token_with_sort_key_round_trip(offset, sort_key):
+    page_token = SearchUtils.create_page_token(offset, sort_key)
+    assert SearchUtils.parse_start_offset_from_page_token(page_token) == offset
+    assert SearchUtils.parse_sort_key_from_page_token(page_token) == sort_key
+
+
+def test_parse_sort_key_from_offset_only_page_token():
+    assert SearchUtils.parse_sort_key_from_page_token(None) is None
+    page_token = base64.b64encode(json.dumps({"offset": 5}).encode("utf-8"))
+    assert SearchUtils.parse_sort_key_from_page_token(page_token) is None
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        base64.b64encode(json.dumps({"offset": 1, "sort_key": "abc"}).encode("utf-8")),
+        base64.b64encode(json.dumps([1, 2]).encode("utf-8")),
+        "not base64",
+    ],
+)
+def test_invalid_sort_key_page_tokens(page_token):
+    with pytest.raises(MlflowException) as e:
+        SearchUtils.parse_sort_key_from_page_token(page_token)
+    assert "Invalid page token" in e.value.message